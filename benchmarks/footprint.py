@@ -0,0 +1,138 @@
+"""Benchmark of import time and memory footprint of HijriDate.
+
+Usage::
+
+    uv run python benchmarks/footprint.py                   # print measurements
+    uv run python benchmarks/footprint.py -r 20             # more import time runs
+    uv run python benchmarks/footprint.py -o results.json   # save results as JSON
+
+Import time and memory are measured in fresh interpreter processes, so they
+include the standard library modules imported by ``import hijridate``. Import
+time is the best cumulative time reported by ``python -X importtime``.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tracemalloc
+
+from typing import Any
+
+IMPORT_MEMORY_SCRIPT = """
+import sys, tracemalloc
+before = set(sys.modules)
+tracemalloc.start()
+import hijridate
+print(tracemalloc.get_traced_memory()[0], len(set(sys.modules) - before))
+"""
+
+
+def import_time(repeat: int) -> dict[str, int]:
+    """Return the best cumulative import time of each module in microseconds."""
+    best: dict[str, int] = {}
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import hijridate"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in process.stderr.splitlines()[1:]:
+            _, cumulative, name = line.split("|")
+            name = name.strip()
+            best[name] = min(best.get(name, sys.maxsize), int(cumulative))
+    return best
+
+
+def import_memory() -> tuple[int, int]:
+    """Return bytes allocated and number of modules imported by ``import hijridate``."""
+    process = subprocess.run(
+        [sys.executable, "-c", IMPORT_MEMORY_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    size, modules = process.stdout.split()
+    return int(size), int(modules)
+
+
+def table_sizes() -> dict[str, int]:
+    """Return bytes of the Umm al-Qura tables, including their integer objects."""
+    from hijridate import metadata, ummalqura
+
+    tables = {
+        "ummalqura.MONTH_STARTS": ummalqura.MONTH_STARTS,
+        "metadata._MONTH_LENGTHS": metadata._MONTH_LENGTHS,
+        "metadata._YEAR_LENGTHS": metadata._YEAR_LENGTHS,
+    }
+    sizes = {}
+    for name, table in tables.items():
+        size = sys.getsizeof(table)
+        if isinstance(table, tuple):
+            # small integers (-5 to 256) are cached and shared by all tables
+            size += sum(sys.getsizeof(i) for i in table if not -5 <= i <= 256)  # noqa: PLR2004
+        sizes[name] = size
+    return sizes
+
+
+def instance_sizes(count: int = 10_000) -> dict[str, float]:
+    """Return bytes per Hijri and Gregorian object created by conversion."""
+    from hijridate import Gregorian, ummalqura
+
+    min_ordinal = ummalqura.ORDINAL_RANGE[0]
+    ordinals = range(min_ordinal, min_ordinal + count)
+    sizes = {}
+    for name, create in [
+        ("Hijri", lambda o: Gregorian.fromordinal(o).to_hijri()),
+        ("Gregorian", Gregorian.fromordinal),
+    ]:
+        tracemalloc.start()
+        objects = [create(o) for o in ordinals]
+        size = tracemalloc.get_traced_memory()[0] - sys.getsizeof(objects)
+        tracemalloc.stop()
+        sizes[name] = size / count
+    return sizes
+
+
+def main() -> int:
+    """Run benchmark and return exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=10, help="number of import time runs"
+    )
+    parser.add_argument("-o", "--output", help="path to save results as JSON")
+    args = parser.parse_args()
+
+    times = import_time(args.repeat)
+    memory, modules = import_memory()
+    results: dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "import_time_us": times["hijridate"],
+        "import_memory_bytes": memory,
+        "imported_modules": modules,
+        "module_import_time_us": {
+            name: time for name, time in times.items() if name.startswith("hijridate.")
+        },
+        "table_bytes": table_sizes(),
+        "instance_bytes": instance_sizes(),
+    }
+
+    print(f"{'import hijridate':<36} {results['import_time_us']:>10} us")
+    for name, time in results["module_import_time_us"].items():
+        print(f"  {name:<34} {time:>10} us")
+    print(f"{'import memory':<36} {memory:>10} bytes")
+    print(f"{'imported modules':<36} {modules:>10}")
+    for name, size in results["table_bytes"].items():
+        print(f"{name:<36} {size:>10} bytes")
+    for name, size in results["instance_bytes"].items():
+        print(f"{name + ' object':<36} {size:>10.1f} bytes")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
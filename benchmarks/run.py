@@ -0,0 +1,159 @@
+"""Benchmark suite of HijriDate hot paths.
+
+Usage::
+
+    uv run python benchmarks/run.py                         # run all benchmarks
+    uv run python benchmarks/run.py -k to_hijri             # run matching benchmarks
+    uv run python benchmarks/run.py -o results.json         # save results as JSON
+    uv run python benchmarks/run.py -c baseline.json        # compare with saved results
+
+When comparing, the script exits with status 1 if any benchmark is slower than
+the saved results by more than the threshold (``--threshold``, 10% by default).
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+from collections.abc import Callable
+from importlib import metadata
+from typing import Any
+
+from hijridate import Gregorian, Hijri, locales, lookup
+
+Benchmark = tuple[str, Callable[[], object]]
+
+
+def core_benchmarks() -> list[Benchmark]:
+    """Return benchmarks of conversion, validation, comparison, and formatting."""
+    gregorian = Gregorian(1982, 12, 2)
+    hijri = Hijri(1403, 2, 17)
+    other = Hijri(1403, 2, 18)
+    ordinal = gregorian.toordinal()
+    dates = [Hijri(y, m, 1) for y in range(1500, 1342, -1) for m in range(12, 0, -1)]
+
+    return [
+        ("gregorian.to_hijri", gregorian.to_hijri),
+        ("hijri.to_gregorian", hijri.to_gregorian),
+        ("hijri.fromordinal", lambda: Hijri.fromordinal(ordinal)),
+        ("hijri.init[validate]", lambda: Hijri(1403, 2, 17)),
+        ("hijri.init[no-validate]", lambda: Hijri(1403, 2, 17, validate=False)),
+        ("hijri.month_length", hijri.month_length),
+        ("hijri.year_length", hijri.year_length),
+        ("hijri.weekday", hijri.weekday),
+        ("hijri.compare", lambda: hijri < other),
+        ("hijri.sort[1896]", lambda: sorted(dates)),
+        ("hijri.isoformat", hijri.isoformat),
+        ("hijri.dmyformat", hijri.dmyformat),
+        ("hijri.strftime", lambda: hijri.strftime("%A %d %B %Y %E")),
+        ("gregorian.to_hijri[lookup]", gregorian.to_hijri),
+    ]
+
+
+def locale_benchmarks() -> list[Benchmark]:
+    """Return benchmarks of localized month and day names for each locale."""
+    hijri = Hijri(1403, 2, 17)
+    benchmarks: list[Benchmark] = []
+    for tag in locales._locale_map:
+        benchmarks += [
+            (f"hijri.month_name[{tag}]", lambda tag=tag: hijri.month_name(tag)),
+            (f"hijri.day_name[{tag}]", lambda tag=tag: hijri.day_name(tag)),
+        ]
+    return benchmarks
+
+
+def batch_benchmarks() -> list[Benchmark]:
+    """Return benchmarks of batch conversion, if NumPy is installed."""
+    try:
+        import numpy as np
+
+        from hijridate import batch
+    except ImportError:
+        return []
+    dates = np.arange("1924-08-01", "2077-11-17", dtype="datetime64[D]")
+    year, month, day = batch.gregorian_to_hijri(dates)
+    return [
+        ("batch.gregorian_to_hijri[55991]", lambda: batch.gregorian_to_hijri(dates)),
+        (
+            "batch.hijri_to_gregorian[55991]",
+            lambda: batch.hijri_to_gregorian(year, month, day),
+        ),
+    ]
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict[str, Any]:
+    """Return the best time per call of a function in nanoseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return {"ns_per_op": best / number * 1e9, "loops": number, "repeat": repeat}
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Print comparison with baseline results and return names of regressions."""
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        before = baseline["benchmarks"][name]["ns_per_op"]
+        ratio = result["ns_per_op"] / before
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        after = result["ns_per_op"]
+        print(f"{name:<36} {before:>12.1f} -> {after:>12.1f} ns  {ratio:5.2f}x{flag}")
+    return regressions
+
+
+def main() -> int:
+    """Run benchmarks and return exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-k", "--filter", default="", help="run matching benchmarks only"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="number of timing runs"
+    )
+    parser.add_argument("-o", "--output", help="path to save results as JSON")
+    parser.add_argument("-c", "--compare", help="path to baseline results JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed slowdown ratio"
+    )
+    args = parser.parse_args()
+
+    benchmarks = core_benchmarks() + locale_benchmarks() + batch_benchmarks()
+    results: dict[str, Any] = {
+        "hijridate": metadata.version("hijridate"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "benchmarks": {},
+    }
+    for name, func in benchmarks:
+        if args.filter not in name:
+            continue
+        if name.endswith("[lookup]"):
+            lookup.enable()
+        results["benchmarks"][name] = measure(func, args.repeat)
+        lookup.disable()
+        print(f"{name:<36} {results['benchmarks'][name]['ns_per_op']:>12.1f} ns")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        print()
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
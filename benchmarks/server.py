@@ -0,0 +1,96 @@
+"""Benchmark of conversion server throughput with concurrent clients.
+
+Usage::
+
+    uv run python benchmarks/server.py                    # 1, 10, 100 clients
+    uv run python benchmarks/server.py -c 50 -w 0 1 5     # given clients and windows
+    uv run python benchmarks/server.py -n 500 --dates 10  # more requests, batches
+
+Each client sends requests one after another over its own keep-alive
+connection to a server running in the same process, so the results include
+the client overhead. The mean batch size shows how many dates of concurrent
+requests are converted together in each pass.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from hijridate.server import ConversionServer
+
+
+async def client(port: int, requests: int, dates: int) -> None:
+    """Send conversion requests of ``dates`` dates over one connection."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps({"dates": ["1982-12-02"] * dates}).encode()
+    data = (
+        f"POST /convert HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    for _ in range(requests):
+        writer.write(data)
+        length = 0
+        while (line := await reader.readline()).strip():
+            name, _, value = line.partition(b":")
+            if name.lower() == b"content-length":
+                length = int(value)
+        await reader.readexactly(length)
+    writer.close()
+
+
+async def run(clients: int, window: float, requests: int, dates: int) -> dict:
+    """Return server statistics after clients send their requests."""
+    server = ConversionServer(port=0, window=window / 1000)
+    await server.start()
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(client(server.port, requests, dates) for _ in range(clients))
+    )
+    elapsed = time.perf_counter() - start
+    stats = server.stats()
+    await server.close()
+    return {
+        "requests_per_second": stats.requests / elapsed,
+        "dates_per_second": stats.dates / elapsed,
+        "mean_batch_size": stats.mean_batch_size,
+        "mean_latency_ms": stats.mean_latency_ms,
+    }
+
+
+def main() -> int:
+    """Run benchmark and return exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-c", "--clients", type=int, nargs="+", default=[1, 10, 100], help="clients"
+    )
+    parser.add_argument(
+        "-w",
+        "--window",
+        type=float,
+        nargs="+",
+        default=[0, 2],
+        help="coalescing windows in milliseconds",
+    )
+    parser.add_argument(
+        "-n", "--requests", type=int, default=200, help="requests per client"
+    )
+    parser.add_argument("--dates", type=int, default=1, help="dates per request")
+    args = parser.parse_args()
+
+    print(f"python {sys.version.split()[0]}, {args.dates} dates per request")
+    for window in args.window:
+        for clients in args.clients:
+            result = asyncio.run(run(clients, window, args.requests, args.dates))
+            print(
+                f"window {window:>4g} ms {clients:>4} clients"
+                f" {result['requests_per_second']:>10,.0f} requests/s"
+                f" {result['dates_per_second']:>10,.0f} dates/s"
+                f"  batch {result['mean_batch_size']:>6.1f}"
+                f"  latency {result['mean_latency_ms']:>6.2f} ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
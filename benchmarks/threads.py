@@ -0,0 +1,108 @@
+"""Benchmark of conversion throughput scaling with the number of threads.
+
+Usage::
+
+    uv run python benchmarks/threads.py                     # 1, 2, 4, ... CPUs threads
+    uv run python benchmarks/threads.py -t 1 2 4 8          # given thread counts
+    uv run python benchmarks/threads.py -n 200000 --lookup  # more work, lookup table
+
+Each thread converts the same number of dates, so on free-threaded Python
+builds (e.g. ``python3.14t``) the total throughput grows with the number of
+threads up to the number of CPUs, while on builds with the GIL it stays flat.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+from collections.abc import Callable
+
+from hijridate import Gregorian, Hijri, lookup, ummalqura
+
+
+def to_hijri_worker(count: int) -> None:
+    """Convert ``count`` Gregorian dates to Hijri."""
+    min_ordinal, max_ordinal = ummalqura.ORDINAL_RANGE
+    span = max_ordinal - min_ordinal + 1
+    dates = [Gregorian.fromordinal(min_ordinal + i * 53 % span) for i in range(1000)]
+    for i in range(count):
+        dates[i % 1000].to_hijri()
+
+
+def to_gregorian_worker(count: int) -> None:
+    """Convert ``count`` Hijri dates to Gregorian."""
+    dates = [Hijri(1343 + i % 158, i % 12 + 1, i % 28 + 1) for i in range(1000)]
+    for i in range(count):
+        dates[i % 1000].to_gregorian()
+
+
+def run(worker: Callable[[int], None], threads: int, count: int) -> float:
+    """Return the throughput in conversions per second of threads running a worker."""
+    barrier = threading.Barrier(threads + 1)
+
+    def target() -> None:
+        barrier.wait()
+        worker(count)
+
+    pool = [threading.Thread(target=target) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return threads * count / (time.perf_counter() - start)
+
+
+def gil_status() -> str:
+    """Return whether the GIL is enabled in the running interpreter."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None:
+        return "enabled (not a free-threaded build)"
+    return "enabled" if is_gil_enabled() else "disabled"
+
+
+def main() -> int:
+    """Run benchmark and return exit status."""
+    cpus = os.cpu_count() or 1
+    default_threads = sorted({1, *(2**i for i in range(cpus.bit_length())), cpus})
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        nargs="+",
+        default=default_threads,
+        help="thread counts",
+    )
+    parser.add_argument(
+        "-n", "--count", type=int, default=50_000, help="conversions per thread"
+    )
+    parser.add_argument(
+        "--lookup", action="store_true", help="enable the lookup table engine"
+    )
+    args = parser.parse_args()
+
+    if args.lookup:
+        lookup.enable()
+    print(f"python {sys.version.split()[0]}, GIL {gil_status()}, {cpus} CPUs")
+    workers = {
+        "gregorian.to_hijri": to_hijri_worker,
+        "hijri.to_gregorian": to_gregorian_worker,
+    }
+    for name, worker in workers.items():
+        single = None
+        for threads in args.threads:
+            throughput = run(worker, threads, args.count)
+            single = single or throughput
+            print(
+                f"{name:<20} {threads:>3} threads {throughput:>14,.0f} ops/s"
+                f"  {throughput / single:5.2f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""Entry point for running the command-line interface with ``python -m``."""
+
+import sys
+
+from hijridate.cli import main
+
+sys.exit(main())
@@ -0,0 +1,168 @@
+"""Conversion of Apache Arrow date arrays between Hijri and Gregorian calendars.
+
+Input arrays are read directly from their Arrow buffers without copying or
+creating Python date objects, and each output column is allocated once.
+Null values, and values that are out of supported range or not valid, result
+in null values instead of raising an exception.
+
+This module requires the optional PyArrow dependency, which can be installed
+with ``pip install hijridate[arrow]``.
+"""
+
+import itertools
+
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from hijridate import batch, ummalqura
+
+try:
+    import numpy as np
+    import pyarrow as pa
+except ImportError as error:  # pragma: no cover
+    message = "arrow conversion requires pyarrow, install 'hijridate[arrow]'"
+    raise ImportError(message) from error
+
+HIJRI_TYPE = pa.struct(
+    [("year", pa.int16()), ("month", pa.int16()), ("day", pa.int16())]
+)
+"""Arrow struct type of Hijri dates returned by :func:`gregorian_to_hijri`."""
+
+
+def gregorian_to_hijri(dates: Any) -> Any:
+    """Convert an Arrow array of Gregorian dates to an array of Hijri dates.
+
+    Args:
+        dates: Arrow ``date32`` array or chunked array.
+
+    Returns:
+        Arrow struct array (or chunked array) of Hijri ``year``, ``month``,
+        and ``day`` as :data:`HIJRI_TYPE`, where null and out of range dates
+        are null.
+
+    Raises:
+        TypeError: When the array type is not ``date32``.
+    """
+    if isinstance(dates, pa.ChunkedArray):
+        chunks = [gregorian_to_hijri(c) for c in dates.chunks]
+        return pa.chunked_array(chunks, type=HIJRI_TYPE)
+    if not pa.types.is_date32(dates.type):
+        message = f"expected date32 array, got '{dates.type}'"
+        raise TypeError(message)
+
+    rjd = _values(dates, np.int32) + (batch._RJD_OFFSET + batch._EPOCH_ORDINAL)
+    min_rjd, max_rjd = ummalqura.RJD_RANGE
+    valid = _validity(dates)
+    valid &= (rjd >= min_rjd) & (rjd <= max_rjd)
+    rjd = np.where(valid, rjd, min_rjd)
+    columns = [c.astype(np.int16) for c in batch._rjd_to_hijri(rjd)]
+
+    length, bitmap = len(dates), _bitmap(valid)
+    children = [
+        pa.Array.from_buffers(pa.int16(), length, [bitmap, pa.py_buffer(c)])
+        for c in columns
+    ]
+    return pa.Array.from_buffers(HIJRI_TYPE, length, [bitmap], children=children)
+
+
+def hijri_to_gregorian(*columns: Any) -> Any:
+    """Convert Arrow arrays of Hijri dates to an array of Gregorian dates.
+
+    Args:
+        *columns: Either a single Arrow struct array with integer ``year``,
+            ``month``, and ``day`` fields (e.g. as returned by
+            :func:`gregorian_to_hijri`), or three Arrow integer arrays of
+            Hijri year, month, and day. Chunked arrays are supported.
+
+    Returns:
+        Arrow ``date32`` array (or chunked array), where null, out of range,
+        and invalid Hijri dates are null.
+
+    Raises:
+        TypeError: When the number or types of arrays are not supported.
+    """
+    if len(columns) == 1:
+        struct = columns[0]
+        if isinstance(struct, pa.ChunkedArray):
+            chunks = [hijri_to_gregorian(c) for c in struct.chunks]
+            return pa.chunked_array(chunks, type=pa.date32())
+        if not pa.types.is_struct(struct.type):
+            message = f"expected struct array, got '{struct.type}'"
+            raise TypeError(message)
+        names = ("year", "month", "day")
+        if any(struct.type.get_field_index(n) < 0 for n in names):
+            message = f"expected struct array with fields {names}, got '{struct.type}'"
+            raise TypeError(message)
+        year, month, day = (struct.field(n) for n in names)
+        valid = _validity(struct)
+    elif len(columns) == 3:  # noqa: PLR2004
+        year, month, day = columns
+        if any(isinstance(c, pa.ChunkedArray) for c in columns):
+            chunks = [hijri_to_gregorian(*c) for c in _aligned_chunks(columns)]
+            return pa.chunked_array(chunks, type=pa.date32())
+        valid = np.ones(len(year), dtype=bool)
+    else:
+        message = f"expected 1 or 3 arrays, got {len(columns)}"
+        raise TypeError(message)
+
+    for column in (year, month, day):
+        if not pa.types.is_integer(column.type):
+            message = f"expected integer array, got '{column.type}'"
+            raise TypeError(message)
+        valid &= _validity(column)
+    values = [
+        _values(c, c.type.to_pandas_dtype()).astype(np.int64)
+        for c in (year, month, day)
+    ]
+    rjd, valid_dates = batch._hijri_to_rjd(*values)
+    valid &= valid_dates
+    days = rjd - (batch._RJD_OFFSET + batch._EPOCH_ORDINAL)
+    days = np.where(valid, days, 0).astype(np.int32)
+
+    buffers = [_bitmap(valid), pa.py_buffer(days)]
+    return pa.Array.from_buffers(pa.date32(), len(days), buffers)
+
+
+def _aligned_chunks(columns: Sequence[Any]) -> Iterator[list[Any]]:
+    """Yield chunks of arrays and chunked arrays sliced at the same boundaries.
+
+    Each column is sliced at the chunk boundaries of all columns, so slices
+    are zero-copy views of a single chunk.
+
+    Raises:
+        ValueError: When the arrays do not have the same length.
+    """
+    if len({len(c) for c in columns}) > 1:
+        message = f"arrays must have the same length, got {[len(c) for c in columns]}"
+        raise ValueError(message)
+    chunked = [
+        c if isinstance(c, pa.ChunkedArray) else pa.chunked_array([c]) for c in columns
+    ]
+    boundaries = {0, len(chunked[0])}
+    for column in chunked:
+        boundaries.update(itertools.accumulate(len(c) for c in column.chunks))
+    for start, end in itertools.pairwise(sorted(boundaries)):
+        slices = [column.slice(start, end - start).chunks for column in chunked]
+        yield [c[0] if len(c) == 1 else pa.concat_arrays(c) for c in slices]
+
+
+def _values(array: Any, dtype: Any) -> Any:
+    """Return a zero-copy NumPy view of the values buffer of an Arrow array."""
+    values = np.frombuffer(array.buffers()[1], dtype=dtype)
+    return values[array.offset : array.offset + len(array)]
+
+
+def _validity(array: Any) -> Any:
+    """Return a boolean NumPy array of non-null values of an Arrow array."""
+    bitmap = array.buffers()[0]
+    if bitmap is None:
+        return np.ones(len(array), dtype=bool)
+    bits = np.unpackbits(np.frombuffer(bitmap, dtype=np.uint8), bitorder="little")
+    return bits[array.offset : array.offset + len(array)].astype(bool)
+
+
+def _bitmap(valid: Any) -> Any:
+    """Return an Arrow validity bitmap buffer, or None if all values are valid."""
+    if valid.all():
+        return None
+    return pa.py_buffer(np.packbits(valid, bitorder="little"))
@@ -0,0 +1,234 @@
+"""Batch conversion of Hijri and Gregorian dates using NumPy arrays.
+
+This module requires the optional NumPy dependency, which can be installed
+with ``pip install hijridate[numpy]``.
+"""
+
+from typing import Literal, NamedTuple, get_args
+
+from hijridate import helpers, ummalqura
+from hijridate.convert import Hijri
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as error:  # pragma: no cover
+    message = "batch conversion requires numpy, install 'hijridate[numpy]'"
+    raise ImportError(message) from error
+
+IntArray = npt.NDArray[np.int64]
+BoolArray = npt.NDArray[np.bool_]
+DateArray = npt.NDArray[np.datetime64]
+Errors = Literal["raise", "coerce"]
+
+_MONTH_STARTS: IntArray = np.array(ummalqura.MONTH_STARTS, dtype=np.int64)
+_MONTH_LENGTHS: IntArray = np.diff(_MONTH_STARTS)
+_EPOCH_ORDINAL = 719163
+"""Gregorian date ordinal of the ``datetime64`` epoch (1970-01-01)."""
+_RJD_OFFSET = helpers.jdn_to_rjd(helpers.ordinal_to_jdn(0))
+"""Difference between Reduced Julian Day numbers and Gregorian date ordinals."""
+
+
+class HijriArrays(NamedTuple):
+    """Hijri year, month and day arrays returned by batch conversion."""
+
+    year: IntArray
+    month: IntArray
+    day: IntArray
+
+
+def gregorian_to_hijri(*columns: npt.ArrayLike) -> HijriArrays:
+    """Convert an array of Gregorian dates to Hijri year, month and day arrays.
+
+    Args:
+        *columns: Either a single array of Gregorian date ordinals or
+            ``datetime64`` values, or three arrays of Gregorian year, month,
+            and day.
+
+    Raises:
+        OverflowError: When any date is out of supported Gregorian range.
+        ValueError: When any Gregorian month or day is not valid.
+    """
+    if len(columns) == 1:
+        ordinals = _to_ordinals(columns[0])
+    elif len(columns) == 3:  # noqa: PLR2004
+        ordinals = _columns_to_ordinals(*columns)
+    else:
+        message = f"expected 1 or 3 arrays, got {len(columns)}"
+        raise TypeError(message)
+
+    _check_range(ordinals)
+    return _rjd_to_hijri(ordinals + _RJD_OFFSET)
+
+
+def hijri_to_gregorian(
+    year: npt.ArrayLike,
+    month: npt.ArrayLike,
+    day: npt.ArrayLike,
+    *,
+    errors: Errors = "raise",
+) -> DateArray:
+    """Convert Hijri year, month and day arrays to Gregorian ``datetime64[D]``.
+
+    Args:
+        year: Hijri years.
+        month: Hijri months.
+        day: Hijri days.
+        errors: Whether to ``"raise"`` for the first invalid Hijri date, or
+            ``"coerce"`` invalid Hijri dates to ``NaT``.
+
+    Raises:
+        OverflowError: When any year is out of supported Hijri range.
+        ValueError: When ``errors`` is not supported, or when any month or
+            day is not valid for its Hijri year or month.
+    """
+    if errors not in get_args(Errors):
+        message = f"errors must be one of {get_args(Errors)}, got '{errors}'"
+        raise ValueError(message)
+    columns = _hijri_columns(year, month, day)
+    rjd, valid = _hijri_to_rjd(*columns)
+    if errors == "raise":
+        _check_valid(*columns, valid)
+    days = rjd - _RJD_OFFSET - _EPOCH_ORDINAL
+    if errors == "coerce":
+        days = np.where(valid, days, np.iinfo(np.int64).min)
+    return days.astype("datetime64[D]")
+
+
+def hijri_to_ordinal(
+    year: npt.ArrayLike, month: npt.ArrayLike, day: npt.ArrayLike
+) -> IntArray:
+    """Convert Hijri year, month and day arrays to Gregorian date ordinals.
+
+    Args:
+        year: Hijri years.
+        month: Hijri months.
+        day: Hijri days.
+
+    Raises:
+        OverflowError: When any year is out of supported Hijri range.
+        ValueError: When any month or day is not valid for its Hijri year
+            or month.
+    """
+    columns = _hijri_columns(year, month, day)
+    rjd, valid = _hijri_to_rjd(*columns)
+    _check_valid(*columns, valid)
+    return rjd - _RJD_OFFSET
+
+
+def is_valid_hijri(
+    year: npt.ArrayLike, month: npt.ArrayLike, day: npt.ArrayLike
+) -> BoolArray:
+    """Return a mask of Hijri dates that are valid and within supported range.
+
+    Args:
+        year: Hijri years.
+        month: Hijri months.
+        day: Hijri days.
+    """
+    return _hijri_to_rjd(*_hijri_columns(year, month, day))[1]
+
+
+def _hijri_columns(
+    year: npt.ArrayLike, month: npt.ArrayLike, day: npt.ArrayLike
+) -> tuple[IntArray, IntArray, IntArray]:
+    """Return Hijri year, month, and day as broadcast integer arrays."""
+    columns = (np.asarray(c, dtype=np.int64) for c in (year, month, day))
+    years, months, days = np.broadcast_arrays(*columns)
+    return years, months, days
+
+
+def _rjd_to_hijri(rjd: IntArray) -> HijriArrays:
+    """Return Hijri year, month, and day arrays of Reduced Julian Day numbers.
+
+    All Reduced Julian Day numbers must be within valid range.
+    """
+    index = np.searchsorted(_MONTH_STARTS, rjd, side="right") - 1
+    months = index + ummalqura.HIJRI_OFFSET
+    year = months // 12 + 1
+    month = months % 12 + 1
+    day = rjd - _MONTH_STARTS[index] + 1
+    return HijriArrays(year, month, day)
+
+
+def _hijri_to_rjd(
+    years: IntArray, months: IntArray, days: IntArray
+) -> tuple[IntArray, BoolArray]:
+    """Return Reduced Julian Day numbers and validity mask of Hijri dates.
+
+    The Reduced Julian Day numbers of invalid dates are meaningless.
+    """
+    min_year, max_year = (d[0] for d in ummalqura.HIJRI_RANGE)
+    max_months = 12
+    valid = (years >= min_year) & (years <= max_year)
+    valid &= (months >= 1) & (months <= max_months)
+    index = (years - 1) * 12 + months - 1 - ummalqura.HIJRI_OFFSET
+    index = np.where(valid, index, 0)
+    valid &= (days >= 1) & (days <= _MONTH_LENGTHS[index])
+    rjd = _MONTH_STARTS[index] + days - 1
+    return rjd, valid
+
+
+def _check_valid(
+    years: IntArray, months: IntArray, days: IntArray, valid: BoolArray
+) -> None:
+    """Raise the same exception as :obj:`Hijri` for the first invalid date."""
+    if not valid.all():
+        row = np.flatnonzero(~valid)[0]
+        Hijri(int(years[row]), int(months[row]), int(days[row]))
+
+
+def _to_ordinals(dates: npt.ArrayLike) -> IntArray:
+    """Return Gregorian date ordinals from an array of ordinals or dates."""
+    values = np.asarray(dates)
+    if values.dtype.kind == "M":
+        days = values.astype("datetime64[D]").astype(np.int64)
+        return days + _EPOCH_ORDINAL
+    if values.dtype.kind in "iu":
+        return values.astype(np.int64)
+    message = f"unsupported array type: {values.dtype}"
+    raise TypeError(message)
+
+
+def _columns_to_ordinals(
+    year: npt.ArrayLike, month: npt.ArrayLike, day: npt.ArrayLike
+) -> IntArray:
+    """Return Gregorian date ordinals from year, month, and day arrays."""
+    years, months, days = (np.asarray(c, dtype=np.int64) for c in (year, month, day))
+    max_months = 12
+    invalid = (months < 1) | (months > max_months)
+    if invalid.any():
+        value = months[invalid][0]
+        message = f"month must be in 1-{max_months}, got '{value}'"
+        raise ValueError(message)
+    elapsed_months = (years - 1970) * 12 + months - 1
+    first_days = _months_to_days(elapsed_months)
+    next_days = _months_to_days(elapsed_months + 1)
+    invalid = (days < 1) | (days > next_days - first_days)
+    if invalid.any():
+        value = days[invalid][0]
+        message = f"day is out of range for month, got '{value}'"
+        raise ValueError(message)
+    return first_days + days - 1 + _EPOCH_ORDINAL
+
+
+def _months_to_days(elapsed_months: IntArray) -> IntArray:
+    """Return days since the ``datetime64`` epoch for months since the epoch."""
+    days = elapsed_months.astype("datetime64[M]").astype("datetime64[D]")
+    return days.astype(np.int64)
+
+
+def _check_range(ordinals: IntArray) -> None:
+    """Check if all Gregorian date ordinals are within valid range."""
+    min_ordinal, max_ordinal = ummalqura.ORDINAL_RANGE
+    invalid = (ordinals < min_ordinal) | (ordinals > max_ordinal)
+    if invalid.any():
+        min_date, max_date = ummalqura.GREGORIAN_RANGE
+        min_date_iso = "-".join([f"{i:02}" for i in min_date])
+        max_date_iso = "-".join([f"{i:02}" for i in max_date])
+        value = ordinals[invalid][0] - _EPOCH_ORDINAL
+        value_iso = np.datetime64(int(value), "D")
+        message = (
+            f"date must be in '{min_date_iso}'-'{max_date_iso}', got '{value_iso}'"
+        )
+        raise OverflowError(message)
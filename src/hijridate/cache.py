@@ -0,0 +1,137 @@
+"""Bounded cache for Hijri-Gregorian conversion results.
+
+Applications that convert the same dates repeatedly (e.g. today's date, month
+boundaries, or report periods) can enable a least-recently-used (LRU) cache
+for :meth:`hijridate.convert.Gregorian.to_hijri` and
+:meth:`hijridate.convert.Hijri.to_gregorian` results. The cache is safe to use
+from multiple threads, including on free-threaded Python builds.
+"""
+
+import threading
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import NamedTuple
+
+from hijridate import convert
+
+active_cache: "ConversionCache | None" = None
+"""The cache when enabled for conversion, otherwise ``None`` (read-only)."""
+
+_lock = threading.Lock()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a conversion cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ConversionCache:
+    """A thread-safe LRU cache of conversion results with statistics.
+
+    Args:
+        maxsize: Maximum number of results to keep before evicting the least
+            recently used ones.
+
+    Raises:
+        ValueError: When ``maxsize`` is less than 1.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            message = f"maxsize must be at least 1, got '{maxsize}'"
+            raise ValueError(message)
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> object | None:
+        """Return cached result for a key, or ``None`` if not cached.
+
+        Args:
+            key: Key of the conversion input.
+        """
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        """Store result for a key, evicting the least recently used if full.
+
+        Args:
+            key: Key of the conversion input.
+            value: Conversion result.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all results and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._data),
+            )
+
+
+def enable(maxsize: int = 4096) -> None:
+    """Enable caching of conversion results, replacing any existing cache.
+
+    Args:
+        maxsize: Maximum number of results to keep in cache.
+    """
+    global active_cache  # noqa: PLW0603
+    cache = ConversionCache(maxsize)
+    with _lock:
+        active_cache = convert._active_cache = cache
+
+
+def disable() -> None:
+    """Disable caching of conversion results and discard the cache."""
+    global active_cache  # noqa: PLW0603
+    with _lock:
+        active_cache = convert._active_cache = None
+
+
+def is_enabled() -> bool:
+    """Return whether caching of conversion results is enabled."""
+    return active_cache is not None
+
+
+def clear() -> None:
+    """Remove all cached results and reset statistics, if enabled."""
+    cache = active_cache
+    if cache is not None:
+        cache.clear()
+
+
+def info() -> CacheInfo | None:
+    """Return statistics of the cache if enabled, otherwise return ``None``."""
+    cache = active_cache
+    return None if cache is None else cache.info()
@@ -0,0 +1,148 @@
+"""Month and year calendars of Hijri dates, like the standard calendar module.
+
+Calendars are computed directly from the precomputed month metadata (see
+:mod:`hijridate.metadata`), without constructing or converting a Hijri object
+for each day.
+"""
+
+import datetime
+
+from collections.abc import Iterator
+
+from hijridate import metadata
+
+
+class HijriCalendar:
+    """A calendar of Hijri months, with weeks as rows of seven days.
+
+    Each week is a list of seven days starting at ``firstweekday``, where
+    days outside the month have a Hijri day of 0.
+
+    Args:
+        firstweekday: First day of week, where Monday is 0 and Sunday is 6.
+
+    Raises:
+        ValueError: When ``firstweekday`` is not within the range of `0-6`.
+    """
+
+    __slots__ = ("_firstweekday",)
+
+    def __init__(self, firstweekday: int = 0):
+        self.firstweekday = firstweekday
+
+    @property
+    def firstweekday(self) -> int:
+        """Return first day of week, where Monday is 0 and Sunday is 6."""
+        return self._firstweekday
+
+    @firstweekday.setter
+    def firstweekday(self, firstweekday: int) -> None:
+        max_weekday = 6
+        if not 0 <= firstweekday <= max_weekday:
+            message = f"firstweekday must be in 0-{max_weekday}, got '{firstweekday}'"
+            raise ValueError(message)
+        self._firstweekday = firstweekday
+
+    def iterweekdays(self) -> Iterator[int]:
+        """Return an iterator of weekday numbers for one week, in calendar order."""
+        for offset in range(7):
+            yield (self._firstweekday + offset) % 7
+
+    def monthdayscalendar(self, year: int, month: int) -> list[list[int]]:
+        """Return weeks of a Hijri month as lists of Hijri day numbers.
+
+        Args:
+            year: Hijri year.
+            month: Hijri month.
+
+        Raises:
+            OverflowError: When ``year`` is out of supported Hijri range.
+            ValueError: When ``month`` is not within the range of `1-12`.
+        """
+        days, _ = self._monthdays(year, month)
+        return [days[i : i + 7] for i in range(0, len(days), 7)]
+
+    def monthdays2calendar(self, year: int, month: int) -> list[list[tuple[int, int]]]:
+        """Return weeks of a Hijri month as lists of (Hijri day, weekday) pairs.
+
+        Args:
+            year: Hijri year.
+            month: Hijri month.
+
+        Raises:
+            OverflowError: When ``year`` is out of supported Hijri range.
+            ValueError: When ``month`` is not within the range of `1-12`.
+        """
+        weekdays = list(self.iterweekdays())
+        days, _ = self._monthdays(year, month)
+        return [
+            list(zip(days[i : i + 7], weekdays, strict=True))
+            for i in range(0, len(days), 7)
+        ]
+
+    def monthgregoriancalendar(
+        self, year: int, month: int
+    ) -> list[list[tuple[int, datetime.date]]]:
+        """Return weeks of a Hijri month as lists of (Hijri day, Gregorian date) pairs.
+
+        Days outside the month have a Hijri day of 0, along with their
+        Gregorian date.
+
+        Args:
+            year: Hijri year.
+            month: Hijri month.
+
+        Raises:
+            OverflowError: When ``year`` is out of supported Hijri range.
+            ValueError: When ``month`` is not within the range of `1-12`.
+        """
+        days, first_ordinal = self._monthdays(year, month)
+        ordinals = range(first_ordinal, first_ordinal + len(days))
+        pairs = list(zip(days, map(datetime.date.fromordinal, ordinals), strict=True))
+        return [pairs[i : i + 7] for i in range(0, len(pairs), 7)]
+
+    def yeardayscalendar(
+        self, year: int, width: int = 3
+    ) -> list[list[list[list[int]]]]:
+        """Return months of a Hijri year as rows of ``width`` month calendars.
+
+        Each month calendar is as returned by :meth:`monthdayscalendar`.
+
+        Args:
+            year: Hijri year.
+            width: Number of months per row.
+
+        Raises:
+            OverflowError: When ``year`` is out of supported Hijri range.
+        """
+        months = [self.monthdayscalendar(year, m) for m in range(1, 13)]
+        return [months[i : i + width] for i in range(0, 12, width)]
+
+    def yeargregoriancalendar(
+        self, year: int, width: int = 3
+    ) -> list[list[list[list[tuple[int, datetime.date]]]]]:
+        """Return months of a Hijri year as rows of ``width`` month calendars.
+
+        Each month calendar is as returned by :meth:`monthgregoriancalendar`.
+
+        Args:
+            year: Hijri year.
+            width: Number of months per row.
+
+        Raises:
+            OverflowError: When ``year`` is out of supported Hijri range.
+        """
+        months = [self.monthgregoriancalendar(year, m) for m in range(1, 13)]
+        return [months[i : i + width] for i in range(0, 12, width)]
+
+    def _monthdays(self, year: int, month: int) -> tuple[list[int], int]:
+        """Return Hijri days for complete weeks of month, and the first ordinal.
+
+        Days outside the month have a Hijri day of 0, and the first ordinal is
+        the Gregorian date ordinal of the first day of first week.
+        """
+        info = metadata.month_info(year, month)
+        days_before = (info.start_weekday - self._firstweekday) % 7
+        days_after = -(days_before + info.length) % 7
+        days = [0] * days_before + list(range(1, info.length + 1)) + [0] * days_after
+        return days, info.start_ordinal - days_before
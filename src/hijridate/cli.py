@@ -0,0 +1,258 @@
+"""Command-line interface for converting dates in streams of text lines.
+
+Usage::
+
+    hijridate < dates.txt                           # Gregorian to Hijri
+    hijridate --to gregorian hijri-dates.txt        # Hijri to Gregorian
+    hijridate -t , -c 3 --header events.csv         # third column of CSV file
+    hijridate -j 8 --stats huge.log > out.log       # use 8 worker processes
+
+Dates are read in ISO format ``YYYY-MM-DD`` from files, or standard input when
+no files are given, and written to standard output in the same format. Lines
+are processed in chunks, so memory usage is constant regardless of input size.
+"""
+
+import argparse
+import datetime
+import fileinput
+import functools
+import os
+import sys
+import time
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from importlib import metadata
+from itertools import islice
+from typing import Literal, NamedTuple, get_args
+
+from hijridate import helpers, parallel, parsing, ummalqura
+from hijridate.convert import Gregorian
+
+Calendar = Literal["hijri", "gregorian"]
+Errors = Literal["raise", "coerce"]
+
+_RJD_OFFSET = helpers.jdn_to_rjd(helpers.ordinal_to_jdn(0))
+"""Difference between Reduced Julian Day numbers and Gregorian date ordinals."""
+
+
+class _Chunk(NamedTuple):
+    """A chunk of input lines split into fields, with the values to convert."""
+
+    rows: list[list[str]]
+    values: list[str]
+
+
+def convert_values(values: list[str], to: Calendar) -> list[str | None]:
+    """Convert a list of ISO formatted date strings to the other calendar.
+
+    Surrounding whitespace is ignored, and dates that are not valid or out of
+    supported range are converted to ``None``.
+
+    Args:
+        values: ISO formatted date strings.
+        to: Calendar to convert to, either ``"hijri"`` or ``"gregorian"``.
+    """
+    get = _get_date_map(to).get
+    return [get(v) or get(v.strip()) for v in values]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run command-line interface and return exit status."""
+    args = _parse_args(argv)
+    index = args.column - 1 if args.delimiter else 0
+    delimiter = args.delimiter or ""
+    start = time.perf_counter()
+    line_number = count = 0
+
+    lines = fileinput.input(args.files or ("-",), encoding="utf-8")
+    try:
+        if args.header:
+            header = next(lines, None)
+            if header is not None:
+                sys.stdout.write(header)
+                line_number += 1
+        chunks = _read_chunks(lines, delimiter, index, args.chunk_size)
+        for chunk, results in _convert_chunks(chunks, args.to, args.jobs):
+            output: list[str] = []
+            for parts, value, result in zip(*chunk, results, strict=True):
+                line_number += 1
+                if result is not None:
+                    parts[index] = result
+                elif value.strip():
+                    if args.errors == "raise":
+                        # lines before the invalid one are written, so output
+                        # does not depend on chunk size
+                        sys.stdout.writelines(output)
+                        sys.stdout.flush()
+                        reason = _rejection_reason(value.strip(), args.to)
+                        sys.stderr.write(f"hijridate: line {line_number}: {reason}\n")
+                        return 1
+                    parts[index] = ""
+                output.append(delimiter.join(parts) + "\n")
+            sys.stdout.writelines(output)
+            count += len(output)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Python flushes standard output at exit, so redirect the remaining
+        # output to devnull to avoid another error when the reader has exited
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except OSError as error:
+        sys.stderr.write(f"hijridate: {error}\n")
+        return 1
+    finally:
+        lines.close()
+
+    if args.stats:
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed if elapsed else 0.0
+        message = f"hijridate: converted {count:,} lines in {elapsed:.2f} s"
+        sys.stderr.write(f"{message} ({rate:,.0f} lines/s)\n")
+    return 0
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Return parsed command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="hijridate",
+        description="Convert ISO formatted dates between Gregorian and Hijri.",
+        epilog="Empty values are written unchanged.",
+    )
+    parser.add_argument(
+        "files", nargs="*", metavar="FILE", help="input files, or '-' for stdin"
+    )
+    parser.add_argument(
+        "--to",
+        choices=get_args(Calendar),
+        default="hijri",
+        help="calendar to convert to (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-t", "--delimiter", help="field delimiter, if lines have several fields"
+    )
+    parser.add_argument(
+        "-c",
+        "--column",
+        type=_positive_int,
+        default=1,
+        help="field number of dates, starting at 1 (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--header", action="store_true", help="write first line unchanged"
+    )
+    parser.add_argument(
+        "--errors",
+        choices=get_args(Errors),
+        default="raise",
+        help="whether to 'raise' for the first invalid date, "
+        "or 'coerce' invalid dates to empty values (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="number of worker processes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=10000,
+        help="number of lines per chunk (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="report throughput to stderr at end"
+    )
+    parser.add_argument(
+        "--version", action="version", version=metadata.version("hijridate")
+    )
+    return parser.parse_args(argv)
+
+
+def _positive_int(value: str) -> int:
+    """Return a positive integer from a command-line argument."""
+    number = int(value)
+    if number < 1:
+        message = f"must be a positive integer, got '{value}'"
+        raise argparse.ArgumentTypeError(message)
+    return number
+
+
+def _read_chunks(
+    lines: Iterable[str], delimiter: str, index: int, size: int
+) -> Iterator[_Chunk]:
+    """Yield chunks of lines split into fields, with the values to convert."""
+    iterator = iter(lines)
+    while block := list(islice(iterator, size)):
+        if delimiter:
+            rows = [line.rstrip("\r\n").split(delimiter) for line in block]
+        else:
+            rows = [[line.rstrip("\r\n")] for line in block]
+        values = [r[index] if index < len(r) else "" for r in rows]
+        yield _Chunk(rows, values)
+
+
+def _convert_chunks(
+    chunks: Iterator[_Chunk], to: Calendar, jobs: int
+) -> Iterator[tuple[_Chunk, list[str | None]]]:
+    """Yield chunks with their conversion results, in input order.
+
+    With more than one job, chunks are converted by a pool of worker
+    processes (see :mod:`hijridate.parallel`).
+    """
+    if jobs == 1:
+        for chunk in chunks:
+            yield chunk, convert_values(chunk.values, to)
+        return
+    pending: deque[_Chunk] = deque()
+
+    def values() -> Iterator[list[str]]:
+        for chunk in chunks:
+            pending.append(chunk)
+            yield chunk.values
+
+    convert = functools.partial(convert_values, to=to)
+    for results in parallel._imap(convert, values(), jobs):
+        yield pending.popleft(), results
+
+
+@helpers.build_once
+def _get_date_map(to: Calendar) -> dict[str, str]:
+    """Return map of ISO formatted dates to ISO formatted dates in calendar.
+
+    The map covers all supported days, so converting a date is a single
+    lookup. It is built on first use, in about 0.1 seconds.
+    """
+    return _build_date_map(to)
+
+
+def _build_date_map(to: Calendar) -> dict[str, str]:
+    """Return a new map of ISO formatted dates to ISO formatted dates in calendar."""
+    date_map = {}
+    month_starts = ummalqura.MONTH_STARTS
+    fromordinal = datetime.date.fromordinal
+    for index in range(len(month_starts) - 1):
+        years, month = divmod(index + ummalqura.HIJRI_OFFSET, 12)
+        prefix = f"{years + 1:04}-{month + 1:02}-"
+        first_ordinal = month_starts[index] - _RJD_OFFSET
+        for day in range(1, month_starts[index + 1] - month_starts[index] + 1):
+            gregorian = fromordinal(first_ordinal + day - 1).isoformat()
+            hijri = f"{prefix}{day:02}"
+            if to == "hijri":
+                date_map[gregorian] = hijri
+            else:
+                date_map[hijri] = gregorian
+    return date_map
+
+
+def _rejection_reason(value: str, to: Calendar) -> str:
+    """Return the reason why a date string cannot be converted."""
+    if to == "gregorian":
+        return parsing._rejection_reason(value)
+    try:
+        Gregorian.fromisoformat(value).to_hijri()
+    except (OverflowError, ValueError) as error:
+        return str(error)
+    return f"invalid isoformat string: '{value}'"
@@ -1,10 +1,46 @@
 """Main module of the HijriDate package."""
 
+import copyreg
 import datetime
 
 from bisect import bisect
+from typing import TYPE_CHECKING, Any, Literal, get_args, overload
 
-from hijridate import helpers, locales, ummalqura
+from hijridate import helpers, ummalqura
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Callable
+
+    from hijridate import cache, formatting, locales, parsing
+
+DayOverflow = Literal["clamp", "overflow", "raise"]
+
+_MONTH_INDEX_OFFSET = ummalqura.HIJRI_OFFSET + 13
+"""Offset of month indexes in ummalqura month starts from ``year * 12 + month``."""
+_MIN_RJD, _MAX_RJD = ummalqura.RJD_RANGE
+_RJD_WEEKDAY = helpers.rjd_to_jdn(0) % 7
+"""Day of week of Reduced Julian Day zero, where Monday is 0 and Sunday is 6."""
+_JDN_RJD_OFFSET = helpers.jdn_to_rjd(0)
+"""Difference between Reduced Julian Day numbers and Julian day numbers."""
+_ORDINAL_RJD_OFFSET = helpers.jdn_to_rjd(helpers.ordinal_to_jdn(0))
+"""Difference between Reduced Julian Day numbers and Gregorian date ordinals."""
+_YEARS = tuple(range(ummalqura.HIJRI_RANGE[0][0], ummalqura.HIJRI_RANGE[1][0] + 1))
+"""Supported Hijri years, shared by converted Hijri objects to save memory."""
+
+_MONTH_COUNT = len(ummalqura.MONTH_STARTS) - 1
+"""Number of supported months, each starting at its index in month starts."""
+
+_locales: dict[str, "locales.Locale"] = {}
+"""Locales by language tag, filled on first use of each locale."""
+_active_cache: "cache.ConversionCache | None" = None
+"""Conversion cache set by the :mod:`hijridate.cache` module when enabled."""
+_active_table: "array[int] | None" = None
+"""Lookup table set by the :mod:`hijridate.lookup` module when enabled."""
+_compile_formatter: "Callable[[str, str], formatting.Formatter] | None" = None
+"""Format compiler of the :mod:`hijridate.formatting` module, set on first use."""
+_compile_parser: "Callable[[str, str], parsing.Parser] | None" = None
+"""Format compiler of the :mod:`hijridate.parsing` module, set on first use."""
 
 
 class Hijri:
@@ -41,38 +77,102 @@ class Hijri:
     def __str__(self) -> str:
         return self.isoformat()
 
+    def __format__(self, format_spec: str) -> str:
+        if not format_spec:
+            return self.isoformat()
+        return self.strftime(format_spec)
+
     def __hash__(self) -> int:
         return hash(("Hijri", self._year, self._month, self._day))
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Hijri):
             return NotImplemented
-        return self._compare(other) == 0
+        return self._cmp_key() == other._cmp_key()
 
     def __gt__(self, other: object) -> bool:
         if not isinstance(other, Hijri):
             return NotImplemented
-        return self._compare(other) > 0
+        return self._cmp_key() > other._cmp_key()
 
     def __ge__(self, other: object) -> bool:
         if not isinstance(other, Hijri):
             return NotImplemented
-        return self._compare(other) >= 0
+        return self._cmp_key() >= other._cmp_key()
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Hijri):
             return NotImplemented
-        return self._compare(other) < 0
+        return self._cmp_key() < other._cmp_key()
 
     def __le__(self, other: object) -> bool:
         if not isinstance(other, Hijri):
             return NotImplemented
-        return self._compare(other) <= 0
+        return self._cmp_key() <= other._cmp_key()
+
+    def __add__(self, other: object) -> "Hijri":
+        if not isinstance(other, datetime.timedelta):
+            return NotImplemented
+        return self._fromrjd_checked(self._rjd() + other.days)
+
+    __radd__ = __add__
+
+    @overload
+    def __sub__(self, other: datetime.timedelta) -> "Hijri": ...
+
+    @overload
+    def __sub__(self, other: "Hijri") -> datetime.timedelta: ...
+
+    def __sub__(self, other: object) -> "Hijri | datetime.timedelta":
+        if isinstance(other, datetime.timedelta):
+            return self._fromrjd_checked(self._rjd() - other.days)
+        if isinstance(other, Hijri):
+            return datetime.timedelta(days=self._rjd() - other._rjd())
+        return NotImplemented
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return pickling recipe that restores the date without validation.
+
+        The pickled state is the packed date integer (``year << 9 | month << 5
+        | day``), which is restored by ``__setstate__`` without validating
+        the date again. Objects created with ``validate=False`` whose values
+        do not fit the packed integer are pickled with a (year, month, day)
+        tuple instead. Pickles written by earlier releases, which store the
+        default slots state, are still restored.
+        """
+        state = _pack_date(self._year, self._month, self._day)
+        return copyreg.__newobj__, (self.__class__,), state  # type: ignore[attr-defined]
+
+    def __setstate__(
+        self, state: int | tuple[int, int, int] | tuple[None, dict[str, int]]
+    ) -> None:
+        if isinstance(state, int):
+            year, month, day = state >> 9, (state >> 5) & 15, state & 31
+        elif state[0] is None:
+            # default slots state of pickles written by earlier releases
+            slots = state[1]
+            year, month, day = slots["_year"], slots["_month"], slots["_day"]
+        else:
+            year, month, day = state
+        self._year = year
+        self._month = month
+        self._day = day
 
-    def _compare(self, other: "Hijri") -> int:
-        self_date = self.datetuple()
-        other_date = other.datetuple()
-        return 0 if self_date == other_date else 1 if self_date > other_date else -1
+    @classmethod
+    def frombytes(cls, data: bytes) -> "Hijri":
+        """Construct Hijri object from its binary encoding.
+
+        Args:
+            data: Two bytes, as returned by :meth:`tobytes`.
+
+        Raises:
+            ValueError: When ``data`` is not two bytes long.
+            OverflowError: When the encoded day is out of supported Hijri range.
+        """
+        if len(data) != 2:  # noqa: PLR2004
+            message = f"data must be 2 bytes long, got {len(data)}"
+            raise ValueError(message)
+        return cls._fromrjd_checked(int.from_bytes(data, "little") + _MIN_RJD)
 
     @classmethod
     def fromisoformat(cls, date_string: str) -> "Hijri":
@@ -84,6 +184,80 @@ class Hijri:
         year, month, day = map(int, date_string.split("-"))
         return cls(year, month, day)
 
+    @classmethod
+    def fromordinal(cls, ordinal: int) -> "Hijri":
+        """Construct Hijri object from a Gregorian date ordinal.
+
+        This is faster than ``Gregorian.fromordinal(ordinal).to_hijri()``, as
+        no Gregorian object is created.
+
+        Args:
+            ordinal: Gregorian date ordinal, where 1 January of year 1 is 1.
+
+        Raises:
+            OverflowError: When ``ordinal`` is out of supported range.
+        """
+        return cls._fromdaynumber("ordinal", ordinal, _ORDINAL_RJD_OFFSET)
+
+    @classmethod
+    def fromjulian(cls, jdn: int) -> "Hijri":
+        """Construct Hijri object from a Julian day number (JDN).
+
+        Args:
+            jdn: Julian day number (JDN).
+
+        Raises:
+            OverflowError: When ``jdn`` is out of supported range.
+        """
+        return cls._fromdaynumber("jdn", jdn, _JDN_RJD_OFFSET)
+
+    @classmethod
+    def fromrjd(cls, rjd: int) -> "Hijri":
+        """Construct Hijri object from a Reduced Julian Day (RJD) number.
+
+        Args:
+            rjd: Reduced Julian Day (RJD) number.
+
+        Raises:
+            OverflowError: When ``rjd`` is out of supported range.
+        """
+        return cls._fromdaynumber("rjd", rjd, 0)
+
+    @classmethod
+    def strptime(
+        cls, date_string: str, fmt: str, language: "locales.Language" = "en"
+    ) -> "Hijri":
+        """Construct Hijri object from a date string parsed using a format string.
+
+        Format strings are compiled once and cached, see
+        :func:`hijridate.parsing.compile_format` for how date strings are
+        matched. For parsing many date strings, use
+        :func:`hijridate.parsing.parse_format` instead.
+
+        Args:
+            date_string: Hijri date string, e.g. ``"17 Safar 1403"``.
+            fmt: Format string of directives and literal text, e.g.
+                ``"%d %B %Y"``.
+            language: Two-letter language code for localized names.
+
+        Raises:
+            ValueError: When ``date_string`` does not match ``fmt``, or when
+                ``fmt`` is not valid.
+            OverflowError: When ``year`` is out of supported Hijri range.
+            ValueError: When ``month`` or ``day`` is not valid.
+        """
+        global _compile_parser  # noqa: PLW0603
+        compile_format = _compile_parser
+        if compile_format is None:
+            from hijridate import parsing  # noqa: PLC0415
+
+            compile_format = _compile_parser = parsing.compile_format
+        fields = compile_format(fmt, language)(date_string.strip())
+        if fields is None:
+            message = f"date string does not match format '{fmt}': '{date_string}'"
+            raise ValueError(message)
+        return cls(*fields)
+
     @classmethod
     def today(cls) -> "Hijri":
         """Construct Hijri object from today's date."""
@@ -108,6 +282,19 @@ class Hijri:
         """Return date as a tuple of (year, month, day)."""
         return self._year, self._month, self._day
 
+    def tobytes(self) -> bytes:
+        """Return date as a compact and stable binary encoding of two bytes.
+
+        The encoding is the number of days since the first supported day
+        (1 Muharram 1343) as a little-endian unsigned 16-bit integer, which
+        can be decoded with :meth:`frombytes`.
+
+        Raises:
+            OverflowError: When date is out of supported Hijri range.
+            ValueError: When month or day is not valid.
+        """
+        return self._daynumber().to_bytes(2, "little")
+
     def isoformat(self) -> str:
         """Return date in ISO format i.e. ``YYYY-MM-DD``."""
         return f"{self._year:04}-{self._month:02}-{self._day:02}"
@@ -124,61 +311,140 @@ class Hijri:
         month = f"{self._month:02}" if padding else self._month
         return f"{day}{separator}{month}{separator}{self._year}"
 
+    def strftime(self, fmt: str, language: "locales.Language" = "en") -> str:
+        """Return date formatted using a format string, e.g. ``"%d %B %Y"``.
+
+        Format strings are compiled once and cached, see
+        :mod:`hijridate.formatting` for the supported directives.
+
+        Args:
+            fmt: Format string of directives and literal text.
+            language: Two-letter language code for localized names.
+
+        Raises:
+            ValueError: When ``fmt`` has an unsupported directive.
+        """
+        global _compile_formatter  # noqa: PLW0603
+        compile_format = _compile_formatter
+        if compile_format is None:
+            from hijridate import formatting  # noqa: PLC0415
+
+            compile_format = _compile_formatter = formatting.compile_format
+        return compile_format(fmt, language)(self)
+
     def year_length(self) -> int:
         """Return number of days in year."""
         month_starts = ummalqura.MONTH_STARTS
-        first_index, last_index = self._year_indexes()
-        return month_starts[last_index + 1] - month_starts[first_index]
+        index = self._year * 12 + 1 - _MONTH_INDEX_OFFSET
+        return month_starts[index + 12] - month_starts[index]
 
     def month_length(self) -> int:
         """Return number of days in month."""
         month_starts = ummalqura.MONTH_STARTS
-        index = self._month_index()
+        index = self._year * 12 + self._month - _MONTH_INDEX_OFFSET
         return month_starts[index + 1] - month_starts[index]
 
-    def month_name(self, language: locales.Language = "en") -> str:
+    def month_name(self, language: "locales.Language" = "en") -> str:
         """Return month name.
 
         Args:
             language: Two-letter language code for localized month name.
         """
-        return locales.get_locale(language).month_name(self._month)
+        return _get_locale(language).month_name(self._month)
 
     def weekday(self) -> int:
         """Return day of week, where Monday is 0 and Sunday is 6."""
-        jdn = self.to_julian()
-        return int(jdn % 7)
+        index = self._year * 12 + self._month - _MONTH_INDEX_OFFSET
+        return (ummalqura.MONTH_STARTS[index] + self._day - 1 + _RJD_WEEKDAY) % 7
 
     def isoweekday(self) -> int:
         """Return day of week, where Monday is 1 and Sunday is 7."""
-        jdn = self.to_julian()
-        return int(jdn % 7) + 1
+        return self.weekday() + 1
 
-    def day_name(self, language: locales.Language = "en") -> str:
+    def day_name(self, language: "locales.Language" = "en") -> str:
         """Return day name.
 
         Args:
             language: Two-letter language code for localized day name.
         """
-        return locales.get_locale(language).day_name(self.isoweekday())
+        return _get_locale(language).day_name(self.isoweekday())
 
     @staticmethod
-    def notation(language: locales.Language = "en") -> str:
+    def notation(language: "locales.Language" = "en") -> str:
         """Return calendar era notation.
 
         Args:
             language: Two-letter language code for localized era notation.
         """
-        return locales.get_locale(language).notation
+        return _get_locale(language).notation
+
+    def add_months(self, months: int, *, mode: DayOverflow = "clamp") -> "Hijri":
+        """Return Hijri object shifted by a number of Hijri months.
+
+        Args:
+            months: Number of months to add, which can be negative.
+            mode: How to handle a day that does not exist in the resulting
+                month: ``"clamp"`` it to the last day of month, ``"overflow"``
+                it into the following month, or ``"raise"`` an exception.
+
+        Raises:
+            OverflowError: When resulting date is out of supported Hijri range.
+            ValueError: When ``mode`` is not supported, or when day does not
+                exist in resulting month and ``mode`` is ``"raise"``.
+        """
+        if mode not in get_args(DayOverflow):
+            message = f"mode must be one of {get_args(DayOverflow)}, got '{mode}'"
+            raise ValueError(message)
+        month_starts = ummalqura.MONTH_STARTS
+        index = self._month_index() + months
+        if not 0 <= index < len(month_starts) - 1:
+            message = "date value out of range"
+            raise OverflowError(message)
+        day = self._day
+        month_length = month_starts[index + 1] - month_starts[index]
+        if day > month_length:
+            if mode == "overflow":
+                return self._fromrjd_checked(month_starts[index] + day - 1)
+            if mode == "raise":
+                message = f"day must be in 1-{month_length} for month, got '{day}'"
+                raise ValueError(message)
+            day = month_length
+        years, month = divmod(index + ummalqura.HIJRI_OFFSET, 12)
+        return self.__class__(years + 1, month + 1, day, validate=False)
+
+    def add_years(self, years: int, *, mode: DayOverflow = "clamp") -> "Hijri":
+        """Return Hijri object shifted by a number of Hijri years.
+
+        Args:
+            years: Number of years to add, which can be negative.
+            mode: How to handle a day that does not exist in the resulting
+                month: ``"clamp"`` it to the last day of month, ``"overflow"``
+                it into the following month, or ``"raise"`` an exception.
+
+        Raises:
+            OverflowError: When resulting date is out of supported Hijri range.
+            ValueError: When ``mode`` is not supported, or when day does not
+                exist in resulting month and ``mode`` is ``"raise"``.
+        """
+        return self.add_months(years * 12, mode=mode)
 
     def to_julian(self) -> int:
         """Return corresponding Julian day number (JDN)."""
-        month_starts = ummalqura.MONTH_STARTS
-        index = self._month_index()
-        rjd = month_starts[index] + self._day - 1
-        return helpers.rjd_to_jdn(rjd)
+        return helpers.rjd_to_jdn(self._rjd())
 
     def to_gregorian(self) -> "Gregorian":
+        """Return Gregorian object for the corresponding Hijri date."""
+        conversion_cache = _active_cache
+        if conversion_cache is None:
+            return self._to_gregorian()
+        key = self.datetuple()
+        gregorian = conversion_cache.get(key)
+        if not isinstance(gregorian, Gregorian):
+            gregorian = self._to_gregorian()
+            conversion_cache.put(key, gregorian)
+        return gregorian
+
+    def _to_gregorian(self) -> "Gregorian":
         """Return Gregorian object for the corresponding Hijri date."""
         jdn = self.to_julian()
         ordinal = helpers.jdn_to_ordinal(jdn)
@@ -202,17 +468,119 @@ class Hijri:
             message = f"day must be in 1-{month_length} for month, got '{self.day}'"
             raise ValueError(message)
 
-    def _year_indexes(self) -> tuple[int, int]:
-        """Return year's first and last indexes in ummalqura month starts."""
-        prior_months = (self.year - 1) * 12
-        first_index = prior_months - ummalqura.HIJRI_OFFSET
-        last_index = first_index + 11
-        return first_index, last_index
+    @classmethod
+    def _fromrjd(cls, rjd: int) -> "Hijri":
+        """Construct Hijri object from a Reduced Julian Day (RJD) number.
+
+        The RJD number must be within the range of ummalqura month starts, or
+        the resulting date is invalid.
+        """
+        month_starts = ummalqura.MONTH_STARTS
+        table = _active_table
+        offset = rjd - month_starts[0]
+        if table is None or not 0 <= offset < len(table):
+            index = bisect(month_starts, rjd) - 1
+        else:
+            index = table[offset]
+        day = rjd - month_starts[index] + 1
+        if 0 <= index < _MONTH_COUNT:
+            year_index = int(index / 12)
+            month = index - (year_index * 12) + 1
+            return cls(_YEARS[year_index], month, day, validate=False)
+        # out of range RJD, only reached by conversion without validation
+        months = index + ummalqura.HIJRI_OFFSET
+        years = int(months / 12)
+        return cls(years + 1, months - (years * 12) + 1, day, validate=False)
+
+    @classmethod
+    def _fromrjd_checked(cls, rjd: int) -> "Hijri":
+        """Construct Hijri object from a RJD number resulting from arithmetic.
+
+        Raises:
+            OverflowError: When resulting date is out of supported Hijri range.
+        """
+        if not _MIN_RJD <= rjd <= _MAX_RJD:
+            message = "date value out of range"
+            raise OverflowError(message)
+        return cls._fromrjd(rjd)
+
+    @classmethod
+    def _fromdaynumber(cls, name: str, number: int, rjd_offset: int) -> "Hijri":
+        """Construct Hijri object from a day number that differs from RJD by offset.
+
+        Raises:
+            OverflowError: When day number is out of supported range.
+        """
+        rjd = number + rjd_offset
+        if not _MIN_RJD <= rjd <= _MAX_RJD:
+            min_number, max_number = _MIN_RJD - rjd_offset, _MAX_RJD - rjd_offset
+            message = f"{name} must be in {min_number}-{max_number}, got '{number}'"
+            raise OverflowError(message)
+        return cls._fromrjd(rjd)
+
+    def _daynumber(self) -> int:
+        """Return number of days since the first supported day.
+
+        Raises:
+            OverflowError: When date is out of supported Hijri range.
+            ValueError: When month or day is not valid.
+        """
+        month_starts = ummalqura.MONTH_STARTS
+        index = self._year * 12 + self._month - _MONTH_INDEX_OFFSET
+        max_months = 12
+        if not (
+            0 <= index < _MONTH_COUNT
+            and 1 <= self._month <= max_months
+            and 1 <= self._day <= month_starts[index + 1] - month_starts[index]
+        ):
+            self._check_date()
+        return month_starts[index] + self._day - 1 - _MIN_RJD
+
+    def _cmp_key(self) -> tuple[int, int, int]:
+        """Return key comparing Hijri objects, which is the date tuple."""
+        return self._year, self._month, self._day
+
+    def _rjd(self) -> int:
+        """Return corresponding Reduced Julian Day (RJD) number."""
+        return ummalqura.MONTH_STARTS[self._month_index()] + self._day - 1
 
     def _month_index(self) -> int:
         """Return month's index in ummalqura month starts."""
-        prior_months = ((self.year - 1) * 12) + self.month - 1
-        return prior_months - ummalqura.HIJRI_OFFSET
+        return self._year * 12 + self._month - _MONTH_INDEX_OFFSET
+
+
+def _pack_date(year: int, month: int, day: int) -> int | tuple[int, int, int]:
+    """Return packed date integer (``year << 9 | month << 5 | day``).
+
+    Values of objects created with ``validate=False`` that do not fit the
+    packed integer are returned as a (year, month, day) tuple.
+    """
+    if (
+        year.__class__ is int
+        and month.__class__ is int
+        and day.__class__ is int
+        and year >= 0
+        and 0 <= month < 16  # noqa: PLR2004
+        and 0 <= day < 32  # noqa: PLR2004
+    ):
+        return (year << 9) | (month << 5) | day
+    return year, month, day
+
+
+def _get_locale(language: str) -> "locales.Locale":
+    """Return locale for a language, importing the locales module on first use.
+
+    Locales hold no state, so one locale object of each language tag is kept
+    and reused.
+    """
+    locale = _locales.get(language)
+    if locale is None:
+        from hijridate import locales  # noqa: PLC0415
+
+        locale = locales.get_locale(language)
+        if language == locale.language_tag:
+            _locales[language] = locale
+    return locale
 
 
 class Gregorian(datetime.date):
@@ -236,6 +604,30 @@ class Gregorian(datetime.date):
         year, month, day = date_object.timetuple()[:3]
         return cls(year, month, day)
 
+    @classmethod
+    def fromjulian(cls, jdn: int) -> "Gregorian":
+        """Construct Gregorian object from a Julian day number (JDN).
+
+        Args:
+            jdn: Julian day number (JDN).
+
+        Raises:
+            ValueError: When date is out of range of Python dates.
+        """
+        return cls.fromordinal(helpers.jdn_to_ordinal(jdn))
+
+    @classmethod
+    def fromrjd(cls, rjd: int) -> "Gregorian":
+        """Construct Gregorian object from a Reduced Julian Day (RJD) number.
+
+        Args:
+            rjd: Reduced Julian Day (RJD) number.
+
+        Raises:
+            ValueError: When date is out of range of Python dates.
+        """
+        return cls.fromordinal(rjd - _ORDINAL_RJD_OFFSET)
+
     def datetuple(self) -> tuple[int, int, int]:
         """Return date as a tuple of (year, month, day)."""
         return self.year, self.month, self.day
@@ -252,58 +644,73 @@ class Gregorian(datetime.date):
         month = f"{self.month:02}" if padding else self.month
         return f"{day}{separator}{month}{separator}{self.year}"
 
-    def month_name(self, language: locales.Language = "en") -> str:
+    def month_name(self, language: "locales.Language" = "en") -> str:
         """Return month name.
 
         Args:
             language: Two-letter language code for localized month name.
         """
-        return locales.get_locale(language).gregorian_month_name(self.month)
+        return _get_locale(language).gregorian_month_name(self.month)
 
-    def day_name(self, language: locales.Language = "en") -> str:
+    def day_name(self, language: "locales.Language" = "en") -> str:
         """Return day name.
 
         Args:
             language: Two-letter language code for localized day name.
         """
-        return locales.get_locale(language).day_name(self.isoweekday())
+        return _get_locale(language).day_name(self.isoweekday())
 
     @staticmethod
-    def notation(language: locales.Language = "en") -> str:
+    def notation(language: "locales.Language" = "en") -> str:
         """Return calendar era notation.
 
         Args:
             language: Two-letter language code for localized era notation.
         """
-        return locales.get_locale(language).gregorian_notation
+        return _get_locale(language).gregorian_notation
 
     def to_julian(self) -> int:
         """Return corresponding Julian day number (JDN)."""
         ordinal = self.toordinal()
         return helpers.ordinal_to_jdn(ordinal)
 
-    def to_hijri(self) -> Hijri:
+    def to_hijri(self, *, validate: bool = True) -> Hijri:
         """Return Hijri object for the corresponding Gregorian date.
 
+        Args:
+            validate: Whether to validate Gregorian date range. Only disable
+                for dates known to be in supported range, as converting an
+                out of range date without validation gives an invalid result.
+
         Raises:
             OverflowError: When date is out of supported Gregorian range.
         """
-        self._check_range()
-        jdn = self.to_julian()
-        rjd = helpers.jdn_to_rjd(jdn)
-        month_starts = ummalqura.MONTH_STARTS
-        index = bisect(month_starts, rjd) - 1
-        months = index + ummalqura.HIJRI_OFFSET
-        years = int(months / 12)
-        year = years + 1
-        month = months - (years * 12) + 1
-        day = rjd - month_starts[index] + 1
-        return Hijri(year, month, day, validate=False)
+        conversion_cache = _active_cache
+        if conversion_cache is None:
+            return self._to_hijri(validate=validate)
+        key = self.toordinal()
+        if not _MIN_RJD <= key + _ORDINAL_RJD_OFFSET <= _MAX_RJD:
+            # out of range results are never cached, so a result converted
+            # without validation is never returned to a validated call
+            return self._to_hijri(validate=validate)
+        hijri = conversion_cache.get(key)
+        if not isinstance(hijri, Hijri):
+            hijri = self._to_hijri()
+            conversion_cache.put(key, hijri)
+        return hijri
+
+    def _to_hijri(self, *, validate: bool = True) -> Hijri:
+        """Return Hijri object for the corresponding Gregorian date."""
+        rjd = self.toordinal() + _ORDINAL_RJD_OFFSET
+        if validate and not _MIN_RJD <= rjd <= _MAX_RJD:
+            self._check_range()
+        return Hijri._fromrjd(rjd)
 
     def _check_range(self) -> None:
         """Check if Gregorian date is within valid range."""
-        min_date, max_date = ummalqura.GREGORIAN_RANGE
-        if not min_date <= (self.year, self.month, self.day) <= max_date:
+        min_ordinal, max_ordinal = ummalqura.ORDINAL_RANGE
+        if not min_ordinal <= self.toordinal() <= max_ordinal:
+            min_date, max_date = ummalqura.GREGORIAN_RANGE
             min_date_iso = "-".join([f"{i:02}" for i in min_date])
             max_date_iso = "-".join([f"{i:02}" for i in max_date])
             message = (
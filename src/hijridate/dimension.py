@@ -0,0 +1,129 @@
+"""Calendar dimension table for the full supported Umm al-Qura range.
+
+The table has one row per day, built in a single streaming pass over the
+ummalqura month starts. Exporting to Arrow or Parquet requires the optional
+PyArrow dependency, which can be installed with ``pip install hijridate[arrow]``.
+"""
+
+import calendar
+import csv
+import datetime
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, NamedTuple, TextIO
+
+from hijridate import helpers, locales, ummalqura
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pyarrow as pa
+
+
+class DimensionRow(NamedTuple):
+    """A row of calendar dimension table representing a single day.
+
+    The ``weekday`` is the day of week, where Monday is 1 and Sunday is 7.
+    """
+
+    gregorian_date: datetime.date
+    hijri_year: int
+    hijri_month: int
+    hijri_day: int
+    weekday: int
+    hijri_month_length: int
+    hijri_year_length: int
+    gregorian_month_length: int
+    hijri_month_name: str
+    gregorian_month_name: str
+    day_name: str
+
+
+def iter_rows(language: locales.Language = "en") -> Iterator[DimensionRow]:
+    """Return an iterator of calendar dimension rows for all supported days.
+
+    Args:
+        language: Two-letter language code for localized month and day names.
+    """
+    locale = locales.get_locale(language)
+    month_starts = ummalqura.MONTH_STARTS
+    ordinal_offset = helpers.jdn_to_ordinal(helpers.rjd_to_jdn(0))
+    gregorian_month_lengths: dict[tuple[int, int], int] = {}
+
+    for index in range(len(month_starts) - 1):
+        years, month = divmod(index + ummalqura.HIJRI_OFFSET, 12)
+        year, month = years + 1, month + 1
+        year_index = index - month + 1
+        year_length = month_starts[year_index + 12] - month_starts[year_index]
+        month_length = month_starts[index + 1] - month_starts[index]
+        month_name = locale.month_name(month)
+        first_ordinal = month_starts[index] + ordinal_offset
+
+        for day in range(1, month_length + 1):
+            ordinal = first_ordinal + day - 1
+            gregorian = datetime.date.fromordinal(ordinal)
+            gregorian_month = gregorian.year, gregorian.month
+            gregorian_month_length = gregorian_month_lengths.get(gregorian_month)
+            if gregorian_month_length is None:
+                gregorian_month_length = calendar.monthrange(*gregorian_month)[1]
+                gregorian_month_lengths[gregorian_month] = gregorian_month_length
+            weekday = (ordinal + 6) % 7 + 1
+            yield DimensionRow(
+                gregorian,
+                year,
+                month,
+                day,
+                weekday,
+                month_length,
+                year_length,
+                gregorian_month_length,
+                month_name,
+                locale.gregorian_month_name(gregorian.month),
+                locale.day_name(weekday),
+            )
+
+
+def write_csv(file: TextIO, language: locales.Language = "en") -> None:
+    """Write calendar dimension table to a CSV file with a header row.
+
+    Args:
+        file: Text file object opened with ``newline=""``.
+        language: Two-letter language code for localized month and day names.
+    """
+    writer = csv.writer(file)
+    writer.writerow(DimensionRow._fields)
+    writer.writerows(iter_rows(language))
+
+
+def to_arrow(language: locales.Language = "en") -> "pa.Table":
+    """Return calendar dimension table as a PyArrow table.
+
+    Args:
+        language: Two-letter language code for localized month and day names.
+    """
+    pa = _import_pyarrow()
+    columns: list[Any] = [list(c) for c in zip(*iter_rows(language), strict=True)]
+    types = [pa.date32()] + [pa.int16()] * 7 + [pa.string()] * 3
+    arrays = [pa.array(c, type=t) for c, t in zip(columns, types, strict=True)]
+    return pa.table(arrays, names=list(DimensionRow._fields))
+
+
+def write_parquet(path: str, language: locales.Language = "en") -> None:
+    """Write calendar dimension table to a Parquet file.
+
+    Args:
+        path: Path of the Parquet file.
+        language: Two-letter language code for localized month and day names.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    pq.write_table(to_arrow(language), path)
+
+
+def _import_pyarrow() -> Any:
+    """Return the PyArrow module, raising a helpful error if not installed."""
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+    except ImportError as error:  # pragma: no cover
+        message = "arrow export requires pyarrow, install 'hijridate[arrow]'"
+        raise ImportError(message) from error
+    return pa
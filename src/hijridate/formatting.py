@@ -0,0 +1,102 @@
+"""Formatting of Hijri dates using ``strftime`` format strings.
+
+Format strings are compiled once into formatter functions, which are cached
+by format string and language. Formatting many dates with the same format
+parses the format string and looks up the locale only once, so each date is
+formatted by a single call of a compiled formatter.
+
+The following directives are supported:
+
+=========  ======================================  ========
+Directive  Meaning                                 Example
+=========  ======================================  ========
+``%Y``     Year as a zero-padded decimal number.   1403
+``%m``     Month as a zero-padded decimal number.  02
+``%d``     Day as a zero-padded decimal number.    17
+``%B``     Month name.                             Safar
+``%A``     Weekday name.                           Thursday
+``%a``     Abbreviated weekday name.               Thu
+``%E``     Calendar era notation.                  AH
+``%%``     A literal ``%`` character.              %
+=========  ======================================  ========
+"""
+
+import functools
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from hijridate import locales
+
+if TYPE_CHECKING:
+    from hijridate.convert import Hijri
+
+Formatter = Callable[["Hijri"], str]
+
+
+@functools.lru_cache(maxsize=256)
+def compile_format(fmt: str, language: str = "en") -> Formatter:
+    """Return a function that formats Hijri objects using a format string.
+
+    Compiled formatters are cached, so calling this function again with the
+    same arguments returns the same formatter.
+
+    Args:
+        fmt: Format string of directives and literal text, e.g. ``"%d %B %Y"``.
+        language: Two-letter language code for localized names.
+
+    Raises:
+        ValueError: When ``fmt`` has an unsupported directive, or when
+            ``language`` is not supported.
+    """
+    locale = locales.get_locale(language)
+    fields = _get_fields(locale)
+    parts: list[Formatter] = []
+    literal = []
+    chars = iter(fmt)
+    for char in chars:
+        if char != "%":
+            literal.append(char)
+            continue
+        directive = next(chars, "")
+        if directive == "%":
+            literal.append("%")
+        elif directive == "E":
+            # era notation does not depend on the date, so it is literal text
+            literal.append(locale.notation)
+        elif not directive:
+            message = f"stray '%' at end of format, got '{fmt}'"
+            raise ValueError(message)
+        elif directive in fields:
+            if literal:
+                parts.append(_literal("".join(literal)))
+                literal.clear()
+            parts.append(fields[directive])
+        else:
+            message = f"unsupported format directive, got '%{directive}'"
+            raise ValueError(message)
+    if literal or not parts:
+        parts.append(_literal("".join(literal)))
+    if len(parts) == 1:
+        return parts[0]
+    return lambda hijri: "".join([part(hijri) for part in parts])
+
+
+def _get_fields(locale: locales.Locale) -> dict[str, Formatter]:
+    """Return formatters of date field directives using names of a locale."""
+    month_names = locale.month_names
+    day_names = locale.day_names
+    abbreviated_day_names = locale.abbreviated_day_names
+    return {
+        "Y": lambda hijri: f"{hijri._year:04}",
+        "m": lambda hijri: f"{hijri._month:02}",
+        "d": lambda hijri: f"{hijri._day:02}",
+        "B": lambda hijri: month_names[hijri._month - 1],
+        "A": lambda hijri: day_names[hijri.weekday()],
+        "a": lambda hijri: abbreviated_day_names[hijri.weekday()],
+    }
+
+
+def _literal(text: str) -> Formatter:
+    """Return a function returning literal text for any Hijri object."""
+    return lambda hijri: text
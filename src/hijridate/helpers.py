@@ -1,5 +1,42 @@
 """Helper methods for Hijri conversion."""
 
+import functools
+
+from collections.abc import Callable, Hashable
+from typing import ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def build_once(build: Callable[P, T]) -> Callable[P, T]:
+    """Decorate a function to build its result once per arguments.
+
+    The result is built on the first call with given arguments and returned
+    by later calls. It is safe to call from multiple threads, including on
+    free-threaded Python builds, where concurrent first calls build the
+    result only once.
+
+    Args:
+        build: Function returning a new result, with hashable arguments.
+    """
+    # imported on first use, so that importing hijridate does not import it
+    import threading  # noqa: PLC0415
+
+    results: dict[Hashable, T] = {}
+    lock = threading.Lock()
+
+    @functools.wraps(build)
+    def get(*args: P.args, **kwargs: P.kwargs) -> T:
+        key = (args, tuple(kwargs.items()))
+        if key not in results:
+            with lock:
+                if key not in results:
+                    results[key] = build(*args, **kwargs)
+        return results[key]
+
+    return get
+
 
 def jdn_to_ordinal(jdn: int) -> int:
     """Convert Julian day number (JDN) to Gregorian date ordinal.
@@ -1,10 +1,13 @@
 """Localization for the Hijri month and day names."""
 
+import threading
+
 from typing import ClassVar, Literal
 
 Language = Literal["en", "ar", "bn", "tr"]
 
 _locale_map: dict[str, type["Locale"]] = {}
+_lock = threading.Lock()
 
 
 def get_locale(name: str) -> "Locale":
@@ -30,14 +33,16 @@ class Locale:
     month_names: ClassVar[tuple[str, ...]]
     gregorian_month_names: ClassVar[tuple[str, ...]]
     day_names: ClassVar[tuple[str, ...]]
+    abbreviated_day_names: ClassVar[tuple[str, ...]]
     notation: ClassVar[str]
     gregorian_notation: ClassVar[str]
 
     def __init_subclass__(cls) -> None:
-        if cls.language_tag in _locale_map:
-            message = f"duplicated language tag: {cls.language_tag}"
-            raise LookupError(message)
-        _locale_map[cls.language_tag] = cls
+        with _lock:
+            if cls.language_tag in _locale_map:
+                message = f"duplicated language tag: {cls.language_tag}"
+                raise LookupError(message)
+            _locale_map[cls.language_tag] = cls
 
     def month_name(self, month: int) -> str:
         """Return the month name for a specified Hijri month of the year.
@@ -63,6 +68,14 @@ class Locale:
         """
         return self.day_names[day - 1]
 
+    def abbreviated_day_name(self, day: int) -> str:
+        """Return the abbreviated day name for a specified day of the week.
+
+        Args:
+            day: day of week, where Monday is 1 and Sunday is 7.
+        """
+        return self.abbreviated_day_names[day - 1]
+
 
 class EnglishLocale(Locale):
     """An English Locale object represents English locale-specific data."""
@@ -105,6 +118,7 @@ class EnglishLocale(Locale):
         "Saturday",
         "Sunday",
     )
+    abbreviated_day_names = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
     notation = "AH"
     gregorian_notation = "CE"
 
@@ -150,6 +164,8 @@ class ArabicLocale(Locale):
         "السبت",
         "الأحد",
     )
+    # Arabic day names are not abbreviated
+    abbreviated_day_names = day_names
     notation = "هـ"
     gregorian_notation = "م"
 
@@ -195,6 +211,7 @@ class BengaliLocale(Locale):
         "শনিবার",
         "রবিবার",
     )
+    abbreviated_day_names = ("সোম", "মঙ্গল", "বুধ", "বৃহস্পতি", "শুক্র", "শনি", "রবি")
     notation = "হিজরি"
     gregorian_notation = "খ্রিস্টাব্দ"
 
@@ -240,5 +257,6 @@ class TurkishLocale(Locale):
         "Cumartesi",
         "Pazar",
     )
+    abbreviated_day_names = ("Pzt", "Sal", "Çar", "Per", "Cum", "Cmt", "Paz")
     notation = "Hicri"
     gregorian_notation = "Miladi"
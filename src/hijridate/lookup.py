@@ -0,0 +1,60 @@
+"""Direct-index lookup table for the Umm al-Qura month of each day.
+
+By default, :meth:`hijridate.convert.Gregorian.to_hijri` finds the Hijri month
+of a date by a binary search over the month starts. Enabling the lookup table
+replaces the search with a single subscript of a compact table that holds the
+month index of every day in the supported range. The table holds 55,991
+unsigned 16-bit integers (about 110 KB) and is built once, on first enabling,
+in a few milliseconds.
+"""
+
+import threading
+
+from array import array
+from itertools import repeat
+
+from hijridate import convert, helpers, ummalqura
+
+active_table: "array[int] | None" = None
+"""The lookup table when enabled for conversion, otherwise ``None`` (read-only)."""
+
+_lock = threading.Lock()
+
+
+def enable() -> None:
+    """Enable the lookup table for conversion, building it if not built yet."""
+    global active_table  # noqa: PLW0603
+    table = _get_table()
+    with _lock:
+        active_table = convert._active_table = table
+
+
+def disable() -> None:
+    """Disable the lookup table for conversion, keeping it for later use."""
+    global active_table  # noqa: PLW0603
+    with _lock:
+        active_table = convert._active_table = None
+
+
+def is_enabled() -> bool:
+    """Return whether the lookup table is enabled for conversion."""
+    return active_table is not None
+
+
+@helpers.build_once
+def _get_table() -> "array[int]":
+    """Return the lookup table, building it if not built yet."""
+    return build_table()
+
+
+def build_table() -> "array[int]":
+    """Return a new table of month indexes in ummalqura month starts.
+
+    The table is indexed by the Reduced Julian Day (RJD) number minus the
+    first month start.
+    """
+    month_starts = ummalqura.MONTH_STARTS
+    table = array("H")
+    for index in range(len(month_starts) - 1):
+        table.extend(repeat(index, month_starts[index + 1] - month_starts[index]))
+    return table
@@ -0,0 +1,156 @@
+"""Precomputed metadata of all supported Hijri months and years.
+
+The metadata index holds the length, Gregorian start date ordinal, and start
+weekday of every month and year in the supported Hijri range, so these
+values can be looked up without any computation (e.g. when rendering
+calendars). The index is built once, on first use, and is read-only.
+"""
+
+from typing import NamedTuple
+
+from hijridate import helpers, ummalqura
+
+
+class MonthInfo(NamedTuple):
+    """Metadata of a Hijri month.
+
+    The ``start_weekday`` is the day of week of the first day of month,
+    where Monday is 0 and Sunday is 6.
+    """
+
+    year: int
+    month: int
+    length: int
+    start_ordinal: int
+    start_weekday: int
+
+
+class YearInfo(NamedTuple):
+    """Metadata of a Hijri year, including the metadata of its months.
+
+    The ``start_weekday`` is the day of week of the first day of year,
+    where Monday is 0 and Sunday is 6.
+    """
+
+    year: int
+    length: int
+    start_ordinal: int
+    start_weekday: int
+    months: tuple[MonthInfo, ...]
+
+
+_MIN_YEAR, _MAX_YEAR = (d[0] for d in ummalqura.HIJRI_RANGE)
+_MONTH_LENGTHS = tuple(
+    ummalqura.MONTH_STARTS[i + 1] - ummalqura.MONTH_STARTS[i]
+    for i in range(len(ummalqura.MONTH_STARTS) - 1)
+)
+"""Number of days of each month, by index in ummalqura month starts."""
+_YEAR_LENGTHS = tuple(
+    ummalqura.MONTH_STARTS[i + 12] - ummalqura.MONTH_STARTS[i]
+    for i in range(0, len(ummalqura.MONTH_STARTS) - 1, 12)
+)
+"""Number of days of each year, by number of years since the first year."""
+
+
+def month_info(year: int, month: int) -> MonthInfo:
+    """Return metadata of a Hijri month.
+
+    Args:
+        year: Hijri year.
+        month: Hijri month.
+
+    Raises:
+        OverflowError: When ``year`` is out of supported Hijri range.
+        ValueError: When ``month`` is not within the range of `1-12`.
+    """
+    months = year_info(year).months
+    _check_month(month)
+    return months[month - 1]
+
+
+def month_length(year: int, month: int) -> int:
+    """Return number of days of a Hijri month, without building the index.
+
+    Args:
+        year: Hijri year.
+        month: Hijri month.
+
+    Raises:
+        OverflowError: When ``year`` is out of supported Hijri range.
+        ValueError: When ``month`` is not within the range of `1-12`.
+    """
+    if not (_MIN_YEAR <= year <= _MAX_YEAR and 1 <= month <= 12):  # noqa: PLR2004
+        _check_year(year)
+        _check_month(month)
+    return _MONTH_LENGTHS[(year - _MIN_YEAR) * 12 + month - 1]
+
+
+def year_info(year: int) -> YearInfo:
+    """Return metadata of a Hijri year.
+
+    Args:
+        year: Hijri year.
+
+    Raises:
+        OverflowError: When ``year`` is out of supported Hijri range.
+    """
+    _check_year(year)
+    return _get_index()[0][year - _MIN_YEAR]
+
+
+def years() -> tuple[YearInfo, ...]:
+    """Return metadata of all supported Hijri years, in ascending order."""
+    return _get_index()[0]
+
+
+def months() -> tuple[MonthInfo, ...]:
+    """Return metadata of all supported Hijri months, in ascending order."""
+    return _get_index()[1]
+
+
+def _check_year(year: int) -> None:
+    """Check if year is within supported Hijri range."""
+    if not _MIN_YEAR <= year <= _MAX_YEAR:
+        message = f"year must be in {_MIN_YEAR}-{_MAX_YEAR}, got '{year}'"
+        raise OverflowError(message)
+
+
+def _check_month(month: int) -> None:
+    """Check if month is within the range of 1-12."""
+    max_months = 12
+    if not 1 <= month <= max_months:
+        message = f"month must be in 1-{max_months}, got '{month}'"
+        raise ValueError(message)
+
+
+@helpers.build_once
+def _get_index() -> tuple[tuple[YearInfo, ...], tuple[MonthInfo, ...]]:
+    """Return metadata index of years and months, building it if not built yet."""
+    return _build_index()
+
+
+def _build_index() -> tuple[tuple[YearInfo, ...], tuple[MonthInfo, ...]]:
+    """Return a new metadata index of all supported Hijri years and months."""
+    month_starts = ummalqura.MONTH_STARTS
+    ordinal_offset = helpers.jdn_to_ordinal(helpers.rjd_to_jdn(0))
+    year_infos = []
+    for year_index, year in enumerate(range(_MIN_YEAR, _MAX_YEAR + 1)):
+        month_infos = []
+        for month in range(1, 13):
+            index = year_index * 12 + month - 1
+            start_ordinal = month_starts[index] + ordinal_offset
+            weekday = (start_ordinal + 6) % 7
+            length = _MONTH_LENGTHS[index]
+            month_infos.append(MonthInfo(year, month, length, start_ordinal, weekday))
+        first_month = month_infos[0]
+        year_infos.append(
+            YearInfo(
+                year,
+                _YEAR_LENGTHS[year_index],
+                first_month.start_ordinal,
+                first_month.start_weekday,
+                tuple(month_infos),
+            )
+        )
+    all_months = tuple(m for y in year_infos for m in y.months)
+    return tuple(year_infos), all_months
@@ -0,0 +1,405 @@
+"""Pandas extension type and accessor for Hijri dates.
+
+Importing this module registers the ``"hijri"`` extension dtype, backed by
+Gregorian date ordinals as 32-bit integers, and the ``.hijri`` accessor on
+Series of datetime or Hijri values. All operations are vectorized over the
+ummalqura month starts using :mod:`hijridate.batch`.
+
+This module requires the optional pandas dependency, which can be installed
+with ``pip install hijridate[pandas]``.
+"""
+
+import builtins
+import operator
+
+from collections.abc import Sequence
+from typing import Any
+
+from hijridate import batch, helpers, locales, ummalqura
+from hijridate.convert import Hijri
+
+try:
+    import numpy as np
+    import pandas as pd
+
+    from pandas.api.extensions import (
+        ExtensionArray,
+        ExtensionDtype,
+        register_extension_dtype,
+        register_series_accessor,
+    )
+except ImportError as error:  # pragma: no cover
+    message = "pandas integration requires pandas, install 'hijridate[pandas]'"
+    raise ImportError(message) from error
+
+_NA_ORDINAL = np.iinfo(np.int32).min
+
+
+@register_extension_dtype
+class HijriDtype(ExtensionDtype):  # type: ignore[misc]
+    """An extension dtype for Hijri dates, named ``"hijri"``."""
+
+    name = "hijri"
+    type = Hijri
+    kind = "O"
+    na_value = pd.NA
+
+    @classmethod
+    def construct_array_type(cls) -> builtins.type["HijriArray"]:
+        """Return the array type associated with this dtype."""
+        return HijriArray
+
+
+class HijriArray(ExtensionArray):  # type: ignore[misc]  # noqa: PLW1641
+    """An extension array of Hijri dates stored as Gregorian date ordinals.
+
+    Args:
+        ordinals: Gregorian date ordinals, where missing values are
+            represented by the minimum 32-bit integer.
+    """
+
+    def __init__(self, ordinals: Any):
+        self._ordinals = np.asarray(ordinals, dtype=np.int32)
+
+    @classmethod
+    def _from_sequence(
+        cls, scalars: Sequence[Any], *, dtype: Any = None, copy: bool = False
+    ) -> "HijriArray":
+        return cls([_to_ordinal(s) for s in scalars])
+
+    @classmethod
+    def _from_factorized(cls, values: Any, original: "HijriArray") -> "HijriArray":
+        return cls(values)
+
+    @classmethod
+    def from_gregorian(cls, values: Any) -> "HijriArray":
+        """Construct Hijri array from Gregorian ``datetime64`` values.
+
+        Args:
+            values: Array-like of ``datetime64`` values, where ``NaT`` values
+                become missing values.
+
+        Raises:
+            OverflowError: When any date is out of supported Gregorian range.
+        """
+        dates = pd.DatetimeIndex(values)
+        if dates.tz is not None:
+            dates = dates.tz_localize(None)
+        mask = dates.isna()
+        days = dates.to_numpy("datetime64[D]").astype(np.int64)
+        ordinals = np.where(mask, _NA_ORDINAL, days + batch._EPOCH_ORDINAL)
+        if not mask.all():
+            batch.gregorian_to_hijri(ordinals[~mask])  # check range
+        return cls(ordinals)
+
+    @property
+    def dtype(self) -> HijriDtype:
+        """Return the dtype of array."""
+        return HijriDtype()
+
+    @property
+    def nbytes(self) -> int:
+        """Return number of bytes consumed by array."""
+        return int(self._ordinals.nbytes)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __getitem__(self, item: Any) -> Any:
+        if isinstance(item, int | np.integer):
+            ordinal = int(self._ordinals[item])
+            if ordinal == _NA_ORDINAL:
+                return pd.NA
+            return Hijri.fromordinal(ordinal)
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._ordinals[item])
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = pd.api.indexers.check_array_indexer(self, key)
+        if isinstance(value, HijriArray):
+            self._ordinals[key] = value._ordinals
+        elif pd.api.types.is_list_like(value):
+            self._ordinals[key] = [_to_ordinal(v) for v in value]
+        else:
+            self._ordinals[key] = _to_ordinal(value)
+
+    def _cmp_method(self, other: Any, op: Any) -> Any:
+        if isinstance(other, pd.Series | pd.Index | pd.DataFrame):
+            return NotImplemented
+        other_ordinals: Any
+        if isinstance(other, HijriArray):
+            other_ordinals = other._ordinals
+            mask = self.isna() | other.isna()
+        elif isinstance(other, Hijri):
+            other_ordinals = helpers.jdn_to_ordinal(other.to_julian())
+            mask = self.isna()
+        elif op is operator.eq or op is operator.ne:
+            return np.full(len(self), op is operator.ne)
+        else:
+            return NotImplemented
+        result = op(self._ordinals, other_ordinals)
+        return np.where(mask, op is operator.ne, result)
+
+    def __eq__(self, other: object) -> Any:
+        return self._cmp_method(other, operator.eq)
+
+    def __ne__(self, other: object) -> Any:
+        return self._cmp_method(other, operator.ne)
+
+    def __lt__(self, other: object) -> Any:
+        return self._cmp_method(other, operator.lt)
+
+    def __le__(self, other: object) -> Any:
+        return self._cmp_method(other, operator.le)
+
+    def __gt__(self, other: object) -> Any:
+        return self._cmp_method(other, operator.gt)
+
+    def __ge__(self, other: object) -> Any:
+        return self._cmp_method(other, operator.ge)
+
+    def isna(self) -> Any:
+        """Return boolean array indicating missing values."""
+        return self._ordinals == _NA_ORDINAL
+
+    def take(
+        self,
+        indices: Sequence[int],
+        *,
+        allow_fill: bool = False,
+        fill_value: Any = None,
+    ) -> "HijriArray":
+        """Return array of elements at given indices."""
+        fill_value = _to_ordinal(fill_value) if allow_fill else _NA_ORDINAL
+        result = pd.api.extensions.take(
+            self._ordinals, indices, allow_fill=allow_fill, fill_value=fill_value
+        )
+        return type(self)(result)
+
+    def copy(self) -> "HijriArray":
+        """Return a copy of array."""
+        return type(self)(self._ordinals.copy())
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence["HijriArray"]) -> "HijriArray":
+        return cls(np.concatenate([a._ordinals for a in to_concat]))
+
+    def _values_for_factorize(self) -> tuple[Any, int]:
+        return self._ordinals, _NA_ORDINAL
+
+    def _values_for_argsort(self) -> Any:
+        return self._ordinals
+
+    def _reduce(
+        self, name: str, *, skipna: bool = True, keepdims: bool = False, **kwargs: Any
+    ) -> Any:
+        if name not in {"min", "max"}:
+            return super()._reduce(name, skipna=skipna, keepdims=keepdims, **kwargs)
+        mask = self.isna()
+        if mask.all() or (not skipna and mask.any()):
+            result: Any = pd.NA
+            ordinal = _NA_ORDINAL
+        else:
+            valid_ordinals = self._ordinals[~mask]
+            ordinal = int(getattr(valid_ordinals, name)())
+            result = Hijri.fromordinal(ordinal)
+        if keepdims:
+            return type(self)([ordinal])
+        return result
+
+    def to_gregorian(self) -> Any:
+        """Return Gregorian dates as ``datetime64[D]`` array with ``NaT`` values."""
+        days = self._ordinals.astype(np.int64) - batch._EPOCH_ORDINAL
+        days[self.isna()] = np.iinfo(np.int64).min
+        return days.astype("datetime64[D]")
+
+    def ordinals(self) -> Any:
+        """Return Gregorian date ordinals as 32-bit integer array."""
+        return self._ordinals.copy()
+
+
+def _to_ordinal(value: Any) -> int:
+    """Return Gregorian date ordinal of a Hijri object or a missing value.
+
+    Raises:
+        TypeError: When ``value`` is neither a Hijri object nor missing.
+    """
+    if isinstance(value, Hijri):
+        return helpers.jdn_to_ordinal(value.to_julian())
+    if value is None or pd.isna(value):
+        return _NA_ORDINAL
+    message = f"value must be a Hijri object or missing, got '{value}'"
+    raise TypeError(message)
+
+
+def _digit_codes(values: Any, width: int, *, padding: bool = True) -> Any:
+    """Return Unicode code points of decimal digits of positive integers.
+
+    Args:
+        values: Positive integers of at most ``width`` digits.
+        width: Number of digits, where smaller values are padded with zeros.
+        padding: Whether to keep padding zeros, or else replace them with
+            null code points that are dropped by :func:`_codes_to_strings`.
+    """
+    powers = 10 ** np.arange(width - 1, -1, -1)
+    numbers = np.asarray(values, dtype=np.int64)[:, np.newaxis]
+    codes = (numbers // powers % 10 + ord("0")).astype(np.uint32)
+    if not padding:
+        codes[numbers < powers] = 0
+    return codes
+
+
+def _join_codes(*columns: Any, separator: str) -> Any:
+    """Return code points of digit columns joined by separator code points."""
+    separator_codes = np.array([ord(c) for c in separator], dtype=np.uint32)
+    separators = np.broadcast_to(separator_codes, (len(columns[0]), len(separator)))
+    parts = [columns[0]]
+    for column in columns[1:]:
+        parts += [separators, column]
+    return np.concatenate(parts, axis=1)
+
+
+def _codes_to_strings(codes: Any) -> Any:
+    """Return strings of rows of Unicode code points, dropping null code points."""
+    if (codes == 0).any():
+        order = np.argsort(codes == 0, axis=1, kind="stable")
+        codes = np.take_along_axis(codes, order, axis=1)
+    width = codes.shape[1]
+    return np.ascontiguousarray(codes).view(f"<U{width}").ravel()
+
+
+@register_series_accessor("hijri")
+class HijriAccessor:
+    """Accessor of Hijri date properties for Series of datetime or Hijri values.
+
+    Properties and methods return Series with the same index, where missing
+    dates result in missing values.
+
+    Raises:
+        AttributeError: When Series values are not datetime or Hijri values.
+    """
+
+    def __init__(self, series: pd.Series):
+        if isinstance(series.dtype, HijriDtype):
+            array = series.array
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+            array = HijriArray.from_gregorian(series)
+        else:
+            message = "can only use .hijri accessor with datetime or hijri values"
+            raise AttributeError(message)
+        self._series = series
+        self._array: HijriArray = array
+        self._mask = array.isna()
+        valid_ordinals = array._ordinals[~self._mask]
+        self._fields = batch.gregorian_to_hijri(valid_ordinals)
+
+    @property
+    def year(self) -> pd.Series:
+        """Return Hijri years."""
+        return self._integers(self._fields.year)
+
+    @property
+    def month(self) -> pd.Series:
+        """Return Hijri months."""
+        return self._integers(self._fields.month)
+
+    @property
+    def day(self) -> pd.Series:
+        """Return Hijri days."""
+        return self._integers(self._fields.day)
+
+    def to_hijri(self) -> pd.Series:
+        """Return Series of Hijri dates with the ``"hijri"`` dtype."""
+        return self._wrap(self._array)
+
+    def to_gregorian(self) -> pd.Series:
+        """Return Series of Gregorian dates with ``datetime64`` dtype."""
+        return self._wrap(self._array.to_gregorian().astype("datetime64[s]"))
+
+    def month_length(self) -> pd.Series:
+        """Return number of days in Hijri months."""
+        index = self._month_indexes()
+        return self._integers(batch._MONTH_LENGTHS[index])
+
+    def year_length(self) -> pd.Series:
+        """Return number of days in Hijri years."""
+        first_index = self._month_indexes() - self._fields.month + 1
+        starts = batch._MONTH_STARTS
+        return self._integers(starts[first_index + 12] - starts[first_index])
+
+    def weekday(self) -> pd.Series:
+        """Return day of week, where Monday is 0 and Sunday is 6."""
+        valid_ordinals = self._array._ordinals[~self._mask].astype(np.int64)
+        return self._integers((valid_ordinals + 6) % 7)
+
+    def isoweekday(self) -> pd.Series:
+        """Return day of week, where Monday is 1 and Sunday is 7."""
+        return self.weekday() + 1
+
+    def month_name(self, language: locales.Language = "en") -> pd.Series:
+        """Return Hijri month names.
+
+        Args:
+            language: Two-letter language code for localized month names.
+        """
+        names = np.array(locales.get_locale(language).month_names, dtype=object)
+        return self._strings(names[self._fields.month - 1])
+
+    def day_name(self, language: locales.Language = "en") -> pd.Series:
+        """Return day names.
+
+        Args:
+            language: Two-letter language code for localized day names.
+        """
+        names = np.array(locales.get_locale(language).day_names, dtype=object)
+        weekday = self._array._ordinals[~self._mask].astype(np.int64)
+        return self._strings(names[(weekday + 6) % 7])
+
+    def isoformat(self) -> pd.Series:
+        """Return Hijri dates in ISO format i.e. ``YYYY-MM-DD``."""
+        fields = self._fields
+        codes = _join_codes(
+            _digit_codes(fields.year, 4),
+            _digit_codes(fields.month, 2),
+            _digit_codes(fields.day, 2),
+            separator="-",
+        )
+        return self._strings(_codes_to_strings(codes))
+
+    def dmyformat(self, separator: str = "/", *, padding: bool = True) -> pd.Series:
+        """Return Hijri dates in day-month-year format (``DD/MM/YYYY`` by default).
+
+        Args:
+            separator: String that separates the day, month, and year values.
+            padding: Whether to add a leading zero as a padding character to
+                fill day and month values when less than 10.
+        """
+        fields = self._fields
+        codes = _join_codes(
+            _digit_codes(fields.day, 2, padding=padding),
+            _digit_codes(fields.month, 2, padding=padding),
+            _digit_codes(fields.year, 4),
+            separator=separator,
+        )
+        return self._strings(_codes_to_strings(codes))
+
+    def _month_indexes(self) -> Any:
+        """Return indexes of Hijri months in ummalqura month starts."""
+        months = (self._fields.year - 1) * 12 + self._fields.month - 1
+        return months - ummalqura.HIJRI_OFFSET
+
+    def _wrap(self, values: Any) -> pd.Series:
+        """Return Series of values with the index and name of original Series."""
+        return pd.Series(values, index=self._series.index, name=self._series.name)
+
+    def _integers(self, valid_values: Any) -> pd.Series:
+        """Return Series of nullable integers from values of non-missing dates."""
+        values = np.zeros(len(self._mask), dtype=np.int64)
+        values[~self._mask] = valid_values
+        return self._wrap(pd.arrays.IntegerArray(values, self._mask.copy()))
+
+    def _strings(self, valid_values: Any) -> pd.Series:
+        """Return Series of nullable strings from values of non-missing dates."""
+        values = np.full(len(self._mask), None, dtype=object)
+        values[~self._mask] = valid_values
+        return self._wrap(pd.array(values, dtype="string"))
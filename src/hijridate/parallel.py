@@ -0,0 +1,205 @@
+"""Parallel conversion of large collections of dates using worker processes.
+
+Dates are split into chunks, which are converted by a pool of worker
+processes while keeping the input order. Workers converting date objects
+enable the lookup table engine once when they start, and the ummalqura
+tables are imported by workers rather than sent with tasks, so each task
+carries only a compact array of day numbers and returns a compact array of
+results.
+
+Workers are started with the ``forkserver`` method where available, and
+``spawn`` elsewhere, so they never inherit the threads or locks of the
+parent process.
+
+Parallel conversion pays off for collections of millions of dates on
+multi-core machines. Date objects are still read and created one by one in
+the parent process, which bounds the speedup, so NumPy arrays of ordinals or
+``datetime64`` values are converted to packed Hijri year, month and day
+arrays instead (see :mod:`hijridate.batch`).
+"""
+
+import datetime
+import multiprocessing
+import os
+
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar, overload
+
+from hijridate import helpers, lookup, ummalqura
+from hijridate.convert import Gregorian, Hijri
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from hijridate import batch
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+"""Start method of worker processes, which never forks the parent process."""
+
+_RJD_OFFSET = helpers.jdn_to_rjd(helpers.ordinal_to_jdn(0))
+"""Difference between Reduced Julian Day numbers and Gregorian date ordinals."""
+
+
+@overload
+def gregorian_to_hijri(
+    dates: "npt.NDArray[Any]",
+    *,
+    chunk_size: int = ...,
+    max_workers: int | None = ...,
+) -> "batch.HijriArrays": ...
+
+
+@overload
+def gregorian_to_hijri(
+    dates: Iterable[datetime.date],
+    *,
+    chunk_size: int = ...,
+    max_workers: int | None = ...,
+) -> Iterator[Hijri]: ...
+
+
+def gregorian_to_hijri(
+    dates: "Iterable[datetime.date] | npt.NDArray[Any]",
+    *,
+    chunk_size: int = 100_000,
+    max_workers: int | None = None,
+) -> "Iterator[Hijri] | batch.HijriArrays":
+    """Convert Gregorian dates to Hijri dates using worker processes.
+
+    Dates are consumed lazily, one chunk per task, with at most two tasks
+    per worker in flight, so any iterable (e.g. a generator of database
+    rows) can be converted with bounded memory usage.
+
+    NumPy arrays are converted by the workers with :mod:`hijridate.batch`,
+    without creating any date objects, and the results are returned as
+    arrays rather than an iterator.
+
+    Args:
+        dates: Iterable of Gregorian dates, as ``datetime.date`` or
+            :obj:`hijridate.convert.Gregorian` objects, or a NumPy array of
+            Gregorian date ordinals or ``datetime64`` values.
+        chunk_size: Number of dates converted by each task.
+        max_workers: Number of worker processes, which defaults to the
+            number of CPUs.
+
+    Returns:
+        An iterator of Hijri objects, in the same order as the input dates,
+        or Hijri year, month and day arrays for a NumPy array of dates.
+
+    Raises:
+        OverflowError: When any date is out of supported Gregorian range.
+        TypeError: When a NumPy array is not of integer or ``datetime64`` type.
+        ValueError: When ``chunk_size`` or ``max_workers`` is not positive.
+    """
+    _check_positive("chunk_size", chunk_size)
+    max_workers = _get_max_workers(max_workers)
+    if hasattr(dates, "dtype"):
+        return _array_to_hijri(dates, chunk_size, max_workers)  # type: ignore[arg-type]
+    chunks = (
+        array("l", [d.toordinal() for d in chunk])
+        for chunk in _chunked(dates, chunk_size)
+    )
+    results = _imap(_ordinals_to_keys, chunks, max_workers, initializer=lookup.enable)
+    return _keys_to_hijri(results)
+
+
+def _array_to_hijri(
+    dates: "npt.NDArray[Any]", chunk_size: int, max_workers: int
+) -> "batch.HijriArrays":
+    """Convert a NumPy array of dates to Hijri arrays using worker processes."""
+    import numpy as np  # noqa: PLC0415
+
+    from hijridate import batch  # noqa: PLC0415
+
+    ordinals = batch._to_ordinals(dates)
+    chunks = (
+        ordinals[start : start + chunk_size]
+        for start in range(0, len(ordinals), chunk_size)
+    )
+    results = list(_imap(batch.gregorian_to_hijri, chunks, max_workers))
+    if not results:
+        return batch.gregorian_to_hijri(ordinals)
+    return batch.HijriArrays(*(np.concatenate(c) for c in zip(*results, strict=True)))
+
+
+def _keys_to_hijri(results: Iterator["array[int]"]) -> Iterator[Hijri]:
+    """Yield Hijri objects from arrays of packed Hijri year, month and day."""
+    for keys in results:
+        for key in keys:
+            yield Hijri(key >> 9, (key >> 5) & 15, key & 31, validate=False)
+
+
+def _ordinals_to_keys(ordinals: "array[int]") -> "array[int]":
+    """Convert Gregorian date ordinals to packed Hijri year, month and day.
+
+    Raises:
+        OverflowError: When any date is out of supported Gregorian range.
+    """
+    min_rjd, max_rjd = ummalqura.RJD_RANGE
+    fromrjd = Hijri._fromrjd
+    keys = array("L")
+    for ordinal in ordinals:
+        rjd = ordinal + _RJD_OFFSET
+        if not min_rjd <= rjd <= max_rjd:
+            Gregorian.fromordinal(ordinal)._check_range()
+        hijri = fromrjd(rjd)
+        keys.append((hijri._year << 9) | (hijri._month << 5) | hijri._day)
+    return keys
+
+
+def _chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield lists of up to ``size`` items from an iterable."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _imap(
+    func: Callable[[T], R],
+    chunks: Iterable[T],
+    max_workers: int,
+    *,
+    initializer: Callable[[], object] | None = None,
+) -> Iterator[R]:
+    """Yield results of a function applied to chunks by worker processes.
+
+    Results are yielded in the order of chunks, with at most two chunks per
+    worker in flight. Each worker calls ``initializer``, if given, when it
+    starts.
+    """
+    with ProcessPoolExecutor(
+        max_workers,
+        mp_context=multiprocessing.get_context(_START_METHOD),
+        initializer=initializer,
+    ) as executor:
+        pending: deque[Future[R]] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= max_workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _get_max_workers(max_workers: int | None) -> int:
+    """Return the number of worker processes, defaulting to the number of CPUs."""
+    if max_workers is None:
+        return os.cpu_count() or 1
+    _check_positive("max_workers", max_workers)
+    return max_workers
+
+
+def _check_positive(name: str, value: int) -> None:
+    """Check if an argument is a positive integer."""
+    if value < 1:
+        message = f"{name} must be a positive integer, got '{value}'"
+        raise ValueError(message)
@@ -0,0 +1,278 @@
+"""Bulk parsing of Hijri date strings."""
+
+import functools
+import re
+
+from array import array
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+from hijridate import helpers, locales, metadata, ummalqura
+from hijridate.convert import Hijri
+
+Parser = Callable[[str], tuple[int, int, int] | None]
+
+
+class Rejected(NamedTuple):
+    """A rejected row of bulk parsing with the reason of rejection."""
+
+    row: int
+    value: str
+    reason: str
+
+
+class ParsedDates(NamedTuple):
+    """Result of bulk parsing as packed Hijri year, month and day columns.
+
+    The columns contain accepted rows only, in their original order, while
+    rejected rows are reported separately with their row indexes and reasons.
+    """
+
+    year: "array[int]"
+    month: "array[int]"
+    day: "array[int]"
+    rejected: list[Rejected]
+
+    def dates(self) -> list[Hijri]:
+        """Return accepted rows as a list of Hijri objects."""
+        return [
+            Hijri(y, m, d, validate=False)
+            for y, m, d in zip(self.year, self.month, self.day, strict=True)
+        ]
+
+
+_day_map = {f"{d:02}": d for d in range(1, 32)}
+
+
+def parse_isoformat(data: Iterable[str] | str | bytes) -> ParsedDates:
+    """Parse Hijri dates in ISO format ``YYYY-MM-DD`` in bulk.
+
+    Each date is validated as :obj:`hijridate.convert.Hijri` objects are, but
+    invalid dates are collected with the reason of rejection instead of
+    raising an exception.
+
+    Args:
+        data: Iterable of ISO formatted Hijri date strings (e.g. a list,
+            a file object, or a NumPy array of ``str`` or ``bytes`` dtype), or
+            a string or bytes buffer of newline-separated dates, so a single
+            date string is parsed as one date. Surrounding whitespace is
+            ignored.
+    """
+    month_map = _get_month_map()
+    day_map = _day_map
+    if isinstance(data, str):
+        data = data.splitlines()
+    elif isinstance(data, bytes | bytearray | memoryview):
+        data = bytes(data).decode("latin-1").splitlines()
+    elif getattr(getattr(data, "dtype", None), "kind", None) == "S":
+        # NumPy arrays of bytes dtype are decoded like bytes buffers
+        data = [item.decode("latin-1") for item in data.tolist()]  # type: ignore[attr-defined]
+    years, months, days = array("H"), array("B"), array("B")
+    rejected = []
+
+    for index, item in enumerate(data):
+        text = item.strip()
+        month_info = month_map.get(text[:7])
+        day = day_map.get(text[8:])
+        if (
+            month_info is not None
+            and day is not None
+            and day <= month_info[2]
+            and text[7:8] == "-"
+        ):
+            years.append(month_info[0])
+            months.append(month_info[1])
+            days.append(day)
+        else:
+            rejected.append(Rejected(index, text, _rejection_reason(text)))
+
+    return ParsedDates(years, months, days, rejected)
+
+
+def parse_format(data: Iterable[str], fmt: str, language: str = "en") -> ParsedDates:
+    """Parse Hijri dates using a format string in bulk.
+
+    The format string is compiled once (see :func:`compile_format`), and each
+    date is validated as :obj:`hijridate.convert.Hijri` objects are, but
+    invalid dates are collected with the reason of rejection instead of
+    raising an exception.
+
+    Args:
+        data: Iterable of Hijri date strings (e.g. a list or a file object).
+            Surrounding whitespace is ignored.
+        fmt: Format string of directives and literal text, e.g. ``"%d %B %Y"``.
+        language: Two-letter language code for localized names.
+
+    Raises:
+        ValueError: When ``fmt`` is not valid, or when ``language`` is not
+            supported.
+    """
+    parse = compile_format(fmt, language)
+    month_length = metadata.month_length
+    years, months, days = array("H"), array("B"), array("B")
+    rejected = []
+
+    for index, item in enumerate(data):
+        text = item.strip()
+        fields = parse(text)
+        if fields is None:
+            reason = f"date string does not match format '{fmt}': '{text}'"
+            rejected.append(Rejected(index, text, reason))
+            continue
+        year, month, day = fields
+        try:
+            valid = 1 <= day <= month_length(year, month)
+        except (OverflowError, ValueError):
+            valid = False
+        if valid:
+            years.append(year)
+            months.append(month)
+            days.append(day)
+        else:
+            rejected.append(Rejected(index, text, _validation_error(year, month, day)))
+
+    return ParsedDates(years, months, days, rejected)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_format(fmt: str, language: str = "en") -> Parser:
+    """Return a function that parses Hijri date strings using a format string.
+
+    The returned function returns a (year, month, day) tuple of a date
+    string, without validating the date, or ``None`` when the date string
+    does not match the format. Compiled parsers are cached, so calling this
+    function again with the same arguments returns the same parser.
+
+    The directives are those of :mod:`hijridate.formatting`. Numbers may be
+    written in any decimal digits (e.g. Arabic-Indic digits), names are
+    matched ignoring case, and whitespace matches any run of whitespace.
+    Weekday names are matched but not checked against the date.
+
+    Args:
+        fmt: Format string of directives and literal text, e.g. ``"%d %B %Y"``.
+        language: Two-letter language code for localized names.
+
+    Raises:
+        ValueError: When ``fmt`` has an unsupported or duplicated directive,
+            or lacks a year, month, or day directive, or when ``language``
+            is not supported.
+    """
+    locale = locales.get_locale(language)
+    patterns = {
+        "Y": r"(?P<Y>\d{4})",
+        "m": r"(?P<m>\d{1,2})",
+        "d": r"(?P<d>\d{1,2})",
+        "B": f"(?:{_names_pattern(locale.month_names, group='B')})",
+        "A": f"(?P<A>{_names_pattern(locale.day_names)})",
+        "a": f"(?P<a>{_names_pattern(locale.abbreviated_day_names)})",
+        "E": _names_pattern([locale.notation]),
+    }
+    parts: list[str] = []
+    directives: set[str] = set()
+    chars = iter(fmt)
+    for char in chars:
+        if char.isspace():
+            # a run of whitespace in format matches any run of whitespace
+            if not parts or parts[-1] != r"\s+":
+                parts.append(r"\s+")
+            continue
+        if char != "%":
+            parts.append(re.escape(char))
+            continue
+        directive = next(chars, "")
+        if directive == "%":
+            parts.append("%")
+            continue
+        if not directive:
+            message = f"stray '%' at end of format, got '{fmt}'"
+            raise ValueError(message)
+        if directive not in patterns:
+            message = f"unsupported format directive, got '%{directive}'"
+            raise ValueError(message)
+        month_directives = {"m", "B"}
+        if directive in directives or (
+            directive in month_directives and directives & month_directives
+        ):
+            message = f"duplicated format directive, got '%{directive}'"
+            raise ValueError(message)
+        directives.add(directive)
+        parts.append(patterns[directive])
+    if not ("Y" in directives and "d" in directives and directives & {"m", "B"}):
+        message = f"format must have year, month and day directives, got '{fmt}'"
+        raise ValueError(message)
+
+    fullmatch = re.compile("".join(parts), re.IGNORECASE).fullmatch
+    if "m" in directives:
+
+        def parse(text: str) -> tuple[int, int, int] | None:
+            match = fullmatch(text)
+            if match is None:
+                return None
+            return int(match["Y"]), int(match["m"]), int(match["d"])
+
+    else:
+        # each month name has its own group, as case-insensitive matching
+        # differs from case folding of matched names (e.g. Turkish dotted I)
+        month_groups = [f"B{i}" for i in range(1, len(locale.month_names) + 1)]
+
+        def parse(text: str) -> tuple[int, int, int] | None:
+            match = fullmatch(text)
+            if match is None:
+                return None
+            names = match.group(*month_groups)
+            month = next(i for i, name in enumerate(names, 1) if name is not None)
+            return int(match["Y"]), month, int(match["d"])
+
+    return parse
+
+
+def _names_pattern(names: Iterable[str], group: str | None = None) -> str:
+    """Return regex alternation of names, where whitespace matches any run.
+
+    With a group name, each name is captured by a group of that name
+    followed by the position of the name, starting from 1.
+    """
+    escaped = [r"\s+".join(map(re.escape, n.split())) for n in names]
+    # longer names first, so a name is not matched by its prefix
+    order = sorted(range(len(escaped)), key=lambda i: len(escaped[i]), reverse=True)
+    if group is None:
+        return "|".join(escaped[i] for i in order)
+    return "|".join(f"(?P<{group}{i + 1}>{escaped[i]})" for i in order)
+
+
+def _validation_error(year: int, month: int, day: int) -> str:
+    """Return the validation error message of Hijri date values."""
+    try:
+        Hijri(year, month, day)
+    except (OverflowError, ValueError) as error:
+        return str(error)
+    return f"invalid date: {year}-{month}-{day}"  # pragma: no cover
+
+
+@helpers.build_once
+def _get_month_map() -> dict[str, tuple[int, int, int]]:
+    """Return map of ``YYYY-MM`` strings to Hijri year, month and month length."""
+    return _build_month_map()
+
+
+def _build_month_map() -> dict[str, tuple[int, int, int]]:
+    """Return a new map of ``YYYY-MM`` strings to Hijri year, month and length."""
+    month_starts = ummalqura.MONTH_STARTS
+    month_map = {}
+    for index in range(len(month_starts) - 1):
+        years, month = divmod(index + ummalqura.HIJRI_OFFSET, 12)
+        length = month_starts[index + 1] - month_starts[index]
+        month_map[f"{years + 1:04}-{month + 1:02}"] = (years + 1, month + 1, length)
+    return month_map
+
+
+def _rejection_reason(text: str) -> str:
+    """Return the reason why a date string is rejected."""
+    parts = text.split("-")
+    if len(parts) != 3 or not all(p.isascii() and p.isdigit() for p in parts):  # noqa: PLR2004
+        return f"invalid isoformat string: '{text}'"
+    try:
+        Hijri(*map(int, parts))
+    except (OverflowError, ValueError) as error:
+        return str(error)
+    return f"invalid isoformat string: '{text}'"
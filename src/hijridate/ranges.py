@@ -0,0 +1,133 @@
+"""Lazy iteration over ranges of Hijri and Gregorian dates."""
+
+import calendar
+import datetime
+
+from collections.abc import Iterator
+from typing import Literal, get_args
+
+from hijridate import ummalqura
+from hijridate.convert import Gregorian, Hijri
+
+Unit = Literal["days", "months", "years"]
+
+
+def hijri_range(
+    start: Hijri, stop: Hijri, step: int = 1, *, unit: Unit = "days"
+) -> Iterator[Hijri]:
+    """Return an iterator of Hijri dates from start up to, but not including, stop.
+
+    Dates are generated by walking the ummalqura month starts incrementally,
+    so memory usage is constant regardless of the length of range. When
+    stepping by months or years, days that do not exist in a month are
+    clamped to the last day of month.
+
+    Args:
+        start: First Hijri date of range.
+        stop: Hijri date at which the range ends (exclusive).
+        step: Number of units between dates, which can be negative.
+        unit: Unit of ``step``, one of ``"days"``, ``"months"``, or
+            ``"years"``.
+
+    Raises:
+        ValueError: When ``step`` is zero or ``unit`` is not supported.
+    """
+    _check_step(step, unit)
+    if unit == "days":
+        return _hijri_days(start, stop, step)
+    if unit == "years":
+        step *= 12
+    return _hijri_months(start, stop, step)
+
+
+def gregorian_range(
+    start: datetime.date, stop: datetime.date, step: int = 1, *, unit: Unit = "days"
+) -> Iterator[Gregorian]:
+    """Return an iterator of Gregorian dates from start up to, but not including, stop.
+
+    When stepping by months or years, days that do not exist in a month are
+    clamped to the last day of month.
+
+    Args:
+        start: First Gregorian date of range.
+        stop: Gregorian date at which the range ends (exclusive).
+        step: Number of units between dates, which can be negative.
+        unit: Unit of ``step``, one of ``"days"``, ``"months"``, or
+            ``"years"``.
+
+    Raises:
+        ValueError: When ``step`` is zero or ``unit`` is not supported.
+    """
+    _check_step(step, unit)
+    if unit == "days":
+        return _gregorian_days(start, stop, step)
+    if unit == "years":
+        step *= 12
+    return _gregorian_months(start, stop, step)
+
+
+def _check_step(step: int, unit: str) -> None:
+    """Check if step and unit of range are valid."""
+    if step == 0:
+        message = "step must not be zero"
+        raise ValueError(message)
+    if unit not in get_args(Unit):
+        message = f"unit must be one of {get_args(Unit)}, got '{unit}'"
+        raise ValueError(message)
+
+
+def _hijri_days(start: Hijri, stop: Hijri, step: int) -> Iterator[Hijri]:
+    """Yield Hijri dates stepping by days."""
+    month_starts = ummalqura.MONTH_STARTS
+    rjd, stop_rjd = start._rjd(), stop._rjd()
+    index = start._month_index()
+    year, month = start.year, start.month
+    while rjd < stop_rjd if step > 0 else rjd > stop_rjd:
+        if not month_starts[index] <= rjd < month_starts[index + 1]:
+            while rjd >= month_starts[index + 1]:
+                index += 1
+            while rjd < month_starts[index]:
+                index -= 1
+            years, month = divmod(index + ummalqura.HIJRI_OFFSET, 12)
+            year, month = years + 1, month + 1
+        yield Hijri(year, month, rjd - month_starts[index] + 1, validate=False)
+        rjd += step
+
+
+def _hijri_months(start: Hijri, stop: Hijri, step: int) -> Iterator[Hijri]:
+    """Yield Hijri dates stepping by months."""
+    month_starts = ummalqura.MONTH_STARTS
+    last_index = len(month_starts) - 2
+    index = start._month_index()
+    while 0 <= index <= last_index:
+        years, month = divmod(index + ummalqura.HIJRI_OFFSET, 12)
+        day = min(start.day, month_starts[index + 1] - month_starts[index])
+        date = Hijri(years + 1, month + 1, day, validate=False)
+        if not (date < stop if step > 0 else date > stop):
+            return
+        yield date
+        index += step
+
+
+def _gregorian_days(
+    start: datetime.date, stop: datetime.date, step: int
+) -> Iterator[Gregorian]:
+    """Yield Gregorian dates stepping by days."""
+    for ordinal in range(start.toordinal(), stop.toordinal(), step):
+        yield Gregorian.fromordinal(ordinal)
+
+
+def _gregorian_months(
+    start: datetime.date, stop: datetime.date, step: int
+) -> Iterator[Gregorian]:
+    """Yield Gregorian dates stepping by months."""
+    index = start.year * 12 + start.month - 1
+    min_index, max_index = datetime.MINYEAR * 12, datetime.MAXYEAR * 12 + 11
+    while min_index <= index <= max_index:
+        year, month = divmod(index, 12)
+        day = min(start.day, calendar.monthrange(year, month + 1)[1])
+        date = Gregorian(year, month + 1, day)
+        if not (date < stop if step > 0 else date > stop):
+            return
+        yield date
+        index += step
@@ -0,0 +1,86 @@
+"""Compact binary encoding of Hijri dates in bulk.
+
+Each date is encoded as the number of days since the first supported day
+(1 Muharram 1343) as a little-endian unsigned 16-bit integer, the same as
+:meth:`hijridate.convert.Hijri.tobytes`, so a sequence of dates takes two
+bytes per date. The encoding is stable across versions and platforms.
+"""
+
+import sys
+
+from array import array
+from collections.abc import Iterable
+
+from hijridate import helpers, lookup, ummalqura
+from hijridate.convert import Hijri
+
+_FIRST_RJD = ummalqura.RJD_RANGE[0]
+_DAY_COUNT = ummalqura.RJD_RANGE[1] - _FIRST_RJD + 1
+
+
+def encode(dates: Iterable[Hijri]) -> bytes:
+    """Encode Hijri dates as two bytes per date.
+
+    Args:
+        dates: Iterable of Hijri objects.
+
+    Raises:
+        OverflowError: When any date is out of supported Hijri range.
+        ValueError: When month or day of any date is not valid.
+    """
+    daynumbers = array("H", [d._daynumber() for d in dates])
+    if sys.byteorder == "big":  # pragma: no cover
+        daynumbers.byteswap()
+    return daynumbers.tobytes()
+
+
+def decode(data: bytes) -> list[Hijri]:
+    """Decode Hijri dates encoded by :func:`encode`.
+
+    Decoding uses the table of :mod:`hijridate.lookup`, which is built on
+    first use if the lookup table engine is not enabled.
+
+    Args:
+        data: Bytes-like object of encoded dates.
+
+    Raises:
+        ValueError: When length of ``data`` is not a multiple of two bytes.
+        OverflowError: When any encoded day is out of supported Hijri range.
+    """
+    if len(data) % 2:
+        message = f"data length must be a multiple of 2, got {len(data)}"
+        raise ValueError(message)
+    daynumbers = array("H")
+    daynumbers.frombytes(data)
+    if sys.byteorder == "big":  # pragma: no cover
+        daynumbers.byteswap()
+    if daynumbers and max(daynumbers) >= _DAY_COUNT:
+        message = "date value out of range"
+        raise OverflowError(message)
+    table = lookup._get_table()
+    months = _get_months()
+    return [
+        Hijri(year, month, n - offset, validate=False)
+        for n in daynumbers
+        for year, month, offset in (months[table[n]],)
+    ]
+
+
+@helpers.build_once
+def _get_months() -> list[tuple[int, int, int]]:
+    """Return Hijri year, month, and day number offset of each month index.
+
+    The Hijri day of a day number is the day number minus the offset.
+    """
+    return _build_months()
+
+
+def _build_months() -> list[tuple[int, int, int]]:
+    """Return a new list of Hijri year, month, and day number offset of months."""
+    month_starts = ummalqura.MONTH_STARTS
+    months = []
+    for index in range(len(month_starts) - 1):
+        year, month = divmod(index + ummalqura.HIJRI_OFFSET, 12)
+        offset = month_starts[index] - _FIRST_RJD - 1
+        months.append((year + 1, month + 1, offset))
+    return months
@@ -0,0 +1,385 @@
+"""Local HTTP/JSON server for converting dates in coalesced batches.
+
+Usage::
+
+    python -m hijridate.server                          # http://127.0.0.1:8000
+    python -m hijridate.server --port 9000 --window 2   # 2 ms coalescing window
+
+Services in other languages can convert ISO formatted dates by sending
+``POST /convert`` requests with a JSON object of a single date or a list of
+dates, and the calendar to convert to (``"hijri"`` by default)::
+
+    {"date": "1982-12-02"}                        ->  {"date": "1403-02-17"}
+    {"dates": ["1403-02-17"], "to": "gregorian"}  ->  {"dates": ["1982-12-02"]}
+
+Requests arriving within a short window are coalesced, so dates of all
+concurrent requests are converted together in one batch by
+:func:`hijridate.cli.convert_values`, a single lookup per date in maps of
+all supported days built when the server starts. By default, the window is a
+single iteration of the event loop, which coalesces requests that arrive
+together without delaying any request.
+
+Dates of a batch that are not valid or out of supported range are converted
+to ``null``, while an invalid single date is answered with status 400 and the
+reason. Counters of requests, dates, batches, latency, and throughput are
+served by ``GET /metrics``.
+
+The server runs on the standard library :mod:`asyncio` module only, and
+listens on the local interface by default.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from http import HTTPStatus
+from typing import Any, NamedTuple, get_args
+
+from hijridate import cli
+from hijridate.cli import Calendar
+
+_MAX_HEADERS = 100
+_MAX_BODY_SIZE = 1024 * 1024
+
+
+class ServerStats(NamedTuple):
+    """Counters of a conversion server since it started."""
+
+    requests: int
+    errors: int
+    dates: int
+    batches: int
+    uptime: float
+    requests_per_second: float
+    dates_per_second: float
+    mean_batch_size: float
+    mean_latency_ms: float
+    max_latency_ms: float
+
+
+class ConversionServer:
+    """An asyncio HTTP/JSON server converting dates in coalesced batches.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on, or ``0`` for any free port.
+        window: Seconds to wait for more requests before converting the
+            pending dates in one batch, or ``0`` for a single iteration of
+            the event loop.
+        max_batch: Number of pending dates that starts converting a batch
+            without waiting for the window to end.
+
+    Raises:
+        ValueError: When ``window`` is negative or ``max_batch`` is less
+            than 1.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        *,
+        window: float = 0.0,
+        max_batch: int = 10_000,
+    ):
+        if window < 0:
+            message = f"window must not be negative, got '{window}'"
+            raise ValueError(message)
+        if max_batch < 1:
+            message = f"max_batch must be at least 1, got '{max_batch}'"
+            raise ValueError(message)
+        self.host = host
+        self.port = port
+        self._window = window
+        self._max_batch = max_batch
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._pending: list[tuple[list[str], Calendar, asyncio.Future[Any]]] = []
+        self._pending_dates = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._started = time.monotonic()
+        self._requests = self._errors = self._dates = self._batches = 0
+        self._latency = self._max_latency = 0.0
+
+    async def start(self) -> None:
+        """Start listening, setting ``port`` to the bound port."""
+        await self._start_server()
+
+    async def serve_forever(self) -> None:
+        """Start listening if not started, and serve until cancelled."""
+        server = self._server or await self._start_server()
+        await server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening, close connections, and convert pending dates."""
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        self._flush()
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+    async def convert(self, values: list[str], to: Calendar) -> list[str | None]:
+        """Convert ISO formatted date strings in the next coalesced batch.
+
+        Surrounding whitespace is ignored, and dates that are not valid or
+        out of supported range are converted to ``None``.
+
+        Args:
+            values: ISO formatted date strings.
+            to: Calendar to convert to, either ``"hijri"`` or ``"gregorian"``.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((values, to, future))
+        self._pending_dates += len(values)
+        if self._pending_dates >= self._max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self._window, self._flush)
+        results: list[str | None] = await future
+        return results
+
+    def stats(self) -> ServerStats:
+        """Return counters of the server since it started."""
+        uptime = time.monotonic() - self._started
+        requests = self._requests
+        return ServerStats(
+            requests=requests,
+            errors=self._errors,
+            dates=self._dates,
+            batches=self._batches,
+            uptime=uptime,
+            requests_per_second=requests / uptime if uptime else 0.0,
+            dates_per_second=self._dates / uptime if uptime else 0.0,
+            mean_batch_size=self._dates / self._batches if self._batches else 0.0,
+            mean_latency_ms=self._latency / requests * 1000 if requests else 0.0,
+            max_latency_ms=self._max_latency * 1000,
+        )
+
+    async def _start_server(self) -> asyncio.Server:
+        """Start listening and return the underlying server."""
+        # date maps are built before listening, not by the first requests
+        for to in get_args(Calendar):
+            cli._get_date_map(to)
+        server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self._server = server
+        self.port = server.sockets[0].getsockname()[1]
+        self._started = time.monotonic()
+        return server
+
+    def _flush(self) -> None:
+        """Convert all pending dates, one batch for each calendar."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        self._pending_dates = 0
+        for to in get_args(Calendar):
+            requests = [(v, f) for v, t, f in pending if t == to]
+            if not requests:
+                continue
+            values = [value for values, _ in requests for value in values]
+            results = cli.convert_values(values, to)
+            self._dates += len(values)
+            self._batches += 1
+            start = 0
+            for chunk, future in requests:
+                if not future.done():
+                    future.set_result(results[start : start + len(chunk)])
+                start += len(chunk)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve requests of a connection until it is closed."""
+        self._writers.add(writer)
+        try:
+            while await self._handle_request(reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            # ValueError is raised by the reader when a line is too long
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _handle_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """Serve a request and return whether to keep the connection open."""
+        line = await reader.readline()
+        if not line.strip():
+            return False
+        start = time.perf_counter()
+        keep_alive = False
+        try:
+            method, path, body, keep_alive = await _read_request(line, reader, writer)
+            payload = await self._route(method, path, body)
+            status = HTTPStatus.OK
+        except _RequestError as error:
+            status, payload = error.status, {"error": str(error)}
+            keep_alive = keep_alive and not error.close
+        content = json.dumps(payload, ensure_ascii=False).encode()
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(content)}\r\n"
+        )
+        if not keep_alive:
+            head += "Connection: close\r\n"
+        writer.write(f"{head}\r\n".encode("latin-1") + content)
+        await writer.drain()
+
+        latency = time.perf_counter() - start
+        self._requests += 1
+        if status >= HTTPStatus.BAD_REQUEST:
+            self._errors += 1
+        self._latency += latency
+        self._max_latency = max(self._max_latency, latency)
+        return keep_alive
+
+    async def _route(self, method: str, path: str, body: bytes) -> dict[str, Any]:
+        """Return payload of a response to a request for a path."""
+        routes = {"/metrics": "GET", "/convert": "POST"}
+        if path not in routes:
+            message = f"not found, got '{path}'"
+            raise _RequestError(HTTPStatus.NOT_FOUND, message)
+        if method != routes[path]:
+            message = f"method not allowed, got '{method}'"
+            raise _RequestError(HTTPStatus.METHOD_NOT_ALLOWED, message)
+        if path == "/metrics":
+            return self.stats()._asdict()
+
+        try:
+            request = json.loads(body)
+        except (RecursionError, ValueError) as error:
+            # deeply nested arrays or objects exhaust the JSON decoder recursion
+            message = f"invalid JSON: {error}"
+            raise _RequestError(HTTPStatus.BAD_REQUEST, message) from None
+        if not isinstance(request, dict):
+            message = "request must be a JSON object"
+            raise _RequestError(HTTPStatus.BAD_REQUEST, message)
+        to = request.get("to", "hijri")
+        if to not in get_args(Calendar):
+            message = f"to must be 'hijri' or 'gregorian', got '{to}'"
+            raise _RequestError(HTTPStatus.BAD_REQUEST, message)
+        value = request.get("date")
+        if isinstance(value, str):
+            [result] = await self.convert([value], to)
+            if result is None:
+                message = cli._rejection_reason(value.strip(), to)
+                raise _RequestError(HTTPStatus.BAD_REQUEST, message)
+            return {"date": result}
+        values = request.get("dates")
+        if not (isinstance(values, list) and all(isinstance(v, str) for v in values)):
+            message = "request must have a date string or a dates list of strings"
+            raise _RequestError(HTTPStatus.BAD_REQUEST, message)
+        return {"dates": await self.convert(values, to)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run conversion server until interrupted and return exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m hijridate.server",
+        description="Serve date conversion over a local HTTP/JSON endpoint.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument(
+        "--window",
+        type=float,
+        default=0.0,
+        help="milliseconds to coalesce requests into a batch (default: 0)",
+    )
+    parser.add_argument(
+        "--max-batch",
+        type=cli._positive_int,
+        default=10_000,
+        help="pending dates that start a batch before the window ends",
+    )
+    args = parser.parse_args(argv)
+
+    server = ConversionServer(
+        args.host, args.port, window=args.window / 1000, max_batch=args.max_batch
+    )
+
+    async def serve() -> None:
+        await server.start()
+        sys.stderr.write(f"hijridate: serving on http://{args.host}:{server.port}\n")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+class _RequestError(Exception):
+    """An error answered with an HTTP error status."""
+
+    def __init__(self, status: HTTPStatus, message: str, *, close: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.close = close
+
+
+async def _read_request(
+    line: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> tuple[str, str, bytes, bool]:
+    """Return method, path, body, and keep-alive of a request from its stream.
+
+    Raises:
+        _RequestError: When the request is malformed or its body is too large,
+            so the connection cannot be kept open.
+    """
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        message = "malformed request line"
+        raise _RequestError(HTTPStatus.BAD_REQUEST, message, close=True) from None
+    headers: dict[str, str] = {}
+    lines = 0
+    while (line := await reader.readline()).strip():
+        lines += 1
+        if lines > _MAX_HEADERS:
+            message = "too many request headers"
+            status = HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE
+            raise _RequestError(status, message, close=True)
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if "transfer-encoding" in headers:
+        message = "transfer encoding is not supported"
+        raise _RequestError(HTTPStatus.NOT_IMPLEMENTED, message, close=True)
+    length = headers.get("content-length", "0")
+    if not (length.isascii() and length.isdigit()):
+        message = f"invalid content length, got '{length}'"
+        raise _RequestError(HTTPStatus.BAD_REQUEST, message, close=True)
+    if int(length) > _MAX_BODY_SIZE:
+        message = f"content length must be at most {_MAX_BODY_SIZE}, got '{length}'"
+        raise _RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, message, close=True)
+    if headers.get("expect", "").lower() == "100-continue":
+        writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+    body = await reader.readexactly(int(length))
+
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.1":
+        keep_alive = connection != "close"
+    else:
+        keep_alive = connection == "keep-alive"
+    return method, target.partition("?")[0], body, keep_alive
+
+
+if __name__ == "__main__":
+    sys.exit(main())
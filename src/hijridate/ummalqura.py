@@ -8,6 +8,12 @@ GREGORIAN_RANGE: tuple[DateTuple, DateTuple] = ((1924, 8, 1), (2077, 11, 16))
 HIJRI_RANGE: tuple[DateTuple, DateTuple] = ((1343, 1, 1), (1500, 12, 30))
 """Inclusive range of supported Hijri dates (year, month and day)."""
 
+ORDINAL_RANGE: tuple[int, int] = (702574, 758564)
+"""Inclusive range of supported Gregorian date ordinals."""
+
+RJD_RANGE: tuple[int, int] = (23999, 79989)
+"""Inclusive range of supported Reduced Julian Day (RJD) numbers."""
+
 HIJRI_OFFSET: int = 1342 * 12
 """Total Hijri months elapsed before the beginning of Hijri range."""
 
@@ -0,0 +1,135 @@
+from datetime import date
+
+import pytest
+
+from hijridate import Gregorian, Hijri
+
+pa = pytest.importorskip("pyarrow")
+arrow = pytest.importorskip("hijridate.arrow")
+
+
+@pytest.fixture
+def dates():
+    return pa.array(
+        [date(1982, 12, 2), None, date(1924, 7, 31), date(2023, 12, 28)],
+        type=pa.date32(),
+    )
+
+
+class TestGregorianToHijri:
+    def test_conversion(self, dates):
+        result = arrow.gregorian_to_hijri(dates)
+        assert result.type == arrow.HIJRI_TYPE
+        assert result.to_pylist() == [
+            {"year": 1403, "month": 2, "day": 17},
+            None,
+            None,
+            {"year": 1445, "month": 6, "day": 15},
+        ]
+        assert result.field("year").to_pylist() == [1403, None, None, 1445]
+
+    def test_without_nulls(self):
+        result = arrow.gregorian_to_hijri(pa.array([date(1982, 12, 2)]))
+        assert result.null_count == 0
+        assert result.buffers()[0] is None
+
+    def test_sliced_array(self, dates):
+        result = arrow.gregorian_to_hijri(dates.slice(1, 3))
+        assert result.to_pylist()[2] == {"year": 1445, "month": 6, "day": 15}
+        assert result.is_null().to_pylist() == [True, True, False]
+
+    def test_chunked_array(self, dates):
+        chunked = pa.chunked_array([dates, dates.slice(3)])
+        result = arrow.gregorian_to_hijri(chunked)
+        assert isinstance(result, pa.ChunkedArray)
+        assert result.num_chunks == 2
+        assert len(result) == 5
+
+    def test_full_range(self):
+        start, stop = date(1924, 8, 1).toordinal(), date(2077, 11, 16).toordinal()
+        ordinals = range(start, stop + 1, 7)
+        dates = pa.array([date.fromordinal(o) for o in ordinals], type=pa.date32())
+        result = arrow.gregorian_to_hijri(dates).flatten()
+        expected = [Gregorian.fromordinal(o).to_hijri().datetuple() for o in ordinals]
+        columns = [c.to_pylist() for c in result]
+        assert list(zip(*columns, strict=True)) == expected
+
+    def test_unsupported_type(self):
+        with pytest.raises(TypeError, match="expected date32 array"):
+            arrow.gregorian_to_hijri(pa.array([1, 2]))
+
+
+class TestHijriToGregorian:
+    def test_struct_array(self, dates):
+        result = arrow.hijri_to_gregorian(arrow.gregorian_to_hijri(dates))
+        assert result.type == pa.date32()
+        assert result.to_pylist() == [date(1982, 12, 2), None, None, date(2023, 12, 28)]
+
+    def test_sliced_struct_array(self, dates):
+        hijri = arrow.gregorian_to_hijri(dates).slice(2)
+        result = arrow.hijri_to_gregorian(hijri)
+        assert result.to_pylist() == [None, date(2023, 12, 28)]
+
+    def test_struct_nulls(self):
+        fields = [pa.array([1403, 1403]), pa.array([2, 2]), pa.array([17, 17])]
+        mask = pa.array([False, True])
+        struct = pa.StructArray.from_arrays(
+            fields, names=["year", "month", "day"], mask=mask
+        )
+        result = arrow.hijri_to_gregorian(struct)
+        assert result.to_pylist() == [date(1982, 12, 2), None]
+
+    def test_separate_arrays(self):
+        year = pa.array([1403, 1403, None, 1600, 1403], type=pa.int32())
+        month = pa.array([2, 2, 1, 1, 13], type=pa.int8())
+        day = pa.array([17, 31, 1, 1, 1], type=pa.uint8())
+        result = arrow.hijri_to_gregorian(year, month, day)
+        assert result.to_pylist() == [date(1982, 12, 2), None, None, None, None]
+
+    def test_chunked_arrays(self):
+        year = pa.chunked_array([[1403], [1445]])
+        month = pa.chunked_array([[2], [6]])
+        day = pa.chunked_array([[17], [15]])
+        result = arrow.hijri_to_gregorian(year, month, day)
+        assert result.to_pylist() == [date(1982, 12, 2), date(2023, 12, 28)]
+        struct = pa.chunked_array(
+            [arrow.gregorian_to_hijri(pa.array([date(1982, 12, 2)]))]
+        )
+        assert arrow.hijri_to_gregorian(struct).num_chunks == 1
+
+    def test_differently_chunked_arrays(self):
+        year = pa.chunked_array([[1403, 1445, 1410], [1410]])
+        month = pa.chunked_array([[2], [], [6, 8], [8]])
+        day = pa.array([17, 15, 13, 30])
+        result = arrow.hijri_to_gregorian(year, month, day)
+        assert result.num_chunks == 3
+        assert result.to_pylist() == [
+            date(1982, 12, 2),
+            date(2023, 12, 28),
+            date(1990, 3, 10),
+            None,
+        ]
+
+    def test_different_lengths(self):
+        year = pa.chunked_array([[1403, 1445]])
+        with pytest.raises(ValueError, match="arrays must have the same length"):
+            arrow.hijri_to_gregorian(year, pa.array([2]), pa.array([17]))
+
+    def test_full_range(self):
+        hijri = [Hijri(y, m, 15) for y in range(1343, 1501) for m in range(1, 13)]
+        columns = [
+            pa.array(c, type=pa.int16())
+            for c in zip(*(h.datetuple() for h in hijri), strict=True)
+        ]
+        result = arrow.hijri_to_gregorian(*columns)
+        assert result.to_pylist() == [h.to_gregorian() for h in hijri]
+
+    def test_unsupported_arrays(self):
+        with pytest.raises(TypeError, match="expected 1 or 3 arrays, got 2"):
+            arrow.hijri_to_gregorian(pa.array([1]), pa.array([1]))
+        with pytest.raises(TypeError, match="expected struct array"):
+            arrow.hijri_to_gregorian(pa.array([1]))
+        with pytest.raises(TypeError, match="with fields"):
+            arrow.hijri_to_gregorian(pa.array([{"year": 1403}]))
+        with pytest.raises(TypeError, match="expected integer array"):
+            arrow.hijri_to_gregorian(pa.array([1403.0]), pa.array([2]), pa.array([17]))
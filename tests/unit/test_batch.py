@@ -0,0 +1,144 @@
+from datetime import date
+
+import pytest
+
+from hijridate import Gregorian
+from hijridate.ummalqura import GREGORIAN_RANGE
+
+np = pytest.importorskip("numpy")
+batch = pytest.importorskip("hijridate.batch")
+
+g_min, g_max = GREGORIAN_RANGE
+g_min_iso = "-".join([f"{i:02}" for i in g_min])
+g_max_iso = "-".join([f"{i:02}" for i in g_max])
+ordinal_min = date(*g_min).toordinal()
+ordinal_max = date(*g_max).toordinal()
+
+
+class TestGregorianToHijri:
+    def test_full_range_matches_scalar_conversion(self):
+        ordinals = np.arange(ordinal_min, ordinal_max + 1)
+        result = batch.gregorian_to_hijri(ordinals)
+        expected = [Gregorian.fromordinal(i).to_hijri().datetuple() for i in ordinals]
+        assert list(zip(*[a.tolist() for a in result], strict=True)) == expected
+
+    def test_ordinals(self):
+        ordinals = [date(1990, 3, 10).toordinal(), date(1982, 12, 2).toordinal()]
+        year, month, day = batch.gregorian_to_hijri(ordinals)
+        assert year.tolist() == [1410, 1403]
+        assert month.tolist() == [8, 2]
+        assert day.tolist() == [13, 17]
+
+    def test_datetime64(self):
+        dates = np.array(["1990-03-10", "1982-12-02"], dtype="datetime64[D]")
+        result = batch.gregorian_to_hijri(dates)
+        assert result.year.tolist() == [1410, 1403]
+        assert result.month.tolist() == [8, 2]
+        assert result.day.tolist() == [13, 17]
+
+    def test_datetime64_other_unit(self):
+        dates = np.array(["1990-03-10T23:59:59"], dtype="datetime64[s]")
+        result = batch.gregorian_to_hijri(dates)
+        assert result.day.tolist() == [13]
+
+    def test_columns(self):
+        result = batch.gregorian_to_hijri([1990, 1982], [3, 12], [10, 2])
+        assert result.year.tolist() == [1410, 1403]
+        assert result.month.tolist() == [8, 2]
+        assert result.day.tolist() == [13, 17]
+
+    def test_empty(self):
+        result = batch.gregorian_to_hijri(np.array([], dtype=np.int64))
+        assert all(a.size == 0 for a in result)
+
+    @pytest.mark.parametrize("count", [0, 2, 4])
+    def test_invalid_number_of_arrays(self, count):
+        with pytest.raises(TypeError, match=f"expected 1 or 3 arrays, got {count}"):
+            batch.gregorian_to_hijri(*[[1]] * count)
+
+    def test_unsupported_type(self):
+        with pytest.raises(TypeError, match="unsupported array type: float64"):
+            batch.gregorian_to_hijri([1.5])
+
+    @pytest.mark.parametrize(
+        ("columns", "err_message"),
+        [
+            (([1990], [0], [1]), "month must be in 1-12, got '0'"),
+            (([1990], [13], [1]), "month must be in 1-12, got '13'"),
+            (([1990], [2], [29]), "day is out of range for month, got '29'"),
+            (([1990], [3], [0]), "day is out of range for month, got '0'"),
+        ],
+    )
+    def test_invalid_columns(self, columns, err_message):
+        with pytest.raises(ValueError, match=err_message):
+            batch.gregorian_to_hijri(*columns)
+
+    @pytest.mark.parametrize(
+        ("dates", "err_message"),
+        [
+            (
+                ["1990-03-10", "1924-07-31"],
+                f"date must be in '{g_min_iso}'-'{g_max_iso}', got '1924-07-31'",
+            ),
+            (
+                ["2077-11-17"],
+                f"date must be in '{g_min_iso}'-'{g_max_iso}', got '2077-11-17'",
+            ),
+        ],
+    )
+    def test_invalid_range(self, dates, err_message):
+        with pytest.raises(OverflowError, match=err_message):
+            batch.gregorian_to_hijri(np.array(dates, dtype="datetime64[D]"))
+
+
+class TestHijriToGregorian:
+    def test_full_range_matches_scalar_conversion(self):
+        ordinals = np.arange(ordinal_min, ordinal_max + 1)
+        year, month, day = batch.gregorian_to_hijri(ordinals)
+        assert batch.hijri_to_ordinal(year, month, day).tolist() == ordinals.tolist()
+
+    def test_datetime64(self):
+        result = batch.hijri_to_gregorian([1410, 1403], [8, 2], [13, 17])
+        assert result.dtype == np.dtype("datetime64[D]")
+        assert result.tolist() == [date(1990, 3, 10), date(1982, 12, 2)]
+
+    def test_ordinal(self):
+        result = batch.hijri_to_ordinal([1410, 1403], [8, 2], [13, 17])
+        assert result.tolist() == [726536, 723881]
+
+    def test_broadcasting(self):
+        result = batch.hijri_to_gregorian(1410, 8, [13, 14])
+        assert result.tolist() == [date(1990, 3, 10), date(1990, 3, 11)]
+
+    def test_coerce_invalid_dates(self):
+        result = batch.hijri_to_gregorian(
+            [1410, 1342, 1410, 1410], [8, 1, 13, 8], [13, 1, 1, 30], errors="coerce"
+        )
+        assert result[0] == np.datetime64("1990-03-10")
+        assert np.isnat(result[1:]).all()
+
+    def test_unsupported_errors(self):
+        with pytest.raises(ValueError, match="errors must be one of"):
+            batch.hijri_to_gregorian([1410], [8], [13], errors="mask")
+
+    def test_validity_mask(self):
+        years = [1410, 1342, 1501, 1410, 1410, 1410]
+        months = [8, 1, 1, 0, 8, 8]
+        days = [13, 1, 1, 1, 0, 30]
+        result = batch.is_valid_hijri(years, months, days)
+        assert result.tolist() == [True, False, False, False, False, False]
+
+    @pytest.mark.parametrize(
+        ("columns", "exception", "err_message"),
+        [
+            (([1410, 1342], [8, 1], [13, 1]), OverflowError, "got '1342'"),
+            (([1410, 1410], [8, 13], [13, 1]), ValueError, "got '13'"),
+            (([1410, 1410], [8, 8], [13, 30]), ValueError, "got '30'"),
+            (([1410, 1410], [13, 8], [1, 30]), ValueError, "got '13'"),
+        ],
+    )
+    def test_raise_first_invalid_date(self, columns, exception, err_message):
+        with pytest.raises(exception, match=err_message):
+            batch.hijri_to_gregorian(*columns)
+        with pytest.raises(exception, match=err_message):
+            batch.hijri_to_ordinal(*columns)
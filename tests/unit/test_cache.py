@@ -0,0 +1,115 @@
+import threading
+
+import pytest
+
+from hijridate import Gregorian, Hijri, cache
+
+
+@pytest.fixture
+def _cache_enabled():
+    cache.enable(maxsize=2)
+    yield
+    cache.disable()
+
+
+class TestConversionCache:
+    def test_hits_and_misses(self):
+        conversion_cache = cache.ConversionCache(maxsize=2)
+        assert conversion_cache.get("a") is None
+        conversion_cache.put("a", 1)
+        assert conversion_cache.get("a") == 1
+        assert conversion_cache.info() == cache.CacheInfo(1, 1, 0, 2, 1)
+
+    def test_least_recently_used_eviction(self):
+        conversion_cache = cache.ConversionCache(maxsize=2)
+        conversion_cache.put("a", 1)
+        conversion_cache.put("b", 2)
+        conversion_cache.get("a")
+        conversion_cache.put("c", 3)
+        assert conversion_cache.get("b") is None
+        assert conversion_cache.get("a") == 1
+        assert conversion_cache.get("c") == 3
+        assert conversion_cache.info() == cache.CacheInfo(3, 1, 1, 2, 2)
+
+    def test_clear(self):
+        conversion_cache = cache.ConversionCache()
+        conversion_cache.put("a", 1)
+        conversion_cache.get("a")
+        conversion_cache.clear()
+        assert conversion_cache.info() == cache.CacheInfo(0, 0, 0, 4096, 0)
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError, match="maxsize must be at least 1, got '0'"):
+            cache.ConversionCache(maxsize=0)
+
+    def test_thread_safety(self):
+        conversion_cache = cache.ConversionCache(maxsize=50)
+
+        def worker():
+            for i in range(1000):
+                if conversion_cache.get(i % 100) is None:
+                    conversion_cache.put(i % 100, i)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = conversion_cache.info()
+        assert info.hits + info.misses == 8000
+        assert info.currsize == 50
+
+
+def test_enable_and_disable():
+    assert not cache.is_enabled()
+    assert cache.info() is None
+    cache.clear()  # no error when disabled
+    cache.enable(maxsize=10)
+    assert cache.is_enabled()
+    assert cache.info() == cache.CacheInfo(0, 0, 0, 10, 0)
+    cache.disable()
+    assert not cache.is_enabled()
+    assert cache.active_cache is None
+
+
+@pytest.mark.usefixtures("_cache_enabled")
+def test_cached_to_hijri():
+    gregorian = Gregorian(1990, 3, 10)
+    first = gregorian.to_hijri()
+    second = Gregorian(1990, 3, 10).to_hijri()
+    assert first == Hijri(1410, 8, 13)
+    assert second is first
+    assert cache.info() == cache.CacheInfo(1, 1, 0, 2, 1)
+
+
+@pytest.mark.usefixtures("_cache_enabled")
+def test_cached_to_gregorian():
+    hijri = Hijri(1410, 8, 13)
+    first = hijri.to_gregorian()
+    second = Hijri(1410, 8, 13).to_gregorian()
+    assert first == Gregorian(1990, 3, 10)
+    assert second is first
+    assert cache.info() == cache.CacheInfo(1, 1, 0, 2, 1)
+
+
+@pytest.mark.usefixtures("_cache_enabled")
+def test_cache_clear():
+    Gregorian(1990, 3, 10).to_hijri()
+    cache.clear()
+    assert cache.info() == cache.CacheInfo(0, 0, 0, 2, 0)
+
+
+@pytest.mark.usefixtures("_cache_enabled")
+def test_cached_invalid_range():
+    with pytest.raises(OverflowError):
+        Gregorian(1924, 7, 31).to_hijri()
+    assert cache.info().currsize == 0
+
+
+@pytest.mark.usefixtures("_cache_enabled")
+def test_cached_invalid_range_without_validation():
+    gregorian = Gregorian(1924, 7, 31)
+    gregorian.to_hijri(validate=False)
+    assert cache.info().currsize == 0
+    with pytest.raises(OverflowError, match="got '1924-07-31'"):
+        gregorian.to_hijri()
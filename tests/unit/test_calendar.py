@@ -0,0 +1,75 @@
+from datetime import date, timedelta
+
+import pytest
+
+from hijridate import Hijri
+from hijridate.calendar import HijriCalendar
+
+
+class TestHijriCalendar:
+    def test_firstweekday(self):
+        assert HijriCalendar().firstweekday == 0
+        calendar = HijriCalendar(6)
+        assert list(calendar.iterweekdays()) == [6, 0, 1, 2, 3, 4, 5]
+        calendar.firstweekday = 5
+        assert calendar.firstweekday == 5
+
+    @pytest.mark.parametrize("firstweekday", [-1, 7])
+    def test_invalid_firstweekday(self, firstweekday):
+        with pytest.raises(ValueError, match="firstweekday must be in 0-6"):
+            HijriCalendar(firstweekday)
+
+    def test_monthdayscalendar(self):
+        weeks = HijriCalendar(6).monthdayscalendar(1445, 9)
+        assert weeks == [
+            [0, 1, 2, 3, 4, 5, 6],
+            [7, 8, 9, 10, 11, 12, 13],
+            [14, 15, 16, 17, 18, 19, 20],
+            [21, 22, 23, 24, 25, 26, 27],
+            [28, 29, 30, 0, 0, 0, 0],
+        ]
+
+    def test_monthdays2calendar(self):
+        weeks = HijriCalendar().monthdays2calendar(1445, 9)
+        assert weeks[0] == [(1, 0), (2, 1), (3, 2), (4, 3), (5, 4), (6, 5), (7, 6)]
+        assert weeks[-1][-1] == (0, 6)
+
+    def test_monthgregoriancalendar(self):
+        weeks = HijriCalendar(6).monthgregoriancalendar(1445, 9)
+        assert weeks[0][:2] == [(0, date(2024, 3, 10)), (1, date(2024, 3, 11))]
+        assert weeks[-1][-1] == (0, date(2024, 4, 13))
+
+    @pytest.mark.parametrize("firstweekday", range(7))
+    @pytest.mark.parametrize(("year", "month"), [(1343, 1), (1403, 2), (1500, 12)])
+    def test_month_consistency(self, firstweekday, year, month):
+        weeks = HijriCalendar(firstweekday).monthgregoriancalendar(year, month)
+        cells = [cell for week in weeks for cell in week]
+        assert all(len(week) == 7 for week in weeks)
+        assert [day for day, _ in cells if day] == list(
+            range(1, Hijri(year, month, 1).month_length() + 1)
+        )
+        assert cells[0][1].weekday() == firstweekday
+        for offset, (day, gregorian) in enumerate(cells):
+            assert gregorian == cells[0][1] + timedelta(days=offset)
+            if day:
+                assert Hijri(year, month, day).to_gregorian() == gregorian
+
+    def test_yeardayscalendar(self):
+        rows = HijriCalendar().yeardayscalendar(1445)
+        assert len(rows) == 4
+        assert all(len(row) == 3 for row in rows)
+        assert rows[2][2] == HijriCalendar().monthdayscalendar(1445, 9)
+        assert len(HijriCalendar().yeardayscalendar(1445, width=4)) == 3
+
+    def test_yeargregoriancalendar(self):
+        rows = HijriCalendar().yeargregoriancalendar(1445, width=6)
+        assert len(rows) == 2
+        assert rows[1][2] == HijriCalendar().monthgregoriancalendar(1445, 9)
+
+    @pytest.mark.parametrize(
+        ("year", "month", "error"),
+        [(1342, 12, OverflowError), (1501, 1, OverflowError), (1445, 13, ValueError)],
+    )
+    def test_invalid_month(self, year, month, error):
+        with pytest.raises(error):
+            HijriCalendar().monthdayscalendar(year, month)
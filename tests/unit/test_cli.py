@@ -0,0 +1,144 @@
+import io
+import runpy
+import sys
+
+import pytest
+
+from hijridate import cli
+
+
+def run(monkeypatch, capsys, argv, stdin=""):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    status = cli.main(argv)
+    out, err = capsys.readouterr()
+    return status, out, err
+
+
+class TestConvertValues:
+    def test_to_hijri(self):
+        values = ["1982-12-02", " 2023-12-28\n", "1924-07-31", "19821202", ""]
+        result = cli.convert_values(values, "hijri")
+        assert result == ["1403-02-17", "1445-06-15", None, None, None]
+
+    def test_to_gregorian(self):
+        values = ["1403-02-17", "1445-06-15", "1403-02-31", "1342-12-29"]
+        result = cli.convert_values(values, "gregorian")
+        assert result == ["1982-12-02", "2023-12-28", None, None]
+
+    def test_full_range(self):
+        hijri = cli._get_date_map("hijri")
+        gregorian = cli._get_date_map("gregorian")
+        assert len(hijri) == len(gregorian) == 55991
+        assert hijri["1924-08-01"] == "1343-01-01"
+        assert hijri["2077-11-16"] == "1500-12-30"
+        assert all(gregorian[h] == g for g, h in hijri.items())
+
+
+class TestMain:
+    def test_stdin(self, monkeypatch, capsys):
+        stdin = "1982-12-02\n\n2023-12-28\r\n"
+        status, out, err = run(monkeypatch, capsys, [], stdin)
+        assert status == 0
+        assert out == "1403-02-17\n\n1445-06-15\n"
+        assert err == ""
+
+    def test_to_gregorian(self, monkeypatch, capsys):
+        status, out, _ = run(monkeypatch, capsys, ["--to", "gregorian"], "1403-02-17")
+        assert status == 0
+        assert out == "1982-12-02\n"
+
+    def test_files(self, monkeypatch, capsys, tmp_path):
+        first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+        first.write_text("1982-12-02\n")
+        second.write_text("2023-12-28\n")
+        status, out, _ = run(monkeypatch, capsys, [str(first), str(second)])
+        assert status == 0
+        assert out == "1403-02-17\n1445-06-15\n"
+
+    def test_delimited_columns(self, monkeypatch, capsys):
+        stdin = "id;date;note\n1;1982-12-02;a\n2;;b\n3\n"
+        argv = ["-t", ";", "-c", "2", "--header"]
+        status, out, _ = run(monkeypatch, capsys, argv, stdin)
+        assert status == 0
+        assert out == "id;date;note\n1;1403-02-17;a\n2;;b\n3\n"
+
+    def test_header_of_empty_input(self, monkeypatch, capsys):
+        status, out, _ = run(monkeypatch, capsys, ["--header"])
+        assert status == 0
+        assert out == ""
+
+    @pytest.mark.parametrize("chunk_size", ["1", "1000"])
+    def test_raise_errors(self, monkeypatch, capsys, chunk_size):
+        stdin = "1982-12-02\n1900-01-01\n2023-12-28\n"
+        argv = ["--chunk-size", chunk_size]
+        status, out, err = run(monkeypatch, capsys, argv, stdin)
+        assert status == 1
+        assert out == "1403-02-17\n"
+        assert err == (
+            "hijridate: line 2: date must be in '1924-08-01'-'2077-11-16', "
+            "got '1900-01-01'\n"
+        )
+
+    @pytest.mark.parametrize(
+        ("argv", "stdin", "reason"),
+        [
+            ([], "x\n", "Invalid isoformat string: 'x'"),
+            ([], "19821202\n", "invalid isoformat string: '19821202'"),
+            (["--to", "gregorian"], "1403-02-31", "day must be in 1-30 for month"),
+        ],
+    )
+    def test_error_reasons(self, monkeypatch, capsys, argv, stdin, reason):
+        status, _, err = run(monkeypatch, capsys, argv, stdin)
+        assert status == 1
+        assert reason in err
+
+    def test_coerce_errors(self, monkeypatch, capsys):
+        stdin = "a,1900-01-01\nb,1982-12-02\n"
+        argv = ["-t", ",", "-c", "2", "--errors", "coerce"]
+        status, out, _ = run(monkeypatch, capsys, argv, stdin)
+        assert status == 0
+        assert out == "a,\nb,1403-02-17\n"
+
+    def test_jobs(self, monkeypatch, capsys):
+        stdin = "1982-12-02\n2023-12-28\n" * 50
+        argv = ["-j", "2", "--chunk-size", "10"]
+        status, out, _ = run(monkeypatch, capsys, argv, stdin)
+        assert status == 0
+        assert out == "1403-02-17\n1445-06-15\n" * 50
+
+    def test_stats(self, monkeypatch, capsys):
+        status, _, err = run(monkeypatch, capsys, ["--stats"], "1982-12-02\n")
+        assert status == 0
+        assert err.startswith("hijridate: converted 1 lines in ")
+        assert err.endswith(" lines/s)\n")
+
+    def test_missing_file(self, monkeypatch, capsys, tmp_path):
+        status, _, err = run(monkeypatch, capsys, [str(tmp_path / "missing")])
+        assert status == 1
+        assert err.startswith("hijridate: [Errno 2] No such file or directory")
+
+    def test_broken_pipe(self, monkeypatch, tmp_path):
+        class BrokenStdout(io.StringIO):
+            def writelines(self, lines):
+                raise BrokenPipeError
+
+            def fileno(self):
+                return file.fileno()
+
+        with open(tmp_path / "output", "w") as file:
+            monkeypatch.setattr(sys, "stdin", io.StringIO("1982-12-02\n"))
+            monkeypatch.setattr(sys, "stdout", BrokenStdout())
+            assert cli.main([]) == 1
+
+    def test_invalid_arguments(self, capsys):
+        with pytest.raises(SystemExit):
+            cli.main(["-j", "0"])
+        assert "must be a positive integer, got '0'" in capsys.readouterr().err
+
+
+def test_module_entry_point(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["hijridate", "--version"])
+    with pytest.raises(SystemExit) as error:
+        runpy.run_module("hijridate", run_name="__main__")
+    assert error.value.code == 0
+    assert capsys.readouterr().out.strip()
@@ -1,7 +1,13 @@
-from datetime import date
+import copy
+import pickle
+import subprocess
+import sys
+
+from datetime import date, timedelta
 
 import pytest
 
+from hijridate import convert
 from hijridate.convert import Gregorian, Hijri
 from hijridate.ummalqura import GREGORIAN_RANGE, HIJRI_RANGE
 
@@ -18,6 +24,22 @@ def test_importing_at_init_module():
     assert Gregorian(1990, 3, 10)
 
 
+@pytest.mark.parametrize("module", ["locales", "cache", "lookup", "metadata"])
+def test_importing_without_module(module):
+    code = f"import sys, hijridate; print('hijridate.{module}' in sys.modules)"
+    process = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert process.stdout.strip() == "False"
+
+
+def test_locales_kept_by_language_tag():
+    assert convert._get_locale("en") is convert._get_locale("en")
+    assert convert._get_locale("en-US") is not convert._get_locale("en-US")
+    with pytest.raises(ValueError, match="unsupported language: xy"):
+        convert._get_locale("xy")
+
+
 @pytest.fixture(scope="class")
 def _hijri_date(request):
     request.cls.hijri_date = Hijri(1410, 8, 13)
@@ -51,9 +73,156 @@ class TestHijri:
         assert self.hijri_date < Hijri(1410, 8, 14)
         assert self.hijri_date <= Hijri(1410, 8, 13)
 
+    def test_sorting(self):
+        dates = [Hijri(1410, 8, 13), Hijri(1343, 1, 1), Hijri(1500, 12, 30)]
+        dates += [Hijri(1410, 9, 1), Hijri(1410, 8, 29), Hijri(1409, 12, 29)]
+        expected = sorted(dates, key=Hijri.datetuple)
+        assert sorted(dates) == expected
+        assert [d.datetuple() for d in sorted(dates)] == [
+            d.datetuple() for d in expected
+        ]
+
+    @pytest.mark.parametrize(
+        ("first", "second"),
+        [
+            ((1400, 1, 1), (1400, 1, 33)),
+            ((1400, 16, 1), (1401, 0, 1)),
+            ((1400, 1, 1), (-1400, 1, 1)),
+            ((1400, 1, 1), (1400, 1, 1.5)),
+        ],
+    )
+    def test_unvalidated_comparison(self, first, second):
+        first_date = Hijri(*first, validate=False)
+        second_date = Hijri(*second, validate=False)
+        assert (first_date == second_date) is (first == second)
+        assert (first_date != second_date) is (first != second)
+        assert (first_date < second_date) is (first < second)
+        assert (first_date <= second_date) is (first <= second)
+        assert (first_date > second_date) is (first > second)
+        assert (first_date >= second_date) is (first >= second)
+
+    def test_unvalidated_equality_and_hash(self):
+        hijri_date = Hijri(1410.0, 8, 13, validate=False)
+        assert hijri_date == self.hijri_date
+        assert hash(hijri_date) == hash(self.hijri_date)
+        assert Hijri(1410, 8, 45, validate=False) == Hijri(1410, 8, 45, validate=False)
+
+    def test_add_timedelta(self):
+        assert self.hijri_date + timedelta(days=30) == Hijri(1410, 9, 14)
+        assert timedelta(days=30) + self.hijri_date == Hijri(1410, 9, 14)
+        assert self.hijri_date + timedelta(days=-1, hours=23) == Hijri(1410, 8, 12)
+        assert self.hijri_date + timedelta() == self.hijri_date
+
+    def test_subtract_timedelta(self):
+        assert self.hijri_date - timedelta(days=13) == Hijri(1410, 7, 30)
+        assert self.hijri_date - timedelta(days=-1) == Hijri(1410, 8, 14)
+
+    def test_subtract_hijri(self):
+        assert self.hijri_date - Hijri(1410, 1, 1) == timedelta(days=220)
+        assert Hijri(1410, 1, 1) - self.hijri_date == timedelta(days=-220)
+
+    def test_arithmetic_matches_gregorian(self):
+        for days in range(-1000, 1000, 7):
+            expected = (self.hijri_date.to_gregorian() + timedelta(days)).to_hijri()
+            assert self.hijri_date + timedelta(days) == expected
+
+    @pytest.mark.parametrize("operator", ["__add__", "__radd__", "__sub__"])
+    def test_arithmetic_notimplemented(self, operator):
+        assert getattr(self.hijri_date, operator)(1) == NotImplemented
+
+    @pytest.mark.parametrize(
+        ("hijri_date", "days"),
+        [(Hijri(1343, 1, 1), -1), (Hijri(1500, 12, 30), 1)],
+    )
+    def test_arithmetic_out_of_range(self, hijri_date, days):
+        with pytest.raises(OverflowError, match="date value out of range"):
+            hijri_date + timedelta(days)
+        with pytest.raises(OverflowError, match="date value out of range"):
+            hijri_date - timedelta(-days)
+
+    @pytest.mark.parametrize(
+        ("months", "mode", "expected"),
+        [
+            (1, "clamp", (1410, 9, 13)),
+            (-8, "clamp", (1409, 12, 13)),
+            (5, "clamp", (1411, 1, 13)),
+            (0, "raise", (1410, 8, 13)),
+        ],
+    )
+    def test_add_months(self, months, mode, expected):
+        assert self.hijri_date.add_months(months, mode=mode).datetuple() == expected
+
+    @pytest.mark.parametrize(
+        ("mode", "expected"),
+        [("clamp", (1410, 8, 29)), ("overflow", (1410, 9, 1))],
+    )
+    def test_add_months_nonexistent_day(self, mode, expected):
+        hijri_date = Hijri(1410, 7, 30)
+        assert hijri_date.add_months(1, mode=mode).datetuple() == expected
+
+    def test_add_months_nonexistent_day_raise(self):
+        with pytest.raises(ValueError, match="day must be in 1-29 for month, got '30'"):
+            Hijri(1410, 7, 30).add_months(1, mode="raise")
+
+    def test_add_months_invalid_mode(self):
+        with pytest.raises(ValueError, match="mode must be one of"):
+            self.hijri_date.add_months(1, mode="wrap")
+
+    @pytest.mark.parametrize(
+        ("hijri_date", "months"),
+        [(Hijri(1343, 1, 1), -1), (Hijri(1500, 12, 1), 1)],
+    )
+    def test_add_months_out_of_range(self, hijri_date, months):
+        with pytest.raises(OverflowError, match="date value out of range"):
+            hijri_date.add_months(months, mode="overflow")
+
+    def test_add_years(self):
+        assert self.hijri_date.add_years(1).datetuple() == (1411, 8, 13)
+        assert self.hijri_date.add_years(-10).datetuple() == (1400, 8, 13)
+        with pytest.raises(OverflowError, match="date value out of range"):
+            self.hijri_date.add_years(91)
+
     def test_fromisoformat(self):
         assert Hijri.fromisoformat("1410-08-13") == self.hijri_date
 
+    def test_fromordinal(self):
+        assert Hijri.fromordinal(date(1990, 3, 10).toordinal()) == self.hijri_date
+        assert Hijri.fromordinal(date(*g_min).toordinal()) == Hijri(*h_min)
+        assert Hijri.fromordinal(date(*g_max).toordinal()) == Hijri(*h_max)
+
+    def test_fromjulian(self):
+        assert Hijri.fromjulian(2447961) == self.hijri_date
+
+    def test_fromrjd(self):
+        assert Hijri.fromrjd(47961) == self.hijri_date
+
+    @pytest.mark.parametrize(
+        ("constructor", "number", "err_message"),
+        [
+            ("fromordinal", 702573, "ordinal must be in 702574-758564, got '702573'"),
+            ("fromordinal", 758565, "ordinal must be in 702574-758564, got '758565'"),
+            ("fromjulian", 0, "jdn must be in 2423999-2479989, got '0'"),
+            ("fromrjd", 79990, "rjd must be in 23999-79989, got '79990'"),
+        ],
+    )
+    def test_from_day_number_out_of_range(self, constructor, number, err_message):
+        with pytest.raises(OverflowError, match=err_message):
+            getattr(Hijri, constructor)(number)
+
+    def test_strptime(self):
+        assert Hijri.strptime("13 Sha'ban 1410", "%d %B %Y") == self.hijri_date
+        assert (
+            Hijri.strptime(" ١٣ شعبان ١٤١٠ هـ ", "%d %B %Y %E", "ar") == self.hijri_date
+        )
+
+    def test_strptime_not_matching(self):
+        with pytest.raises(ValueError, match="does not match format '%d %B %Y'"):
+            Hijri.strptime("1410-08-13", "%d %B %Y")
+
+    def test_strptime_invalid_date(self):
+        with pytest.raises(ValueError, match="day must be in 1-29 for month"):
+            Hijri.strptime("30 Sha'ban 1410", "%d %B %Y")
+
     def test_today(self):
         assert Hijri.today().to_gregorian() == Gregorian.today()
 
@@ -83,6 +252,22 @@ class TestHijri:
     def test_month_length(self):
         assert self.hijri_date.month_length() == 29
 
+    def test_strftime(self):
+        assert (
+            self.hijri_date.strftime("%A %d %B %Y %E") == "Saturday 13 Sha'ban 1410 AH"
+        )
+        assert self.hijri_date.strftime("%d/%m/%Y", "ar") == "13/08/1410"
+        assert self.hijri_date.strftime("%B", "tr") == "Şaban"
+
+    def test_strftime_unsupported_directive(self):
+        with pytest.raises(ValueError, match="unsupported format directive"):
+            self.hijri_date.strftime("%H")
+
+    def test_format(self):
+        assert f"{self.hijri_date}" == "1410-08-13"
+        assert f"{self.hijri_date:%d %B %Y}" == "13 Sha'ban 1410"
+        assert format(self.hijri_date, "%Y") == "1410"
+
     def test_month_name(self):
         assert self.hijri_date.month_name() == "Sha'ban"
         assert self.hijri_date.month_name("en") == "Sha'ban"
@@ -157,6 +342,68 @@ class TestHijri:
         with pytest.raises(ValueError, match=err_message):
             Hijri(*datetuple, validate=True)
 
+    def test_pickle(self):
+        data = pickle.dumps(self.hijri_date)
+        restored = pickle.loads(data)
+        assert restored == self.hijri_date
+        assert restored.datetuple() == (1410, 8, 13)
+        assert hash(restored) == hash(self.hijri_date)
+
+    def test_pickle_size(self):
+        dates = [Hijri(1410, month, day) for month in range(1, 13) for day in (1, 9)]
+        assert len(pickle.dumps(dates)) < 12 * len(dates) + 100
+
+    def test_pickle_unvalidated_values(self):
+        hijri = Hijri(-1, 40, 99, validate=False)
+        assert pickle.loads(pickle.dumps(hijri)).datetuple() == (-1, 40, 99)
+
+    def test_unpickle_legacy_slots_state(self):
+        data = (
+            b"\x80\x04\x95I\x00\x00\x00\x00\x00\x00\x00\x8c\x11hijridate.convert"
+            b"\x94\x8c\x05Hijri\x94\x93\x94)\x81\x94N}\x94(\x8c\x04_day\x94K\x11"
+            b"\x8c\x06_month\x94K\x02\x8c\x05_year\x94M{\x05u\x86\x94b."
+        )
+        restored = pickle.loads(data)
+        assert restored.datetuple() == (1403, 2, 17)
+        assert restored == Hijri(1403, 2, 17)
+        assert hash(restored) == hash(Hijri(1403, 2, 17))
+
+    def test_copy(self):
+        assert copy.copy(self.hijri_date) == self.hijri_date
+        assert copy.deepcopy(self.hijri_date) == self.hijri_date
+
+    def test_tobytes(self):
+        assert Hijri(1343, 1, 1).tobytes() == b"\x00\x00"
+        assert Hijri(1343, 1, 2).tobytes() == b"\x01\x00"
+        assert Hijri(1500, 12, 30).tobytes() == (55990).to_bytes(2, "little")
+
+    def test_frombytes(self):
+        assert Hijri.frombytes(self.hijri_date.tobytes()) == self.hijri_date
+        assert Hijri.frombytes(b"\x00\x00") == Hijri(1343, 1, 1)
+        assert Hijri.frombytes(bytearray(b"\x01\x00")) == Hijri(1343, 1, 2)
+
+    @pytest.mark.parametrize("data", [b"", b"\x00", b"\x00\x00\x00"])
+    def test_frombytes_invalid_length(self, data):
+        with pytest.raises(ValueError, match="data must be 2 bytes long"):
+            Hijri.frombytes(data)
+
+    def test_frombytes_out_of_range(self):
+        with pytest.raises(OverflowError, match="date value out of range"):
+            Hijri.frombytes(b"\xff\xff")
+
+    @pytest.mark.parametrize(
+        ("datetuple", "error"),
+        [
+            ((1342, 12, 29), OverflowError),
+            ((1501, 1, 1), OverflowError),
+            ((1410, 13, 1), ValueError),
+            ((1410, 8, 30), ValueError),
+        ],
+    )
+    def test_tobytes_invalid_date(self, datetuple, error):
+        with pytest.raises(error):
+            Hijri(*datetuple, validate=False).tobytes()
+
 
 @pytest.fixture(scope="class")
 def _gregorian_date(request):
@@ -197,12 +444,40 @@ class TestGregorian:
         assert self.gregorian_date.notation("en-US") == "CE"
         assert self.gregorian_date.notation("tr") == "Miladi"
 
+    def test_fromjulian(self):
+        gregorian = Gregorian.fromjulian(2447961)
+        assert isinstance(gregorian, Gregorian)
+        assert gregorian == self.gregorian_date
+
+    def test_fromrjd(self):
+        gregorian = Gregorian.fromrjd(47961)
+        assert isinstance(gregorian, Gregorian)
+        assert gregorian == self.gregorian_date
+
     def test_to_julian(self):
         assert self.gregorian_date.to_julian() == 2447961
 
     def test_to_hijri(self):
         assert self.gregorian_date.to_hijri().datetuple() == (1410, 8, 13)
 
+    def test_to_hijri_shares_years(self):
+        first, second = Gregorian(1990, 3, 10), Gregorian(1990, 3, 11)
+        assert first.to_hijri().year is second.to_hijri().year
+
+    def test_to_hijri_without_validation(self):
+        hijri = self.gregorian_date.to_hijri(validate=False)
+        assert hijri.datetuple() == (1410, 8, 13)
+        assert Gregorian(*g_min).to_hijri(validate=False) == Hijri(*h_min)
+        assert Gregorian(*g_max).to_hijri(validate=False) == Hijri(*h_max)
+
+    @pytest.mark.parametrize(
+        ("datetuple", "expected"),
+        [((2077, 11, 17), (1501, 1, 1)), ((1924, 7, 31), (1342, 12, -55991))],
+    )
+    def test_to_hijri_out_of_range_without_validation(self, datetuple, expected):
+        hijri = Gregorian(*datetuple).to_hijri(validate=False)
+        assert hijri.datetuple() == expected
+
     @pytest.mark.parametrize(
         "datetuple",
         [(1990, 3, 10), (1924, 8, 1), (2077, 11, 16)],
@@ -0,0 +1,61 @@
+import csv
+import io
+
+from datetime import date
+
+import pytest
+
+from hijridate import Gregorian, dimension
+from hijridate.ummalqura import GREGORIAN_RANGE
+
+g_min, g_max = GREGORIAN_RANGE
+total_days = date(*g_max).toordinal() - date(*g_min).toordinal() + 1
+
+
+def test_iter_rows_full_range():
+    rows = list(dimension.iter_rows())
+    assert len(rows) == total_days
+    for row in rows[::97] + rows[-1:]:
+        gregorian = Gregorian.fromdate(row.gregorian_date)
+        hijri = gregorian.to_hijri()
+        assert (row.hijri_year, row.hijri_month, row.hijri_day) == hijri.datetuple()
+        assert row.weekday == hijri.isoweekday()
+        assert row.hijri_month_length == hijri.month_length()
+        assert row.hijri_year_length == hijri.year_length()
+        assert row.gregorian_month_name == gregorian.month_name()
+        assert row.hijri_month_name == hijri.month_name()
+        assert row.day_name == hijri.day_name()
+
+
+def test_iter_rows_first_row():
+    row = next(dimension.iter_rows("ar"))
+    assert row == dimension.DimensionRow(
+        date(1924, 8, 1), 1343, 1, 1, 5, 30, 356, 31, "محرم", "أغسطس", "الجمعة"
+    )
+
+
+def test_write_csv():
+    file = io.StringIO(newline="")
+    dimension.write_csv(file)
+    file.seek(0)
+    rows = list(csv.reader(file))
+    assert len(rows) == total_days + 1
+    assert tuple(rows[0]) == dimension.DimensionRow._fields
+    assert rows[1][:5] == ["1924-08-01", "1343", "1", "1", "5"]
+
+
+class TestArrowExport:
+    pa = pytest.importorskip("pyarrow")
+
+    def test_to_arrow(self):
+        table = dimension.to_arrow("tr")
+        assert table.num_rows == total_days
+        assert table.column_names == list(dimension.DimensionRow._fields)
+        assert table.schema.field("gregorian_date").type == self.pa.date32()
+        assert table.slice(0, 1).to_pylist()[0]["hijri_month_name"] == "Muharrem"
+
+    def test_write_parquet(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = str(tmp_path / "calendar.parquet")
+        dimension.write_parquet(path)
+        assert pq.read_table(path).equals(dimension.to_arrow())
@@ -0,0 +1,70 @@
+import pytest
+
+from hijridate import Hijri, formatting
+
+hijri = Hijri(1403, 2, 17)
+
+
+class TestCompileFormat:
+    @pytest.mark.parametrize(
+        ("fmt", "expected"),
+        [
+            ("%Y", "1403"),
+            ("%m", "02"),
+            ("%d", "17"),
+            ("%B", "Safar"),
+            ("%A", "Thursday"),
+            ("%a", "Thu"),
+            ("%E", "AH"),
+            ("%%", "%"),
+            ("", ""),
+            ("%A, %d %B %Y %E", "Thursday, 17 Safar 1403 AH"),
+            ("%Y%m%d", "14030217"),
+        ],
+    )
+    def test_directives(self, fmt, expected):
+        assert formatting.compile_format(fmt)(hijri) == expected
+
+    @pytest.mark.parametrize(
+        ("language", "expected"),
+        [
+            ("en", "Thu 17 Safar 1403 AH"),
+            ("ar", "الخميس 17 صفر 1403 هـ"),
+            ("bn", "বৃহস্পতি 17 সফর 1403 হিজরি"),
+            ("tr", "Per 17 Safer 1403 Hicri"),
+        ],
+    )
+    def test_languages(self, language, expected):
+        assert formatting.compile_format("%a %d %B %Y %E", language)(hijri) == expected
+
+    @pytest.mark.parametrize(
+        "fmt", ["{hijri}", '"quoted"', "back\\slash", "line\nbreak", "{{}}", "%%d"]
+    )
+    def test_literal_text(self, fmt):
+        expected = fmt.replace("%%", "%")
+        assert formatting.compile_format(fmt)(hijri) == expected
+        assert (
+            formatting.compile_format(f"{fmt}%d{fmt}")(hijri)
+            == f"{expected}17{expected}"
+        )
+
+    def test_padding(self):
+        assert formatting.compile_format("%Y-%m-%d")(Hijri(1343, 1, 1)) == "1343-01-01"
+
+    def test_cached(self):
+        assert formatting.compile_format("%d %B") is formatting.compile_format("%d %B")
+
+    @pytest.mark.parametrize(
+        ("fmt", "err_message"),
+        [
+            ("%q", "unsupported format directive, got '%q'"),
+            ("%d %", "stray '%' at end of format, got '%d %'"),
+        ],
+    )
+    def test_invalid_format(self, fmt, err_message):
+        with pytest.raises(ValueError, match=err_message):
+            formatting.compile_format(fmt)
+
+    def test_unsupported_language(self):
+        with pytest.raises(ValueError, match="unsupported language: xy"):
+            formatting.compile_format("%B", "xy")
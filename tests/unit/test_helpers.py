@@ -1,3 +1,6 @@
+import threading
+import time
+
 from hijridate import helpers
 
 
@@ -15,3 +18,42 @@ def test_julian_to_reduced_julian():
 
 def test_reduced_julian_to_julian():
     assert helpers.rjd_to_jdn(56087) == 2456087
+
+
+def test_build_once():
+    calls = []
+
+    @helpers.build_once
+    def build(value, *, scale=1):
+        calls.append(value)
+        return [value * scale]
+
+    assert build(1) is build(1)
+    assert build(2) == [2]
+    assert build(2, scale=3) == [6]
+    assert calls == [1, 2, 2]
+
+
+def test_build_once_from_threads():
+    calls = []
+    barrier = threading.Barrier(8)
+
+    @helpers.build_once
+    def build():
+        calls.append(None)
+        time.sleep(0.01)
+        return object()
+
+    def worker():
+        barrier.wait()
+        results.append(build())
+
+    results = []
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
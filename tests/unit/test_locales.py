@@ -1,3 +1,5 @@
+import threading
+
 from typing import get_args
 
 import pytest
@@ -25,6 +27,8 @@ class TestLocalesValidity:
             assert all(locale_cls.gregorian_month_names)  # not blank or None
             assert len(locale_cls.day_names) == 7
             assert all(locale_cls.day_names)  # not blank or None
+            assert len(locale_cls.abbreviated_day_names) == 7
+            assert all(locale_cls.abbreviated_day_names)  # not blank or None
             assert locale_cls.notation is not None
             assert locale_cls.gregorian_notation is not None
 
@@ -38,6 +42,25 @@ class TestLocalesValidity:
             class ExtraLocale(locales.Locale):
                 language_tag = "en"
 
+    def test_concurrent_registration(self, monkeypatch):
+        monkeypatch.setattr(locales, "_locale_map", dict(locales._locale_map))
+        errors = []
+
+        def register(tag):
+            try:
+                type("ThreadLocale", (locales.EnglishLocale,), {"language_tag": tag})
+            except LookupError as error:
+                errors.append(error)
+
+        tags = ["t1", "t2", "t3", "t4"] * 4
+        threads = [threading.Thread(target=register, args=(tag,)) for tag in tags]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(errors) == len(tags) - 4
+        assert {"t1", "t2", "t3", "t4"} <= locales._locale_map.keys()
+
 
 class TestGettingLocale:
     class CustomLocale(locales.EnglishLocale):
@@ -61,3 +84,9 @@ class TestGettingLocale:
     def test_unsupported_language(self):
         with pytest.raises(ValueError, match="unsupported language: xy"):
             locales.get_locale("xy")
+
+
+class TestLocaleNames:
+    def test_abbreviated_day_name(self):
+        assert locales.get_locale("en").abbreviated_day_name(1) == "Mon"
+        assert locales.get_locale("tr").abbreviated_day_name(7) == "Paz"
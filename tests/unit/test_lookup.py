@@ -0,0 +1,62 @@
+from bisect import bisect
+from datetime import date
+
+import pytest
+
+from hijridate import Gregorian, lookup, ummalqura
+
+g_min, g_max = ummalqura.GREGORIAN_RANGE
+
+
+@pytest.fixture
+def _lookup_enabled():
+    lookup.enable()
+    yield
+    lookup.disable()
+
+
+def test_build_table():
+    month_starts = ummalqura.MONTH_STARTS
+    table = lookup.build_table()
+    assert table.typecode == "H"
+    assert len(table) == month_starts[-1] - month_starts[0]
+    for offset, index in enumerate(table):
+        assert index == bisect(month_starts, offset + month_starts[0]) - 1
+
+
+def test_enable_and_disable():
+    assert not lookup.is_enabled()
+    assert lookup.active_table is None
+    lookup.enable()
+    table = lookup.active_table
+    assert lookup.is_enabled()
+    assert table is not None
+    lookup.disable()
+    assert not lookup.is_enabled()
+    assert lookup.active_table is None
+    lookup.enable()
+    assert lookup.active_table is table  # not rebuilt
+    lookup.disable()
+
+
+@pytest.mark.usefixtures("_lookup_enabled")
+def test_conversion_with_lookup_table():
+    for ordinal in range(date(*g_min).toordinal(), date(*g_max).toordinal() + 1):
+        gregorian = Gregorian.fromordinal(ordinal)
+        hijri = gregorian.to_hijri()
+        assert hijri.to_gregorian() == gregorian
+
+
+@pytest.mark.usefixtures("_lookup_enabled")
+@pytest.mark.parametrize("datetuple", [(1924, 7, 31), (2077, 11, 17)])
+def test_invalid_range_with_lookup_table(datetuple):
+    with pytest.raises(OverflowError):
+        Gregorian(*datetuple).to_hijri()
+
+
+@pytest.mark.usefixtures("_lookup_enabled")
+@pytest.mark.parametrize("datetuple", [(1900, 1, 1), (2077, 11, 17), (2100, 1, 1)])
+def test_out_of_range_without_validation_with_lookup_table(datetuple):
+    hijri = Gregorian(*datetuple).to_hijri(validate=False)
+    lookup.disable()
+    assert hijri == Gregorian(*datetuple).to_hijri(validate=False)
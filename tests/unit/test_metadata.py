@@ -0,0 +1,89 @@
+from datetime import date
+
+import pytest
+
+from hijridate import Hijri, metadata
+
+
+class TestMonthInfo:
+    def test_values(self):
+        info = metadata.month_info(1403, 2)
+        assert info == metadata.MonthInfo(1403, 2, 30, 723865, 1)
+        assert date.fromordinal(info.start_ordinal) == date(1982, 11, 16)
+        assert date.fromordinal(info.start_ordinal).weekday() == info.start_weekday
+
+    def test_range_ends(self):
+        assert (
+            metadata.month_info(1343, 1).start_ordinal == date(1924, 8, 1).toordinal()
+        )
+        last = metadata.month_info(1500, 12)
+        assert last.start_ordinal + last.length - 1 == date(2077, 11, 16).toordinal()
+
+    def test_all_months(self):
+        months = metadata.months()
+        assert len(months) == 1896
+        for info in months:
+            first_day = Hijri(info.year, info.month, 1)
+            assert info.length == first_day.month_length()
+            assert info.start_ordinal == first_day.to_gregorian().toordinal()
+            assert info.start_weekday == first_day.weekday()
+
+    @pytest.mark.parametrize(
+        ("year", "month", "error", "message"),
+        [
+            (1342, 1, OverflowError, "year must be in 1343-1500, got '1342'"),
+            (1501, 1, OverflowError, "year must be in 1343-1500, got '1501'"),
+            (1403, 0, ValueError, "month must be in 1-12, got '0'"),
+            (1403, 13, ValueError, "month must be in 1-12, got '13'"),
+        ],
+    )
+    def test_invalid_month(self, year, month, error, message):
+        with pytest.raises(error, match=message):
+            metadata.month_info(year, month)
+
+
+class TestMonthLength:
+    def test_values(self):
+        assert metadata.month_length(1403, 2) == 30
+        assert metadata.month_length(1500, 12) == metadata.month_info(1500, 12).length
+        for info in metadata.months():
+            assert metadata.month_length(info.year, info.month) == info.length
+
+    @pytest.mark.parametrize(
+        ("year", "month", "error", "message"),
+        [
+            (1342, 1, OverflowError, "year must be in 1343-1500, got '1342'"),
+            (1403, 13, ValueError, "month must be in 1-12, got '13'"),
+        ],
+    )
+    def test_invalid_month(self, year, month, error, message):
+        with pytest.raises(error, match=message):
+            metadata.month_length(year, month)
+
+
+class TestYearInfo:
+    def test_values(self):
+        info = metadata.year_info(1403)
+        assert info.length == 354
+        assert info.start_ordinal == metadata.month_info(1403, 1).start_ordinal
+        assert info.start_weekday == metadata.month_info(1403, 1).start_weekday
+        assert len(info.months) == 12
+        assert sum(m.length for m in info.months) == info.length
+
+    def test_all_years(self):
+        years = metadata.years()
+        assert [y.year for y in years] == list(range(1343, 1501))
+        for info in years:
+            assert info.length == Hijri(info.year, 1, 1).year_length()
+        assert all(353 <= y.length <= 356 for y in years)
+
+    def test_read_only(self):
+        info = metadata.year_info(1403)
+        with pytest.raises(AttributeError):
+            info.length = 355
+        assert metadata.years() is metadata.years()
+        assert metadata.months()[0] is metadata.years()[0].months[0]
+
+    def test_invalid_year(self):
+        with pytest.raises(OverflowError, match="year must be in 1343-1500"):
+            metadata.year_info(1342)
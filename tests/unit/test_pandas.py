@@ -0,0 +1,208 @@
+import operator
+
+from datetime import date
+
+import pytest
+
+from hijridate import Hijri
+
+pd = pytest.importorskip("pandas")
+hijri_pandas = pytest.importorskip("hijridate.pandas")
+
+
+@pytest.fixture
+def datetimes():
+    return pd.Series(
+        pd.to_datetime(["1990-03-10", pd.NA, "1982-12-02 13:45"], format="ISO8601"),
+        index=["a", "b", "c"],
+        name="dates",
+    )
+
+
+class TestHijriArray:
+    def test_from_sequence(self):
+        array = pd.array([Hijri(1410, 8, 13), None], dtype="hijri")
+        assert isinstance(array, hijri_pandas.HijriArray)
+        assert array[0] == Hijri(1410, 8, 13)
+        assert array[1] is pd.NA
+        assert array.ordinals().tolist() == [726536, array.ordinals()[1]]
+        assert array.nbytes == 8
+
+    def test_series_operations(self):
+        series = pd.Series(
+            [Hijri(1410, 8, 13), Hijri(1403, 2, 17), pd.NA, Hijri(1410, 8, 13)],
+            dtype="hijri",
+        )
+        assert series.dtype == hijri_pandas.HijriDtype()
+        assert series.isna().tolist() == [False, False, True, False]
+        assert series.sort_values().tolist()[:3] == [
+            Hijri(1403, 2, 17),
+            Hijri(1410, 8, 13),
+            Hijri(1410, 8, 13),
+        ]
+        assert series.nunique() == 2
+        codes, uniques = pd.factorize(series)
+        assert codes.tolist() == [0, 1, -1, 0]
+        assert uniques.tolist() == [Hijri(1410, 8, 13), Hijri(1403, 2, 17)]
+        assert series.iloc[[1, 0]].tolist() == [Hijri(1403, 2, 17), Hijri(1410, 8, 13)]
+        assert series.copy().equals(series)
+        assert len(pd.concat([series, series])) == 8
+
+    def test_equality(self):
+        array = pd.array([Hijri(1410, 8, 13), None], dtype="hijri")
+        assert (array == Hijri(1410, 8, 13)).tolist() == [True, False]
+        assert (array == array.copy()).tolist() == [True, False]
+        assert (array == "1410-08-13").tolist() == [False, False]
+        series = pd.Series(array)
+        assert (series == Hijri(1410, 8, 13)).tolist() == [True, False]
+        assert (array == series).tolist() == [True, False]
+
+    @pytest.mark.parametrize(
+        ("op", "expected"),
+        [
+            (operator.eq, [False, True, False, False]),
+            (operator.ne, [True, False, True, True]),
+            (operator.lt, [True, False, False, False]),
+            (operator.le, [True, True, False, False]),
+            (operator.gt, [False, False, True, False]),
+            (operator.ge, [False, True, True, False]),
+        ],
+    )
+    def test_comparison(self, op, expected):
+        dates = [Hijri(1403, 2, 17), Hijri(1410, 8, 13), Hijri(1445, 1, 1), None]
+        array = pd.array(dates, dtype="hijri")
+        assert op(array, Hijri(1410, 8, 13)).tolist() == expected
+        other = pd.array([Hijri(1410, 8, 13)] * 3 + [None], dtype="hijri")
+        assert op(array, other).tolist() == expected
+        assert op(pd.Series(array), Hijri(1410, 8, 13)).tolist() == expected
+        assert op(other[:1], array[3:]).tolist() == [op is operator.ne]
+
+    def test_ordering_with_unsupported_type(self):
+        array = pd.array([Hijri(1410, 8, 13)], dtype="hijri")
+        assert (array != "1410-08-13").tolist() == [True]
+        with pytest.raises(TypeError):
+            _ = array < "1410-08-13"
+
+    def test_take_with_fill(self):
+        array = pd.array([Hijri(1410, 8, 13)], dtype="hijri")
+        result = array.take([0, -1], allow_fill=True)
+        assert result[1] is pd.NA
+        result = array.take([0, -1], allow_fill=True, fill_value=Hijri(1403, 2, 17))
+        assert result[1] == Hijri(1403, 2, 17)
+
+    def test_reindex(self):
+        series = pd.Series([Hijri(1410, 8, 13)], dtype="hijri")
+        assert series.reindex([0, 1]).isna().tolist() == [False, True]
+
+    def test_setitem(self):
+        series = pd.Series([Hijri(1410, 8, 13), None, None], dtype="hijri")
+        series[1] = Hijri(1403, 2, 17)
+        assert series.tolist() == [Hijri(1410, 8, 13), Hijri(1403, 2, 17), pd.NA]
+        series[[0, 2]] = [pd.NA, Hijri(1445, 1, 1)]
+        assert series.tolist() == [pd.NA, Hijri(1403, 2, 17), Hijri(1445, 1, 1)]
+        series[:] = pd.array([Hijri(1400, 1, 1)] * 3, dtype="hijri")
+        assert series.tolist() == [Hijri(1400, 1, 1)] * 3
+
+    def test_setitem_invalid_value(self):
+        array = pd.array([Hijri(1410, 8, 13)], dtype="hijri")
+        with pytest.raises(TypeError, match="value must be a Hijri object or missing"):
+            array[0] = "1410-08-13"
+
+    def test_fillna(self):
+        series = pd.Series([Hijri(1410, 8, 13), None], dtype="hijri")
+        result = series.fillna(Hijri(1403, 2, 17))
+        assert result.tolist() == [Hijri(1410, 8, 13), Hijri(1403, 2, 17)]
+        assert series[1] is pd.NA
+
+    def test_min_max(self):
+        series = pd.Series(
+            [Hijri(1410, 8, 13), None, Hijri(1403, 2, 17)], dtype="hijri"
+        )
+        assert series.min() == Hijri(1403, 2, 17)
+        assert series.max() == Hijri(1410, 8, 13)
+        assert series.min(skipna=False) is pd.NA
+        assert pd.Series([None], dtype="hijri").max() is pd.NA
+        assert pd.DataFrame({"date": series}).max().tolist() == [Hijri(1410, 8, 13)]
+
+    def test_unsupported_reduction(self):
+        series = pd.Series([Hijri(1410, 8, 13)], dtype="hijri")
+        with pytest.raises(TypeError, match="does not support operation 'sum'"):
+            series.sum()
+
+    def test_from_gregorian_timezone(self):
+        dates = pd.to_datetime(["1990-03-10 23:30"]).tz_localize("Asia/Riyadh")
+        array = hijri_pandas.HijriArray.from_gregorian(dates)
+        assert array[0] == Hijri(1410, 8, 13)
+
+    def test_from_gregorian_out_of_range(self):
+        with pytest.raises(OverflowError):
+            hijri_pandas.HijriArray.from_gregorian(pd.to_datetime(["1924-07-31"]))
+
+    def test_from_gregorian_all_missing(self):
+        array = hijri_pandas.HijriArray.from_gregorian(pd.to_datetime([None]))
+        assert array.isna().tolist() == [True]
+
+
+class TestHijriAccessor:
+    def test_fields(self, datetimes):
+        assert datetimes.hijri.year.tolist() == [1410, pd.NA, 1403]
+        assert datetimes.hijri.month.tolist() == [8, pd.NA, 2]
+        assert datetimes.hijri.day.tolist() == [13, pd.NA, 17]
+        assert datetimes.hijri.year.index.tolist() == ["a", "b", "c"]
+        assert datetimes.hijri.year.name == "dates"
+
+    def test_to_hijri_and_back(self, datetimes):
+        hijri = datetimes.hijri.to_hijri()
+        assert hijri.dtype == "hijri"
+        assert hijri.tolist() == [Hijri(1410, 8, 13), pd.NA, Hijri(1403, 2, 17)]
+        gregorian = hijri.hijri.to_gregorian()
+        assert gregorian.tolist()[0] == pd.Timestamp(date(1990, 3, 10))
+        assert gregorian.isna().tolist() == [False, True, False]
+
+    def test_lengths(self, datetimes):
+        assert datetimes.hijri.month_length().tolist() == [29, pd.NA, 30]
+        assert datetimes.hijri.year_length().tolist() == [355, pd.NA, 354]
+
+    def test_weekdays(self, datetimes):
+        assert datetimes.hijri.weekday().tolist() == [5, pd.NA, 3]
+        assert datetimes.hijri.isoweekday().tolist() == [6, pd.NA, 4]
+
+    def test_names(self, datetimes):
+        assert datetimes.hijri.month_name().tolist() == ["Sha'ban", pd.NA, "Safar"]
+        assert datetimes.hijri.month_name("ar").tolist()[2] == "صفر"
+        assert datetimes.hijri.day_name().tolist() == ["Saturday", pd.NA, "Thursday"]
+        assert datetimes.hijri.day_name("tr").tolist()[0] == "Cumartesi"
+
+    def test_formatting(self, datetimes):
+        assert datetimes.hijri.isoformat().tolist() == [
+            "1410-08-13",
+            pd.NA,
+            "1403-02-17",
+        ]
+        assert datetimes.hijri.dmyformat().tolist()[0] == "13/08/1410"
+        assert datetimes.hijri.dmyformat(".", padding=False).tolist()[2] == "17.2.1403"
+        dates = pd.Series(pd.to_datetime(["2006-02-09", "2077-10-01"]))
+        assert dates.hijri.dmyformat(" - ", padding=False).tolist() == [
+            "10 - 1 - 1427",
+            "14 - 11 - 1500",
+        ]
+        assert dates[:0].hijri.isoformat().tolist() == []
+
+    def test_matches_scalar_conversion(self):
+        dates = pd.Series(pd.date_range("1924-08-01", "2077-11-16", freq="13D"))
+        expected = [Hijri.fromisoformat(h) for h in dates.hijri.isoformat()]
+        hijri = dates.hijri
+        assert [
+            Hijri(y, m, d)
+            for y, m, d in zip(hijri.year, hijri.month, hijri.day, strict=True)
+        ] == expected
+        for index in range(0, len(dates), 211):
+            gregorian_date = dates[index].date()
+            result = Hijri(*[int(x) for x in expected[index].datetuple()])
+            assert result.to_gregorian() == gregorian_date
+            assert hijri.month_length()[index] == result.month_length()
+            assert hijri.year_length()[index] == result.year_length()
+
+    def test_unsupported_dtype(self):
+        with pytest.raises(AttributeError, match=r"can only use \.hijri accessor"):
+            _ = pd.Series([1, 2]).hijri
@@ -0,0 +1,104 @@
+import datetime
+import operator
+import os
+
+from array import array
+
+import pytest
+
+from hijridate import Gregorian, Hijri, lookup, parallel
+
+
+class TestGregorianToHijri:
+    def test_conversion(self):
+        start = datetime.date(1924, 8, 1).toordinal()
+        dates = [datetime.date.fromordinal(start + i * 37) for i in range(1500)]
+        result = parallel.gregorian_to_hijri(iter(dates), chunk_size=100, max_workers=2)
+        assert list(result) == [
+            Gregorian.fromordinal(d.toordinal()).to_hijri() for d in dates
+        ]
+
+    def test_range_ends(self):
+        dates = [Gregorian(1924, 8, 1), datetime.date(2077, 11, 16)]
+        result = list(parallel.gregorian_to_hijri(dates, max_workers=1))
+        assert result == [Hijri(1343, 1, 1), Hijri(1500, 12, 30)]
+
+    def test_empty_input(self):
+        assert list(parallel.gregorian_to_hijri([], max_workers=1)) == []
+
+    def test_out_of_range(self):
+        dates = [datetime.date(1982, 12, 2), datetime.date(2077, 11, 17)]
+        result = parallel.gregorian_to_hijri(dates, max_workers=1)
+        with pytest.raises(OverflowError, match="got '2077-11-17'"):
+            list(result)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"chunk_size": 0}, "chunk_size must be a positive integer, got '0'"),
+            ({"max_workers": 0}, "max_workers must be a positive integer, got '0'"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            parallel.gregorian_to_hijri([], **kwargs)
+
+    @pytest.mark.parametrize("unit", ["D", "s"])
+    def test_array(self, unit):
+        np = pytest.importorskip("numpy")
+        dates = np.arange("1924-08-01", "2077-11-17", 37, dtype="datetime64[D]")
+        result = parallel.gregorian_to_hijri(
+            dates.astype(f"datetime64[{unit}]"), chunk_size=100, max_workers=2
+        )
+        hijri = [Gregorian.fromisoformat(str(d)).to_hijri() for d in dates]
+        assert result.year.tolist() == [h.year for h in hijri]
+        assert result.month.tolist() == [h.month for h in hijri]
+        assert result.day.tolist() == [h.day for h in hijri]
+
+    def test_ordinal_array(self):
+        np = pytest.importorskip("numpy")
+        ordinals = np.array([datetime.date(1982, 12, 2).toordinal()])
+        year, month, day = parallel.gregorian_to_hijri(ordinals, max_workers=1)
+        assert (year.tolist(), month.tolist(), day.tolist()) == ([1403], [2], [17])
+
+    def test_empty_array(self):
+        np = pytest.importorskip("numpy")
+        dates = np.array([], dtype="datetime64[D]")
+        result = parallel.gregorian_to_hijri(dates, max_workers=1)
+        assert [len(c) for c in result] == [0, 0, 0]
+
+    def test_array_out_of_range(self):
+        np = pytest.importorskip("numpy")
+        dates = np.array(["1982-12-02", "2077-11-17"], dtype="datetime64[D]")
+        with pytest.raises(OverflowError, match="got '2077-11-17'"):
+            parallel.gregorian_to_hijri(dates, max_workers=1)
+
+    def test_unsupported_array(self):
+        np = pytest.importorskip("numpy")
+        with pytest.raises(TypeError, match="unsupported array type: float64"):
+            parallel.gregorian_to_hijri(np.array([1.5]), max_workers=1)
+
+    def test_default_max_workers(self):
+        assert parallel._get_max_workers(None) == (os.cpu_count() or 1)
+
+
+class TestOrdinalsToKeys:
+    def test_conversion(self):
+        ordinals = array("l", [datetime.date(1982, 12, 2).toordinal()])
+        keys = parallel._ordinals_to_keys(ordinals)
+        assert list(keys) == [(1403 << 9) | (2 << 5) | 17]
+
+    def test_out_of_range(self):
+        ordinals = array("l", [datetime.date(1924, 7, 31).toordinal()])
+        with pytest.raises(OverflowError, match="got '1924-07-31'"):
+            parallel._ordinals_to_keys(ordinals)
+
+
+class TestImap:
+    @pytest.mark.parametrize(
+        ("initializer", "enabled"), [(None, False), (lookup.enable, True)]
+    )
+    def test_initializer(self, initializer, enabled):
+        call = operator.methodcaller("__call__")
+        results = parallel._imap(call, [lookup.is_enabled], 1, initializer=initializer)
+        assert list(results) == [enabled]
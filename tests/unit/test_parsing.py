@@ -0,0 +1,185 @@
+import pytest
+
+from hijridate import Hijri, parsing
+from hijridate.ranges import hijri_range
+from hijridate.ummalqura import HIJRI_RANGE
+
+h_min, h_max = HIJRI_RANGE
+
+
+class TestParseIsoformat:
+    def test_full_range(self):
+        dates = list(hijri_range(Hijri(*h_min), Hijri(*h_max)))
+        result = parsing.parse_isoformat(d.isoformat() for d in dates)
+        assert result.rejected == []
+        assert result.dates() == dates
+
+    def test_columns(self):
+        result = parsing.parse_isoformat(["1410-08-13", "1403-02-17"])
+        assert result.year.tolist() == [1410, 1403]
+        assert result.month.tolist() == [8, 2]
+        assert result.day.tolist() == [13, 17]
+
+    def test_string(self):
+        assert parsing.parse_isoformat("1445-01-01").dates() == [Hijri(1445, 1, 1)]
+        result = parsing.parse_isoformat("1410-08-13\n1403-13-01\n")
+        assert result.dates() == [Hijri(1410, 8, 13)]
+        assert [r.value for r in result.rejected] == ["1403-13-01"]
+
+    def test_bytes_buffer(self):
+        result = parsing.parse_isoformat(b"1410-08-13\r\n1403-02-17\n 1403-02-18 \n")
+        assert result.dates() == [
+            Hijri(1410, 8, 13),
+            Hijri(1403, 2, 17),
+            Hijri(1403, 2, 18),
+        ]
+        assert result.rejected == []
+
+    @pytest.mark.parametrize("dtype", ["U", "S"])
+    def test_numpy_array(self, dtype):
+        np = pytest.importorskip("numpy")
+        data = np.array(["1410-08-13", " 1403-02-17", "1410-08-30"], dtype=dtype)
+        result = parsing.parse_isoformat(data)
+        assert result.dates() == [Hijri(1410, 8, 13), Hijri(1403, 2, 17)]
+        assert result.rejected == [
+            parsing.Rejected(2, "1410-08-30", "day must be in 1-29 for month, got '30'")
+        ]
+
+    @pytest.mark.parametrize(
+        ("value", "reason"),
+        [
+            ("1342-12-29", "year must be in 1343-1500, got '1342'"),
+            ("1410-13-01", "month must be in 1-12, got '13'"),
+            ("1410-08-30", "day must be in 1-29 for month, got '30'"),
+            ("1410-08-00", "day must be in 1-29 for month, got '0'"),
+            ("1410-8-13", "invalid isoformat string: '1410-8-13'"),
+            ("1410/08/13", "invalid isoformat string: '1410/08/13'"),
+            ("1410-08-13-01", "invalid isoformat string: '1410-08-13-01'"),
+            ("1410-08-+1", "invalid isoformat string: '1410-08-+1'"),
+            ("", "invalid isoformat string: ''"),
+        ],
+    )
+    def test_rejected_rows(self, value, reason):
+        result = parsing.parse_isoformat(["1410-08-13", value, "1403-02-17"])
+        assert result.rejected == [parsing.Rejected(1, value, reason)]
+        assert result.dates() == [Hijri(1410, 8, 13), Hijri(1403, 2, 17)]
+
+
+class TestCompileFormat:
+    @pytest.mark.parametrize(
+        ("fmt", "text", "expected"),
+        [
+            ("%Y-%m-%d", "1403-02-17", (1403, 2, 17)),
+            ("%d/%m/%Y", "7/2/1403", (1403, 2, 7)),
+            ("%d  %m %Y", "07 02\t\t1403", (1403, 2, 7)),
+            ("%Y%m%d", "14030217", (1403, 2, 17)),
+            ("%d %B %Y", "17 Safar 1403", (1403, 2, 17)),
+            ("%d %B %Y", "17 safar 1403", (1403, 2, 17)),
+            ("%d %B %Y", "17  Rabi' al-Awwal\t1403", (1403, 3, 17)),
+            ("%A, %d %B %Y %E", "Thursday, 17 Safar 1403 AH", (1403, 2, 17)),
+            ("%a %d %B %Y", "Thu 17 Safar 1403", (1403, 2, 17)),
+            ("%d %B %Y 100%%", "17 Safar 1403 100%", (1403, 2, 17)),
+        ],
+    )
+    def test_formats(self, fmt, text, expected):
+        assert parsing.compile_format(fmt)(text) == expected
+
+    @pytest.mark.parametrize(
+        ("language", "text"),
+        [
+            ("ar", "17 صفر 1403 هـ"),
+            ("ar", "١٧ صفر ١٤٠٣ هـ"),  # noqa: RUF001
+            ("bn", "১৭ সফর ১৪০৩ হিজরি"),
+            ("tr", "17 Safer 1403 Hicri"),
+        ],
+    )
+    def test_languages(self, language, text):
+        assert parsing.compile_format("%d %B %Y %E", language)(text) == (1403, 2, 17)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "17 REBİÜLEVVEL 1403",
+            "17 rebıülevvel 1403",  # noqa: RUF001
+            "17 Rebiülevvel 1403",
+        ],
+    )
+    def test_month_names_ignoring_turkish_case(self, text):
+        assert parsing.compile_format("%d %B %Y", "tr")(text) == (1403, 3, 17)
+
+    def test_month_names_matched_by_longest_name(self):
+        parse = parsing.compile_format("%d %B %Y", "ar")
+        assert parse("17 ربيع الأول 1403") == (1403, 3, 17)
+        assert parse("17 ربيع الثاني 1403") == (1403, 4, 17)
+
+    @pytest.mark.parametrize(
+        "text", ["", "17 Safar", "17 Safar 1403 AH", "17 Unknown 1403", "1403-02-17"]
+    )
+    def test_not_matching(self, text):
+        assert parsing.compile_format("%d %B %Y")(text) is None
+
+    def test_not_matching_numbers(self):
+        assert parsing.compile_format("%Y-%m-%d")("1403-2") is None
+
+    def test_not_validated(self):
+        assert parsing.compile_format("%Y-%m-%d")("1600-13-40") == (1600, 13, 40)
+
+    def test_cached(self):
+        assert parsing.compile_format("%d %B %Y") is parsing.compile_format("%d %B %Y")
+
+    @pytest.mark.parametrize(
+        ("fmt", "err_message"),
+        [
+            ("%d %q %Y", "unsupported format directive, got '%q'"),
+            ("%d %m %Y %", "stray '%' at end of format, got '%d %m %Y %'"),
+            ("%d %m %Y %d", "duplicated format directive, got '%d'"),
+            ("%d %m %B %Y", "duplicated format directive, got '%B'"),
+            ("%d %m", "format must have year, month and day directives"),
+            ("%B %Y", "format must have year, month and day directives"),
+            ("%d %Y", "format must have year, month and day directives"),
+        ],
+    )
+    def test_invalid_format(self, fmt, err_message):
+        with pytest.raises(ValueError, match=err_message):
+            parsing.compile_format(fmt)
+
+    def test_unsupported_language(self):
+        with pytest.raises(ValueError, match="unsupported language: xy"):
+            parsing.compile_format("%d %B %Y", "xy")
+
+
+class TestParseFormat:
+    def test_full_range(self):
+        dates = list(hijri_range(Hijri(*h_min), Hijri(*h_max)))
+        texts = [f"{d.day} {d.month_name('ar')} {d.year}" for d in dates]
+        result = parsing.parse_format(texts, "%d %B %Y", "ar")
+        assert result.rejected == []
+        assert result.dates() == dates
+
+    def test_rejected(self):
+        data = [" 17 Safar 1403 ", "17 Safar", "30 Ramadan 1342", "30 Muharram 1404"]
+        result = parsing.parse_format(data, "%d %B %Y")
+        assert result.dates() == [Hijri(1403, 2, 17)]
+        assert result.rejected == [
+            parsing.Rejected(
+                1,
+                "17 Safar",
+                "date string does not match format '%d %B %Y': '17 Safar'",
+            ),
+            parsing.Rejected(
+                2, "30 Ramadan 1342", "year must be in 1343-1500, got '1342'"
+            ),
+            parsing.Rejected(
+                3, "30 Muharram 1404", "day must be in 1-29 for month, got '30'"
+            ),
+        ]
+
+    def test_invalid_month_number(self):
+        result = parsing.parse_format(["1403-13-01"], "%Y-%m-%d")
+        assert result.rejected[0].reason == "month must be in 1-12, got '13'"
+
+    def test_turkish_month_names(self):
+        data = ["17 REBİÜLEVVEL 1403", "15 şaban 1403", "17 Unknown 1403"]
+        result = parsing.parse_format(data, "%d %B %Y", "tr")
+        assert result.dates() == [Hijri(1403, 3, 17), Hijri(1403, 8, 15)]
+        assert [r.row for r in result.rejected] == [2]
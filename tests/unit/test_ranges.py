@@ -0,0 +1,131 @@
+import itertools
+
+from datetime import date, timedelta
+
+import pytest
+
+from hijridate import Gregorian, Hijri
+from hijridate.ranges import gregorian_range, hijri_range
+from hijridate.ummalqura import HIJRI_RANGE
+
+h_min, h_max = HIJRI_RANGE
+
+
+class TestHijriRange:
+    def test_days_full_range(self):
+        start, stop = Hijri(*h_min), Hijri(*h_max)
+        expected = start
+        count = 0
+        for hijri in hijri_range(start, stop):
+            assert hijri == expected
+            expected += timedelta(days=1)
+            count += 1
+        assert expected == stop
+        assert count == (stop - start).days
+
+    def test_days_step(self):
+        result = list(hijri_range(Hijri(1410, 8, 20), Hijri(1410, 9, 10), 7))
+        assert result == [
+            Hijri(1410, 8, 20),
+            Hijri(1410, 8, 27),
+            Hijri(1410, 9, 5),
+        ]
+
+    def test_days_negative_step(self):
+        result = list(hijri_range(Hijri(1410, 9, 2), Hijri(1410, 8, 26), -2))
+        assert result == [Hijri(1410, 9, 2), Hijri(1410, 8, 29), Hijri(1410, 8, 27)]
+
+    def test_days_empty(self):
+        assert list(hijri_range(Hijri(1410, 9, 2), Hijri(1410, 9, 2))) == []
+        assert list(hijri_range(Hijri(1410, 9, 2), Hijri(1410, 9, 1))) == []
+
+    def test_months(self):
+        result = list(
+            hijri_range(Hijri(1410, 7, 30), Hijri(1410, 11, 1), unit="months")
+        )
+        assert result == [
+            Hijri(1410, 7, 30),
+            Hijri(1410, 8, 29),
+            Hijri(1410, 9, 30),
+            Hijri(1410, 10, 29),
+        ]
+
+    def test_months_negative_step(self):
+        result = list(
+            hijri_range(Hijri(1410, 3, 15), Hijri(1409, 10, 1), -2, unit="months")
+        )
+        assert result == [Hijri(1410, 3, 15), Hijri(1410, 1, 15), Hijri(1409, 11, 15)]
+
+    def test_months_until_end_of_range(self):
+        result = list(
+            hijri_range(Hijri(1500, 10, 1), Hijri(1500, 12, 30), unit="months")
+        )
+        assert result == [Hijri(1500, 10, 1), Hijri(1500, 11, 1), Hijri(1500, 12, 1)]
+        result = list(
+            hijri_range(Hijri(1343, 2, 1), Hijri(1343, 1, 1), -1, unit="months")
+        )
+        assert result == [Hijri(1343, 2, 1)]
+
+    def test_years(self):
+        result = list(
+            hijri_range(
+                Hijri(1498, 1, 1), Hijri(1600, 1, 1, validate=False), unit="years"
+            )
+        )
+        assert result == [Hijri(1498, 1, 1), Hijri(1499, 1, 1), Hijri(1500, 1, 1)]
+
+    def test_lazy(self):
+        result = hijri_range(Hijri(*h_min), Hijri(*h_max))
+        assert list(itertools.islice(result, 2)) == [
+            Hijri(1343, 1, 1),
+            Hijri(1343, 1, 2),
+        ]
+
+    def test_invalid_step(self):
+        with pytest.raises(ValueError, match="step must not be zero"):
+            hijri_range(Hijri(1410, 1, 1), Hijri(1411, 1, 1), 0)
+
+    def test_invalid_unit(self):
+        with pytest.raises(ValueError, match="unit must be one of"):
+            hijri_range(Hijri(1410, 1, 1), Hijri(1411, 1, 1), unit="weeks")
+
+
+class TestGregorianRange:
+    def test_days(self):
+        result = list(gregorian_range(date(1990, 3, 10), date(1990, 3, 20), 4))
+        assert result == [
+            Gregorian(1990, 3, 10),
+            Gregorian(1990, 3, 14),
+            Gregorian(1990, 3, 18),
+        ]
+        assert all(isinstance(d, Gregorian) for d in result)
+
+    def test_months(self):
+        result = list(
+            gregorian_range(date(2024, 1, 31), date(2024, 5, 1), unit="months")
+        )
+        assert result == [
+            Gregorian(2024, 1, 31),
+            Gregorian(2024, 2, 29),
+            Gregorian(2024, 3, 31),
+            Gregorian(2024, 4, 30),
+        ]
+
+    def test_years_negative_step(self):
+        result = list(
+            gregorian_range(date(2024, 2, 29), date(2021, 1, 1), -1, unit="years")
+        )
+        assert result == [
+            Gregorian(2024, 2, 29),
+            Gregorian(2023, 2, 28),
+            Gregorian(2022, 2, 28),
+            Gregorian(2021, 2, 28),
+        ]
+
+    def test_months_until_end_of_supported_dates(self):
+        result = list(gregorian_range(date(9999, 11, 1), date.max, unit="months"))
+        assert result == [Gregorian(9999, 11, 1), Gregorian(9999, 12, 1)]
+
+    def test_invalid_step(self):
+        with pytest.raises(ValueError, match="step must not be zero"):
+            gregorian_range(date(1990, 1, 1), date(1991, 1, 1), 0)
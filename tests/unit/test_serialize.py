@@ -0,0 +1,48 @@
+import pytest
+
+from hijridate import serialize
+from hijridate.convert import Hijri
+from hijridate.ranges import hijri_range
+from hijridate.ummalqura import HIJRI_RANGE
+
+h_min, h_max = HIJRI_RANGE
+
+
+class TestEncode:
+    def test_encode(self):
+        dates = [Hijri(1343, 1, 1), Hijri(1343, 1, 2), Hijri(1410, 8, 13)]
+        data = serialize.encode(dates)
+        assert len(data) == 6
+        assert data == b"".join(d.tobytes() for d in dates)
+
+    def test_encode_empty(self):
+        assert serialize.encode([]) == b""
+
+    def test_encode_invalid_date(self):
+        with pytest.raises(ValueError, match="day must be in 1-29 for month"):
+            serialize.encode([Hijri(1410, 8, 30, validate=False)])
+
+
+class TestDecode:
+    def test_round_trip_full_range(self):
+        dates = [*hijri_range(Hijri(*h_min), Hijri(*h_max)), Hijri(*h_max)]
+        data = serialize.encode(dates)
+        assert len(data) == 2 * len(dates)
+        decoded = serialize.decode(data)
+        assert decoded == dates
+        assert [d.datetuple() for d in decoded] == [d.datetuple() for d in dates]
+
+    def test_decode_empty(self):
+        assert serialize.decode(b"") == []
+
+    def test_decode_bytes_like(self):
+        data = bytearray(Hijri(1410, 8, 13).tobytes())
+        assert serialize.decode(memoryview(data)) == [Hijri(1410, 8, 13)]
+
+    def test_decode_odd_length(self):
+        with pytest.raises(ValueError, match="multiple of 2, got 3"):
+            serialize.decode(b"\x00\x00\x00")
+
+    def test_decode_out_of_range(self):
+        with pytest.raises(OverflowError, match="date value out of range"):
+            serialize.decode(b"\x00\x00\xff\xff")
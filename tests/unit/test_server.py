@@ -0,0 +1,365 @@
+import asyncio
+import json
+import runpy
+import sys
+
+import pytest
+
+from hijridate import server
+
+
+def request(method, path, payload=None, headers=""):
+    body = b"" if payload is None else json.dumps(payload).encode()
+    head = f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n{headers}\r\n"
+    return head.encode() + body
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    headers = {}
+    while (line := await reader.readline()).strip():
+        name, _, value = line.decode().partition(":")
+        headers[name.lower()] = value.strip()
+    body = await reader.readexactly(int(headers["content-length"]))
+    return int(status_line.split()[1]), headers, json.loads(body)
+
+
+def run(test, **kwargs):
+    async def main():
+        conversion_server = server.ConversionServer(port=0, **kwargs)
+        await conversion_server.start()
+        try:
+            return await test(conversion_server)
+        finally:
+            await conversion_server.close()
+
+    return asyncio.run(main())
+
+
+def send(data, **kwargs):
+    async def test(conversion_server):
+        reader, writer = await asyncio.open_connection(
+            "127.0.0.1", conversion_server.port
+        )
+        writer.write(data)
+        await writer.drain()
+        response = await read_response(reader)
+        writer.close()
+        return response
+
+    return run(test, **kwargs)
+
+
+class TestConversionServer:
+    def test_single_date(self):
+        status, headers, payload = send(
+            request("POST", "/convert", {"date": "1982-12-02"})
+        )
+        assert status == 200
+        assert headers["content-type"] == "application/json"
+        assert payload == {"date": "1403-02-17"}
+
+    def test_dates(self):
+        body = {"dates": ["1403-02-17", "1403-02-31"], "to": "gregorian"}
+        status, _, payload = send(request("POST", "/convert?x=1", body))
+        assert status == 200
+        assert payload == {"dates": ["1982-12-02", None]}
+
+    @pytest.mark.parametrize(
+        ("to", "values", "expected"),
+        [
+            (
+                "hijri",
+                ["1982-12-02", " 2023-12-28\n", "1924-07-31", "1982-02-30"],
+                ["1403-02-17", "1445-06-15", None, None],
+            ),
+            (
+                "gregorian",
+                ["1403-02-17", "1445-06-15", "1403-02-31", "1403-2-17"],
+                ["1982-12-02", "2023-12-28", None, None],
+            ),
+        ],
+    )
+    def test_convert(self, to, values, expected):
+        async def test(conversion_server):
+            return await conversion_server.convert(values, to)
+
+        assert run(test) == expected
+
+    def test_invalid_date(self):
+        body = {"date": "1403-02-31", "to": "gregorian"}
+        status, _, payload = send(request("POST", "/convert", body))
+        assert status == 400
+        assert payload == {"error": "day must be in 1-30 for month, got '31'"}
+
+    @pytest.mark.parametrize(
+        ("body", "err_message"),
+        [
+            ([], "request must be a JSON object"),
+            (
+                {"date": "1982-12-02", "to": "julian"},
+                "to must be 'hijri' or 'gregorian'",
+            ),
+            ({"date": 1982}, "request must have a date string or a dates list"),
+            ({"dates": ["1982-12-02", 1]}, "request must have a date string"),
+        ],
+    )
+    def test_invalid_request(self, body, err_message):
+        status, headers, payload = send(request("POST", "/convert", body))
+        assert status == 400
+        assert "connection" not in headers
+        assert payload["error"].startswith(err_message)
+
+    @pytest.mark.parametrize("body", [b"{", b"[" * 100000], ids=["truncated", "nested"])
+    def test_invalid_json(self, body):
+        head = f"POST /convert HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n"
+        status, _, payload = send(head.encode() + body)
+        assert status == 400
+        assert payload["error"].startswith("invalid JSON")
+
+    @pytest.mark.parametrize(
+        ("data", "expected_status"),
+        [
+            (request("GET", "/convert"), 405),
+            (request("POST", "/metrics"), 405),
+            (request("GET", "/"), 404),
+        ],
+    )
+    def test_invalid_route(self, data, expected_status):
+        status, headers, _ = send(data)
+        assert status == expected_status
+        assert "connection" not in headers
+
+    @pytest.mark.parametrize(
+        ("data", "expected_status"),
+        [
+            (b"GET /metrics\r\n\r\n", 400),
+            (request("GET", "/metrics", headers="X: 1\r\n" * 101), 431),
+            (
+                request("POST", "/convert", headers="Transfer-Encoding: chunked\r\n"),
+                501,
+            ),
+            (b"POST /convert HTTP/1.1\r\nContent-Length: -1\r\n\r\n", 400),
+            (b"POST /convert HTTP/1.1\r\nContent-Length: 2000000\r\n\r\n", 413),
+        ],
+    )
+    def test_malformed_request(self, data, expected_status):
+        status, headers, _ = send(data)
+        assert status == expected_status
+        assert headers["connection"] == "close"
+
+    def test_keep_alive(self):
+        async def test(conversion_server):
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", conversion_server.port
+            )
+            writer.write(request("POST", "/convert", {"date": "1982-12-02"}))
+            first = await read_response(reader)
+            writer.write(request("GET", "/metrics", headers="Connection: close\r\n"))
+            second = await read_response(reader)
+            closed = await reader.read()
+            writer.close()
+            return first, second, closed
+
+        first, second, closed = run(test)
+        assert "connection" not in first[1]
+        assert second[1]["connection"] == "close"
+        assert second[2]["requests"] == 1
+        assert closed == b""
+
+    def test_expect_continue(self):
+        async def test(conversion_server):
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", conversion_server.port
+            )
+            data = request(
+                "POST", "/convert", {"date": "1982-12-02"}, "Expect: 100-continue\r\n"
+            )
+            head, _, body = data.partition(b"\r\n\r\n")
+            writer.write(head + b"\r\n\r\n")
+            interim = await reader.readuntil(b"\r\n\r\n")
+            writer.write(body)
+            response = await read_response(reader)
+            writer.close()
+            return interim, response
+
+        interim, response = run(test)
+        assert interim == b"HTTP/1.1 100 Continue\r\n\r\n"
+        assert response[2] == {"date": "1403-02-17"}
+
+    @pytest.mark.parametrize(
+        ("connection", "expected"),
+        [("", "close"), ("Connection: keep-alive\r\n", None)],
+    )
+    def test_http_1_0(self, connection, expected):
+        data = f"GET /metrics HTTP/1.0\r\n{connection}\r\n".encode()
+        _, headers, _ = send(data)
+        assert headers.get("connection") == expected
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"\r\n",
+            b"POST /convert HTTP/1.1\r\nContent-Length: 10\r\n\r\n{",
+            b"GET /" + b"x" * 70000 + b"\r\n",
+        ],
+    )
+    def test_closed_connection(self, data):
+        async def test(conversion_server):
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", conversion_server.port
+            )
+            writer.write(data)
+            writer.write_eof()
+            closed = await reader.read()
+            writer.close()
+            return closed, conversion_server.stats()
+
+        closed, stats = run(test)
+        assert closed == b""
+        assert stats.requests == 0
+
+    def test_coalescing(self):
+        async def test(conversion_server):
+            to_hijri = [
+                conversion_server.convert(["1982-12-02"], "hijri") for _ in range(10)
+            ]
+            to_gregorian = conversion_server.convert(["1403-02-17", "x"], "gregorian")
+            results = await asyncio.gather(*to_hijri, to_gregorian)
+            return results, conversion_server.stats()
+
+        results, stats = run(test, window=0.05)
+        assert results == [["1403-02-17"]] * 10 + [["1982-12-02", None]]
+        assert stats.dates == 12
+        assert stats.batches == 2
+        assert stats.mean_batch_size == 6.0
+
+    def test_max_batch(self):
+        async def test(conversion_server):
+            task = asyncio.create_task(
+                conversion_server.convert(["1982-12-02"], "hijri")
+            )
+            await asyncio.sleep(0)
+            result = await conversion_server.convert(["2023-12-28"] * 2, "hijri")
+            return await task, result, conversion_server.stats()
+
+        first, second, stats = run(test, window=60, max_batch=3)
+        assert first == ["1403-02-17"]
+        assert second == ["1445-06-15"] * 2
+        assert stats.batches == 1
+
+    def test_cancelled_request(self):
+        async def test(conversion_server):
+            task = asyncio.create_task(
+                conversion_server.convert(["1982-12-02"], "hijri")
+            )
+            await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.sleep(0)
+            conversion_server._flush()
+            return task.cancelled(), conversion_server.stats()
+
+        cancelled, stats = run(test, window=60)
+        assert cancelled
+        assert stats.dates == 1
+
+    def test_close_converts_pending_dates(self):
+        async def test(conversion_server):
+            task = asyncio.create_task(
+                conversion_server.convert(["1982-12-02"], "hijri")
+            )
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", conversion_server.port
+            )
+            writer.write(request("GET", "/metrics"))
+            await read_response(reader)
+            await asyncio.sleep(0)
+            await conversion_server.close()
+            await conversion_server.close()
+            closed = await reader.read()
+            writer.close()
+            return await task, closed
+
+        result, closed = run(test, window=60)
+        assert result == ["1403-02-17"]
+        assert closed == b""
+
+    def test_metrics(self):
+        async def test(conversion_server):
+            initial = conversion_server.stats()
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", conversion_server.port
+            )
+            writer.write(request("POST", "/convert", {"dates": ["1982-12-02"] * 3}))
+            writer.write(request("POST", "/convert", {"date": "x"}))
+            writer.write(request("GET", "/metrics"))
+            for _ in range(3):
+                *_, payload = await read_response(reader)
+            writer.close()
+            return initial, payload
+
+        initial, payload = run(test)
+        assert initial.requests == initial.dates == 0
+        assert initial.mean_batch_size == initial.mean_latency_ms == 0.0
+        assert list(payload) == list(server.ServerStats._fields)
+        assert payload["requests"] == 2
+        assert payload["errors"] == 1
+        assert payload["dates"] == 4
+        assert payload["batches"] == 2
+        assert payload["dates_per_second"] > 0
+        assert 0 < payload["mean_latency_ms"] <= payload["max_latency_ms"]
+
+    def test_serve_forever(self):
+        async def main():
+            conversion_server = server.ConversionServer(port=0)
+            task = asyncio.create_task(conversion_server.serve_forever())
+            await asyncio.sleep(0.01)
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", conversion_server.port
+            )
+            writer.write(request("POST", "/convert", {"date": "1982-12-02"}))
+            response = await read_response(reader)
+            writer.close()
+            task.cancel()
+            await conversion_server.close()
+            return response
+
+        assert asyncio.run(main())[2] == {"date": "1403-02-17"}
+
+    @pytest.mark.parametrize(
+        ("kwargs", "err_message"),
+        [
+            ({"window": -1}, "window must not be negative, got '-1'"),
+            ({"max_batch": 0}, "max_batch must be at least 1, got '0'"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, err_message):
+        with pytest.raises(ValueError, match=err_message):
+            server.ConversionServer(**kwargs)
+
+
+class TestMain:
+    def test_main(self, monkeypatch, capsys):
+        async def serve_forever(conversion_server):
+            assert conversion_server._window == 0.005
+            assert conversion_server._max_batch == 100
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(server.ConversionServer, "serve_forever", serve_forever)
+        status = server.main(["--port", "0", "--window", "5", "--max-batch", "100"])
+        _, err = capsys.readouterr()
+        assert status == 0
+        assert err.startswith("hijridate: serving on http://127.0.0.1:")
+
+    def test_run_as_module(self, monkeypatch):
+        def run_coroutine(coroutine):
+            coroutine.close()
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(asyncio, "run", run_coroutine)
+        monkeypatch.setattr("sys.argv", ["server"])
+        monkeypatch.delitem(sys.modules, "hijridate.server")
+        with pytest.raises(SystemExit) as error:
+            runpy.run_module("hijridate.server", run_name="__main__")
+        assert error.value.code == 0
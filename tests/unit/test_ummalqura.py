@@ -0,0 +1,19 @@
+from datetime import date
+
+from hijridate import helpers, ummalqura
+
+
+def test_ordinal_range():
+    min_date, max_date = ummalqura.GREGORIAN_RANGE
+    assert ummalqura.ORDINAL_RANGE == (
+        date(*min_date).toordinal(),
+        date(*max_date).toordinal(),
+    )
+
+
+def test_rjd_range():
+    month_starts = ummalqura.MONTH_STARTS
+    assert ummalqura.RJD_RANGE == (month_starts[0], month_starts[-1] - 1)
+    assert ummalqura.RJD_RANGE == tuple(
+        helpers.jdn_to_rjd(helpers.ordinal_to_jdn(o)) for o in ummalqura.ORDINAL_RANGE
+    )